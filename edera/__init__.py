@@ -5,12 +5,15 @@ from .routine import routine
 from .routine import Timer
 from .disjointset import DisjointSet
 from .flag import Flag
+from .graph import FrozenGraph
+from .graph import FrozenGraphNode
 from .graph import Graph
 from .graph import GraphNode
 from .heap import Heap
 from .invoker import Invoker
 from .linearizer import Linearizer
 from .locker import Locker
+from .nameable import ImmutablyNameable
 from .nameable import Nameable
 from .parameterizable import Parameter
 from .parameterizable import Parameterizable
@@ -18,6 +21,7 @@ from .parameterizable import parameter
 from .partitioner import Partitioner
 from .qualifier import Qualifier
 from .queue import Queue
+from .reachability import ReachabilityIndex
 from .requisite import Requisite
 from .storage import Storage
 from .task import Task
@@ -9,6 +9,7 @@ import edera.helpers
 
 from edera.disjointset import DisjointSet
 from edera.helpers import memoized
+from edera.nameable import ImmutablyNameable
 from edera.nameable import Nameable
 from edera.routine import deferrable
 from edera.routine import routine
@@ -115,6 +116,28 @@ class Condition(Nameable):
             Boolean - the value of the condition
         """
 
+    @classmethod
+    def check_many(cls, conditions):
+        """
+        Compute and return the boolean values of several conditions of this class at once.
+
+        Override it if your conditions can be checked in bulk (e.g. with a single query).
+        By default, conditions get checked one by one, and such classes are not batched at all.
+
+        If uncertain about some of the conditions, raise an exception instead.
+        The conditions will be checked one by one then.
+
+        Args:
+            conditions (List[Condition]) - conditions of this very class
+
+        Returns:
+            List[Boolean] - the values of the conditions in the same order
+
+        See also:
+            $batch_conditions
+        """
+        return [deferrable(condition.check)() for condition in conditions]
+
     @property
     def expression(self):
         return None
@@ -163,12 +186,19 @@ class Condition(Nameable):
         return self
 
 
-class ConditionWrapper(Condition):
+class ConditionWrapper(Condition, ImmutablyNameable):
     """
     A condition wrapper.
 
     Delegates all its method calls to the base condition object.
     Allows you to override (wrap) any subset of condition methods/properties.
+
+    The name of the wrapper must never change, since it gets remembered (see $ImmutablyNameable).
+
+    Wrappers that override $check can't be checked in bulk unless they override $check_many too.
+
+    Attributes:
+        base (Condition) - the base condition
     """
 
     def __init__(self, base):
@@ -178,10 +208,19 @@ class ConditionWrapper(Condition):
         """
         self.__base = base
 
+    @property
+    def base(self):
+        return self.__base
+
     @property
     def check(self):
         return self.__base.check
 
+    @classmethod
+    def check_many(cls, conditions):
+        bases = [condition.base for condition in conditions]
+        return type(bases[0]).check_many(bases)
+
     @property
     def expression(self):
         return self.__base.expression
@@ -198,7 +237,7 @@ class ConditionWrapper(Condition):
         return self.__base.unwrap()
 
 
-class ConditionNegation(Condition):
+class ConditionNegation(Condition, ImmutablyNameable):
     """
     The negation of a condition.
     """
@@ -224,7 +263,7 @@ class ConditionNegation(Condition):
         return "~%s" % self.__condition.name
 
 
-class ConditionConjunction(Condition):
+class ConditionConjunction(Condition, ImmutablyNameable):
     """
     The conjunction of conditions.
     """
@@ -262,7 +301,7 @@ class ConditionConjunction(Condition):
         return "(%s)" % " & ".join(sorted(condition.name for condition in self.__conditions))
 
 
-class ConditionDisjunction(Condition):
+class ConditionDisjunction(Condition, ImmutablyNameable):
     """
     The disjunction of conditions.
     """
@@ -300,7 +339,7 @@ class ConditionDisjunction(Condition):
         return "(%s)" % " | ".join(sorted(condition.name for condition in self.__conditions))
 
 
-class ConditionExclusiveDisjunction(Condition):
+class ConditionExclusiveDisjunction(Condition, ImmutablyNameable):
     """
     The exclusive disjunction of conditions.
     """
@@ -337,7 +376,7 @@ class ConditionExclusiveDisjunction(Condition):
         return "(%s)" % " ^ ".join(sorted(condition.name for condition in self.__conditions))
 
 
-class ConditionImplication(Condition):
+class ConditionImplication(Condition, ImmutablyNameable):
     """
     The implication between two conditions.
     """
@@ -394,6 +433,60 @@ def derive_constraint(conditions):
     return sympyboolalg.And(*_derive_active_constraints(conditions))
 
 
+def batch_conditions(conditions):
+    """
+    Split conditions into batches that can be checked at once.
+
+    Conditions of the same class (wrappers included) that override $Condition.check_many form
+    a batch, which can be checked via `type(batch[0]).check_many(batch)`.
+    Other conditions form batches of one and should be checked as usual.
+
+    Args:
+        conditions (List[Condition]) - conditions to split
+
+    Returns:
+        List[List[Integer]] - the batches of condition indices
+    """
+    batches = collections.OrderedDict()
+    for index, condition in enumerate(conditions):
+        signature = _get_checking_signature(condition)
+        if signature is None:
+            signature = index
+        batches.setdefault(signature, []).append(index)
+    return list(batches.values())
+
+
+@routine
+def check_in_bulk(conditions):
+    """
+    Check the conditions that can be checked in bulk.
+
+    Each batch produced by $batch_conditions (of more than one condition) gets checked with
+    a single call.
+    Other conditions don't get checked at all, neither do the batches that fail to be checked.
+
+    Args:
+        conditions (List[Condition]) - conditions to check
+
+    Returns:
+        Mapping[Integer, Boolean] - the values of the checked conditions by index
+    """
+    result = {}
+    for batch in batch_conditions(conditions):
+        if len(batch) == 1:
+            continue
+        members = [conditions[index] for index in batch]
+        try:
+            logging.getLogger(__name__).debug("Checking %d conditions at once", len(members))
+            values = yield deferrable(type(members[0]).check_many).defer(members)
+        except Exception as error:
+            logging.getLogger(__name__).info(
+                "Failed to check %d conditions at once: %s", len(members), error)
+            continue
+        result.update(zip(batch, values))
+    yield result
+
+
 def _derive_active_constraints(conditions):
     if not conditions:
         return
@@ -470,3 +563,18 @@ def _reduce_expressions(expressions, atoms):
     logging.getLogger(__name__).debug("Reduced to: %s", edera.helpers.render(expressions))
     for expression in expressions:
         yield expression
+
+
+def _get_checking_signature(condition):
+    classes = []
+    while isinstance(condition, ConditionWrapper):
+        wrapper_class = type(condition)
+        overridden = wrapper_class.check_many.__func__ is not ConditionWrapper.check_many.__func__
+        if wrapper_class.check is not ConditionWrapper.check and not overridden:
+            return None
+        classes.append(wrapper_class)
+        condition = condition.base
+    if type(condition).check_many.__func__ is Condition.check_many.__func__:
+        return None
+    classes.append(type(condition))
+    return tuple(classes)
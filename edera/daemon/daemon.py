@@ -5,6 +5,7 @@ import multiprocessing
 import signal
 import socket
 import threading
+import time
 
 import six
 
@@ -13,11 +14,13 @@ import edera.helpers
 from edera.consumers import InterProcessConsumer
 from edera.flags import InterProcessFlag
 from edera.flags import InterThreadFlag
+from edera.graph import Graph
 from edera.helpers import Sasha
 from edera.helpers import SimpleBox
 from edera.invokers import MultiProcessInvoker
 from edera.invokers import MultiThreadedInvoker
 from edera.invokers import PersistentInvoker
+from edera.linearizers import DFSLinearizer
 from edera.managers import CascadeManager
 from edera.monitoring import MonitoringAgent
 from edera.monitoring import MonitorWatcher
@@ -31,6 +34,7 @@ from edera.workflow.processors import TagFilter
 from edera.workflow.processors import TargetCacher
 from edera.workflow.processors import TargetLocker
 from edera.workflow.processors import TargetPostChecker
+from edera.workflow.processors import TaskCompiler
 from edera.workflow.processors import TaskFreezer
 from edera.workflow.processors import TaskRanker
 from edera.workflow.processors import WorkflowNormalizer
@@ -52,8 +56,21 @@ class Daemon(object):
     Each specified tag is handled in a separate process.
     The $builder persistently re-builds the workflow and $executor instances repeatedly attempt
     to execute it.
+    The $builder remembers requisites of up to $BUILDER_CACHE_CAPACITY tasks and the normalizer
+    remembers its results between re-builds.
+    The trimmer can remember complete tasks as well (see $trimming_memory), so that only new and
+    still incomplete tasks cost it much.
+    However, remembered tasks never get re-checked, so the daemon won't notice if their targets get
+    invalidated by someone else.
     Only $prelude's workflows can actually finish.
 
+    In the $pipelined mode, the workflow gets split into independent regions (connected components
+    not counting "phony" tasks that nothing but other "phony" tasks depend on) right after
+    filtering by tag.
+    The $postprocessors are applied to each region separately (smallest first), and executors
+    start working on the regions processed so far without waiting for the rest.
+    The growing workflow is published at most once per $PUBLISHING_INTERVAL.
+
     The daemon handles SIGINT/SIGTERM signals and knows how to stop gracefully.
     However, you should avoid having active background threads while running the daemon.
     This may lead to a deadlock (see documentation for $ProcessWorker for details).
@@ -69,16 +86,23 @@ class Daemon(object):
         main (DaemonModule)
         manager (ContextManager) - the context manager that controls both building and execution
         monitor (Optional[Storage]) - the storage used for monitoring purposes
+        pipelined (Boolean) - whether to execute the workflow region by region as soon as regions
+                get post-processed
         postprocessors (Iterable[WorkflowProcessor]) - the sequence of processors applied after
                 filtering by tag
         prelude (Optional[StaticDaemonModule])
         preprocessors (Iterable[WorkflowProcessor]) - the sequence of processors applied before
                 filtering by tag
         support (Optional[DaemonModule])
+        trimming_memory (Boolean) - whether the trimmer remembers complete tasks between re-builds
 
     Constants:
+        BUILDER_CACHE_CAPACITY (Integer) - the maximum number of tasks the $builder remembers
+                requisites for
         CONSUMER_CAPACITY (Integer) - the capacity of the consumer that serves monitoring agents
         CONSUMER_BACKOFF (TimeDelta) - the backoff of the consumer that serves monitoring agents
+        PUBLISHING_INTERVAL (TimeDelta) - the minimum interval between publications of the growing
+                workflow in the $pipelined mode
 
     See also:
         $DaemonAutoTester
@@ -90,14 +114,19 @@ class Daemon(object):
         See $ProcessWorker's documentation for details.
     """
 
+    BUILDER_CACHE_CAPACITY = 100000
     CONSUMER_CAPACITY = 1000
     CONSUMER_BACKOFF = datetime.timedelta(seconds=1)
+    PUBLISHING_INTERVAL = datetime.timedelta(seconds=10)
 
     def __init__(self):
+        self.__builder = WorkflowBuilder(cache_capacity=self.BUILDER_CACHE_CAPACITY)
         self.__consumer = InterProcessConsumer(
             lambda kv: self.monitor.put(*kv),
             self.CONSUMER_CAPACITY,
             self.CONSUMER_BACKOFF)
+        self.__normalization_memory = {}
+        self.__trimming_memory = set()
 
     @property
     def autotester(self):
@@ -105,7 +134,7 @@ class Daemon(object):
 
     @property
     def builder(self):
-        return WorkflowBuilder()
+        return self.__builder
 
     @property
     def cache(self):
@@ -144,15 +173,20 @@ class Daemon(object):
     def monitor(self):
         pass
 
+    @property
+    def pipelined(self):
+        return False
+
     @property
     def postprocessors(self):
         if self.cache is not None:
-            yield TargetCacher(self.cache)
-        yield WorkflowTrimmer()
+            yield TargetCacher(self.cache, prefetch=True)
+        yield WorkflowTrimmer(memory=(self.__trimming_memory if self.trimming_memory else None))
         yield TargetPostChecker()
         if self.locker is not None:
             yield TargetLocker(self.locker)
         yield TaskRanker()
+        yield TaskCompiler()
 
     @property
     def prelude(self):
@@ -161,7 +195,7 @@ class Daemon(object):
     @property
     def preprocessors(self):
         yield TaskFreezer()
-        yield WorkflowNormalizer()
+        yield WorkflowNormalizer(memory=self.__normalization_memory)
 
     @routine
     def run(self):
@@ -187,6 +221,10 @@ class Daemon(object):
     def support(self):
         pass
 
+    @property
+    def trimming_memory(self):
+        return False
+
     @routine
     def __build(self, seeder, testable, tag, box):
         if testable and self.autotester is not None:
@@ -201,19 +239,64 @@ class Daemon(object):
             for processor in self.preprocessors:
                 yield deferrable(processor.process).defer(workflow)
             TagFilter(tag).process(workflow)
+            self.__trimming_memory.intersection_update(task.name for task in workflow)
+            if self.pipelined:
+                yield self.__postprocess_by_region.defer(workflow, box)
+                return
             for processor in self.postprocessors:
                 yield deferrable(processor.process).defer(workflow)
-        box.put(workflow)
+        box.put((workflow, True))
 
     @routine
     def __execute(self, box, completion_flag):
         while True:
-            workflow = box.get()
-            if workflow is not None:
+            publication = box.get()
+            if publication is not None:
                 break
             yield edera.helpers.sleep.defer(datetime.timedelta(seconds=1))
+        workflow, complete = publication
         yield deferrable(self.executor.execute).defer(workflow)
-        completion_flag.up()
+        if complete:
+            completion_flag.up()
+
+    @routine
+    def __postprocess_by_region(self, workflow, box):
+        order = DFSLinearizer().linearize(workflow)
+        tails = set()
+        for task in reversed(order):
+            if task.phony and workflow[task].children <= tails:
+                tails.add(task)
+        core = workflow.subgraph(set(workflow) - tails)
+        result = Graph()
+        publishing_interval = self.PUBLISHING_INTERVAL.total_seconds()
+        publishing_time = None
+        for cluster in sorted(core.clusterize(), key=len):
+            region = core.subgraph(cluster)
+            for processor in self.postprocessors:
+                yield deferrable(processor.process).defer(region)
+            for task in region:
+                result.add(region[task].item)
+                result[task].annotation = dict(region[task].annotation)
+            for task in region:
+                for parent in region[task].parents:
+                    result.link(parent, task)
+            now = time.time()
+            if publishing_time is None or now >= publishing_time + publishing_interval:
+                logging.getLogger(__name__).debug("Publishing %d tasks", len(result))
+                box.put((result.clone(), False))
+                publishing_time = now
+        rank = 1 + max([result[task].annotation.get("rank", -1) for task in result] or [-1])
+        for task in order:
+            if task not in tails:
+                continue
+            result.add(workflow[task].item)
+            result[task].annotation = dict(workflow[task].annotation)
+            result[task]["rank"] = rank
+            rank += 1
+            for parent in workflow[task].parents:
+                if parent in result:
+                    result.link(parent, task)
+        box.put((result, True))
 
     @routine
     def __run(self):
@@ -104,16 +104,22 @@ class CircularDependencyError(Error):
 
     Attributes:
         cycle (List[Any]) - the detected cycle
+        components (List[List[Any]]) - the strongly connected components that contain cycles
+            Some linearizers find just one cycle, then it is the only component.
     """
 
-    def __init__(self, cycle):
+    def __init__(self, cycle, components=None):
         """
         Args:
             cycle (List[Any]) - the detected cycle
+            components (Optional[List[List[Any]]]) - all strongly connected components that
+                    contain cycles
+                Default is $None - the cycle is the only known one.
         """
         message = "circular dependency detected: %s ..." % edera.helpers.render(cycle)
         Error.__init__(self, message)
         self.cycle = cycle
+        self.components = [cycle] if components is None else components
 
 
 class TargetVerificationError(Error):
@@ -1,3 +1,4 @@
+import array
 import collections
 import operator
 
@@ -41,9 +42,14 @@ class Graph(object):
         2
         >>> isinstance(graph.clone(), Graph)  # create a shallow copy of the graph
         True
+        >>> set(graph.subgraph(["A"]))  # create a shallow copy restricted to some items
+        {'A'}
         >>> graph.remove("A")  # remove an item (removes all adjacent edges as well)
         >>> set(graph)
         {'B'}
+        >>> graph.retain(["B"])  # remove all items but the given ones
+        >>> set(graph)
+        {'B'}
         >>> list(map(id, graph))  # take a look at the item ids
         [140101652783512]
         >>> graph.replace(u"B")  # replace "B" with a different (but equal) object
@@ -180,6 +186,7 @@ class Graph(object):
         Remove the items from the graph.
 
         Removes all the adjacent edges as well.
+        Only the neighbours of the items get touched.
 
         Args:
             items (Tuple[Any...]) - graph items
@@ -191,11 +198,15 @@ class Graph(object):
         for item in items:
             assert item in self
         for item in items:
-            del self.__node_map[item]
-        for item in self:
-            node = self[item]
-            node.parents -= items
-            node.children -= items
+            node = self.__node_map.pop(item)
+            for parent in node.parents:
+                neighbour = self.__node_map.get(parent)
+                if neighbour is not None:
+                    neighbour.children.discard(item)
+            for child in node.children:
+                neighbour = self.__node_map.get(child)
+                if neighbour is not None:
+                    neighbour.parents.discard(item)
 
     def replace(self, item):
         """
@@ -213,6 +224,58 @@ class Graph(object):
         assert item in self
         self.__node_map[item].item = item
 
+    def retain(self, items):
+        """
+        Remove all the items from the graph except the given ones.
+
+        Removes all the adjacent edges as well.
+        Takes time proportional to the number of retained items and their edges, so prefer it to
+        $remove when most of the graph goes away.
+
+        Args:
+            items (Iterable[Any]) - graph items to keep
+
+        Raises:
+            AssertionError if some of the items are not in the graph
+        """
+        items = set(items)
+        for item in items:
+            assert item in self
+        node_map = {}
+        for item in items:
+            node = self.__node_map[item]
+            node.parents.intersection_update(items)
+            node.children.intersection_update(items)
+            node_map[item] = node
+        self.__node_map = node_map
+
+    def subgraph(self, items):
+        """
+        Create a shallow copy of the graph restricted to the given items.
+
+        Takes time proportional to the number of the items and their edges.
+
+        Args:
+            items (Iterable[Any]) - graph items to copy
+
+        Returns:
+            Graph
+
+        Raises:
+            AssertionError if some of the items are not in the graph
+        """
+        items = set(items)
+        for item in items:
+            assert item in self
+        result = Graph()
+        for item in items:
+            node = self.__node_map[item]
+            result.add(node.item)
+            result[item].annotation = dict(node.annotation)
+            result[item].parents = node.parents & items
+            result[item].children = node.children & items
+        return result
+
     def trace(self, item, direction):
         """
         Find all ancestors/descendants of the item.
@@ -302,3 +365,277 @@ class GraphNode(object):
             value (Any)
         """
         self.annotation[key] = value
+
+
+class FrozenGraph(object):
+    """
+    A compact immutable view of a graph.
+
+    Maps graph items to dense integer ids (in the order they are given) and keeps the edges in
+    the compressed sparse row form: the parents of the item with id `i` are stored in
+    `parent_ids[parent_offsets[i]:parent_offsets[i + 1]]`, and so are its children.
+    Annotations are shared with the original graph.
+
+    Supports the read-only part of the $Graph interface, so that algorithms that leave
+    the topology intact (linearizers, rankers, queues) can run on it.
+    Besides, allows to walk the graph by ids, which saves a lot of time on item hashing.
+
+    Attributes:
+        items (List[Any]) - the graph items by id
+        annotations (List[Mapping[String, Any]]) - the annotations by id
+        parent_offsets (Array[Integer]) - the offsets of parent lists in $parent_ids by id
+        parent_ids (Array[Integer]) - the concatenated lists of parent ids
+        child_offsets (Array[Integer]) - the offsets of child lists in $child_ids by id
+        child_ids (Array[Integer]) - the concatenated lists of child ids
+
+    Examples:
+        >>> frozen_graph = FrozenGraph(graph)  # make a frozen view of the graph
+        >>> set(frozen_graph) == set(graph)
+        True
+        >>> frozen_graph["A"].children == graph["A"].children
+        True
+        >>> frozen_graph["A"]["rank"] = 0  # annotations are shared
+        >>> graph["A"]["rank"]
+        0
+        >>> index = frozen_graph.index("A")  # get the id of the item
+        >>> [frozen_graph.items[child] for child in frozen_graph.get_children(index)]
+        ['B']
+        >>> isinstance(frozen_graph.thaw(), Graph)  # create a mutable shallow copy
+        True
+
+    See also:
+        $Graph
+    """
+
+    def __contains__(self, item):
+        """
+        Check whether the item is in the graph.
+
+        Args:
+            item (Any) - an item
+
+        Returns:
+            Boolean - True iff the item is in the graph
+        """
+        return item in self.__ids
+
+    def __getitem__(self, item):
+        """
+        Get the node holding the given item.
+
+        Args:
+            item (Any) - an item
+
+        Returns:
+            FrozenGraphNode
+
+        Raises:
+            AssertionError if the item is not in the graph
+
+        See also:
+            $FrozenGraphNode
+        """
+        assert item in self
+        return FrozenGraphNode(self, self.__ids[item])
+
+    def __init__(self, graph, items=None):
+        """
+        Args:
+            graph (Graph) - a graph to make a view of
+            items (Optional[Iterable[Any]]) - all graph items in the order to assign ids in
+                Default is $None - use the iteration order of the graph.
+
+        Raises:
+            AssertionError if $items don't match the graph
+        """
+        self.items = [graph[item].item for item in (graph if items is None else items)]
+        self.annotations = [graph[item].annotation for item in self.items]
+        self.__ids = {item: index for index, item in enumerate(self.items)}
+        assert len(self.__ids) == len(self.items) == len(graph)
+        self.parent_offsets, self.parent_ids = self.__compress(graph, "parents")
+        self.child_offsets, self.child_ids = self.__compress(graph, "children")
+
+    def __iter__(self):
+        """
+        Get an iterator over graph items.
+
+        Returns:
+            Iterator[Any]
+        """
+        return iter(self.items)
+
+    def __len__(self):
+        """
+        Get the number of nodes in the graph.
+
+        Returns:
+            Integer
+        """
+        return len(self.items)
+
+    def get_children(self, index):
+        """
+        Get the ids of the children of the item.
+
+        Args:
+            index (Integer) - the id of the item
+
+        Returns:
+            Array[Integer]
+        """
+        return self.child_ids[self.child_offsets[index]:self.child_offsets[index + 1]]
+
+    def get_parents(self, index):
+        """
+        Get the ids of the parents of the item.
+
+        Args:
+            index (Integer) - the id of the item
+
+        Returns:
+            Array[Integer]
+        """
+        return self.parent_ids[self.parent_offsets[index]:self.parent_offsets[index + 1]]
+
+    def index(self, item):
+        """
+        Get the id of the item.
+
+        Args:
+            item (Any) - an item
+
+        Returns:
+            Integer
+
+        Raises:
+            AssertionError if the item is not in the graph
+        """
+        assert item in self
+        return self.__ids[item]
+
+    def thaw(self):
+        """
+        Create a mutable shallow copy of the graph.
+
+        Returns:
+            Graph
+        """
+        result = Graph()
+        for item, annotation in zip(self.items, self.annotations):
+            result.add(item)
+            result[item].annotation = dict(annotation)
+        for index, item in enumerate(self.items):
+            for child in self.get_children(index):
+                result.link(item, self.items[child])
+        return result
+
+    def trace(self, item, direction):
+        """
+        Find all ancestors/descendants of the item.
+
+        Args:
+            item (Any) - a source item
+            direction (String) - either "A" (for ancestors) or "D" (for descendants)
+                Determines the tracing direction.
+
+        Returns:
+            Set[Any] - the set of ancestor/descendant items
+                The source item itself is not included.
+
+        Raises:
+            AssertionError if the item is not in the graph
+        """
+        assert direction in ("A", "D")
+        selector = self.get_parents if direction == "A" else self.get_children
+        visited = set()
+        stack = list(selector(self.index(item)))
+        while stack:
+            relative = stack.pop()
+            if relative in visited:
+                continue
+            visited.add(relative)
+            stack.extend(selector(relative))
+        return {self.items[index] for index in visited}
+
+    def __compress(self, graph, direction):
+        offsets = array.array("l", [0])
+        ids = array.array("l")
+        for item in self.items:
+            ids.extend([self.__ids[relative] for relative in getattr(graph[item], direction)])
+            offsets.append(len(ids))
+        return offsets, ids
+
+
+class FrozenGraphNode(object):
+    """
+    A node of a frozen graph.
+
+    Gets created on the fly, so prefer walking the graph by ids when performance matters.
+
+    Attributes:
+        item (Any) - the contained item
+        annotation (Mapping[String, Any]) - the annotation (shared with the original graph)
+        parents (FrozenSet[Any]) - the set of parent items
+        children (FrozenSet[Any]) - the set of child items
+
+    See also:
+        $FrozenGraph
+    """
+
+    __slots__ = ("__graph", "__index")
+
+    def __getitem__(self, key):
+        """
+        Get an annotation by key.
+
+        This is just a shortcut for `self.annotation[key]`.
+
+        Args:
+            key (String)
+
+        Returns:
+            Any
+        """
+        return self.annotation[key]
+
+    def __init__(self, graph, index):
+        """
+        Args:
+            graph (FrozenGraph) - the graph the node belongs to
+            index (Integer) - the id of the item
+
+        See also:
+            $FrozenGraph.__getitem__
+        """
+        self.__graph = graph
+        self.__index = index
+
+    def __setitem__(self, key, value):
+        """
+        Set an annotation for the key.
+
+        This is just a shortcut for `self.annotation[key] = value`.
+
+        Args:
+            key (String)
+            value (Any)
+        """
+        self.annotation[key] = value
+
+    @property
+    def annotation(self):
+        return self.__graph.annotations[self.__index]
+
+    @property
+    def children(self):
+        items = self.__graph.items
+        return frozenset(items[child] for child in self.__graph.get_children(self.__index))
+
+    @property
+    def item(self):
+        return self.__graph.items[self.__index]
+
+    @property
+    def parents(self):
+        items = self.__graph.items
+        return frozenset(items[parent] for parent in self.__graph.get_parents(self.__index))
@@ -20,7 +20,7 @@ class Linearizer(object):
         Doesn't mutate the graph.
 
         Args:
-            graph (Graph)
+            graph (Union[Graph, FrozenGraph])
 
         Returns:
             List[Any] - the sorted graph items
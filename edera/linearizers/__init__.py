@@ -1 +1,2 @@
 from .dfs import DFSLinearizer
+from .kahn import KahnLinearizer
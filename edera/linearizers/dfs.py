@@ -1,4 +1,7 @@
+import collections
+
 from edera.exceptions import CircularDependencyError
+from edera.graph import FrozenGraph
 from edera.linearizer import Linearizer
 
 
@@ -7,34 +10,60 @@ class DFSLinearizer(Linearizer):
     A linearizer that uses depth-first search to perform topological ordering.
 
     This implementation is non-recursive and can handle really deep graphs.
+    Frozen graphs get walked by ids, which saves time on item hashing.
     """
 
     def linearize(self, graph):
-        unexplored = set(graph)
+        if isinstance(graph, FrozenGraph):
+            return [graph.items[index] for index in self.linearize_ids(graph)]
+        get_children = (lambda item: graph[item].children)
+        resolve = (lambda item: graph[item].item)
+        order = self.__explore(list(graph), get_children, collections.defaultdict(int), resolve)
+        return [resolve(item) for item in order]
+
+    def linearize_ids(self, graph):
+        """
+        Linearize the frozen graph by ids.
+
+        Doesn't mutate the graph.
+
+        Args:
+            graph (FrozenGraph)
+
+        Returns:
+            List[Integer] - the sorted item ids
+
+        Raises:
+            CircularDependencyError if there is a cycle in the graph
+        """
+        return self.__explore(
+            range(len(graph)), graph.get_children, bytearray(len(graph)), graph.items.__getitem__)
+
+    def __explore(self, roots, get_children, states, resolve):
+        # 0 - unexplored, 1 - passing, 2 - explored
         exploring = []
-        passing = set()
         path = []
         stack = []
-        while unexplored:
-            item = next(iter(unexplored))
-            exploring.append((False, item))
+        for root in roots:
+            if states[root]:
+                continue
+            exploring.append((False, root))
             while exploring:
-                explored, item = exploring.pop()
-                if item not in unexplored:
+                explored, node = exploring.pop()
+                if states[node] == 2:
                     continue
                 if explored:
-                    unexplored.remove(item)
-                    passing.remove(item)
+                    states[node] = 2
                     path.pop()
-                    stack.append(item)
+                    stack.append(node)
                     continue
-                if item in passing:
-                    index = path.index(item)
-                    raise CircularDependencyError(path[index:])
-                exploring.append((True, item))
-                passing.add(item)
-                path.append(item)
-                for child in graph[item].children:
-                    if child in unexplored:
-                        exploring.append((False, graph[child].item))
+                if states[node] == 1:
+                    cycle = path[path.index(node):]
+                    raise CircularDependencyError([resolve(member) for member in cycle])
+                exploring.append((True, node))
+                states[node] = 1
+                path.append(node)
+                for child in get_children(node):
+                    if states[child] != 2:
+                        exploring.append((False, child))
         return stack[::-1]
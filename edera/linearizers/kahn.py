@@ -0,0 +1,138 @@
+from edera.exceptions import CircularDependencyError
+from edera.graph import FrozenGraph
+from edera.linearizer import Linearizer
+
+
+class KahnLinearizer(Linearizer):
+    """
+    A linearizer that uses Kahn's algorithm to perform topological ordering.
+
+    Splits the graph into levels: the first level consists of the items that have no parents,
+    each next level consists of the items whose parents are all on the previous levels.
+    Items on the same level are mutually independent, so they can be processed concurrently.
+    The linearization is just the concatenation of the levels.
+
+    The result doesn't depend on the iteration order of the graph: items on each level are
+    sorted.
+
+    When the graph has cycles, finds all its strongly connected components (using Tarjan's
+    algorithm) and reports them all at once.
+    Frozen graphs get walked by ids, which saves time on item hashing.
+
+    This implementation is non-recursive and can handle really deep graphs.
+    """
+
+    def linearize(self, graph):
+        return [item for level in self.stratify(graph) for item in level]
+
+    def stratify(self, graph):
+        """
+        Split the graph into levels of mutually independent items.
+
+        Doesn't mutate the graph.
+
+        Args:
+            graph (Union[Graph, FrozenGraph])
+
+        Returns:
+            List[List[Any]] - the sorted items by level
+
+        Raises:
+            CircularDependencyError if there are cycles in the graph
+        """
+        if isinstance(graph, FrozenGraph):
+            offsets = graph.parent_offsets
+            nodes = range(len(graph))
+            blockers = [offsets[index + 1] - offsets[index] for index in nodes]
+            get_children = graph.get_children
+            resolve = graph.items.__getitem__
+        else:
+            nodes = list(graph)
+            blockers = {item: len(graph[item].parents) for item in nodes}
+            get_children = (lambda item: graph[item].children)
+            resolve = (lambda item: graph[item].item)
+        level = [node for node in nodes if not blockers[node]]
+        result = []
+        while level:
+            result.append(sorted(map(resolve, level)))
+            next_level = []
+            for node in level:
+                for child in get_children(node):
+                    blockers[child] -= 1
+                    if not blockers[child]:
+                        next_level.append(child)
+            level = next_level
+        if sum(map(len, result)) != len(graph):
+            leftovers = [node for node in nodes if blockers[node]]
+            if not isinstance(graph, FrozenGraph):
+                graph = FrozenGraph(graph)
+                leftovers = list(map(graph.index, leftovers))
+            components = sorted(
+                (
+                    sorted(component, key=graph.items.__getitem__)
+                    for component in _find_strong_components(graph, leftovers)
+                    if len(component) > 1 or component[0] in graph.get_children(component[0])
+                ),
+                key=(lambda component: [graph.items[index] for index in component]))
+            cycle = _trace_cycle(graph, components[0])
+            raise CircularDependencyError(
+                [graph.items[index] for index in cycle],
+                components=[
+                    [graph.items[index] for index in component]
+                    for component in components
+                ])
+        return result
+
+
+def _find_strong_components(graph, indices):
+    members = set(indices)
+    orders = {}
+    lowlinks = {}
+    stack = []
+    stacked = set()
+    result = []
+    for root in indices:
+        if root in orders:
+            continue
+        orders[root] = lowlinks[root] = len(orders)
+        stack.append(root)
+        stacked.add(root)
+        exploring = [(root, iter(graph.get_children(root)))]
+        while exploring:
+            index, children = exploring[-1]
+            for child in children:
+                if child not in members:
+                    continue
+                if child not in orders:
+                    orders[child] = lowlinks[child] = len(orders)
+                    stack.append(child)
+                    stacked.add(child)
+                    exploring.append((child, iter(graph.get_children(child))))
+                    break
+                if child in stacked:
+                    lowlinks[index] = min(lowlinks[index], orders[child])
+            else:
+                exploring.pop()
+                if exploring:
+                    parent = exploring[-1][0]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[index])
+                if lowlinks[index] != orders[index]:
+                    continue
+                component = []
+                while not component or component[-1] != index:
+                    component.append(stack.pop())
+                    stacked.remove(component[-1])
+                result.append(component)
+    return result
+
+
+def _trace_cycle(graph, component):
+    members = set(component)
+    positions = {}
+    path = []
+    index = component[0]
+    while index not in positions:
+        positions[index] = len(path)
+        path.append(index)
+        index = next(child for child in graph.get_children(index) if child in members)
+    return path[positions[index]:]
@@ -274,6 +274,15 @@ class StatusReportingConditionWrapper(ConditionWrapper):
             self.__report_status("completed")
         yield result
 
+    @classmethod
+    def check_many(cls, conditions):
+        bases = [condition.base for condition in conditions]
+        results = type(bases[0]).check_many(bases)
+        for condition, result in zip(conditions, results):
+            if result:
+                condition.__report_status("completed")
+        return results
+
     def __report_status(self, status):
         self.__agent.push(TaskStatusUpdate(self.__task.name, status, edera.helpers.now()))
 
@@ -230,6 +230,7 @@ class WorkflowUpdate(MonitoringSnapshotUpdate):
         snapshot.add([task for task in self.dependencies if task not in snapshot])
         topology = self.__extract_topology(snapshot)
         active = {snapshot.core.aliases[task] for task in self.dependencies}
+        memo = {}
         for task in snapshot.core.aliases:
             alias = snapshot.core.aliases[task]
             state = snapshot.core.states[alias]
@@ -239,7 +240,7 @@ class WorkflowUpdate(MonitoringSnapshotUpdate):
                 if agent in state.agents:
                     state.agents.remove(agent)
                     if not state.agents and not state.completed:
-                        if self.__check_for_active_descendants(alias, topology, active):
+                        if self.__check_for_active_descendants(alias, topology, active, memo):
                             state.stale = False
                             state.completed = True
                         else:
@@ -257,14 +258,19 @@ class WorkflowUpdate(MonitoringSnapshotUpdate):
                 }
                 yield task
 
-    def __check_for_active_descendants(self, alias, topology, active):
-        children = topology[alias].children
-        return (
-            any(child in active for child in children)
-            or any(
-                self.__check_for_active_descendants(child, topology, active)
-                for child in children)
-        )
+    def __check_for_active_descendants(self, alias, topology, active, memo):
+        exploring = [(False, alias)]
+        while exploring:
+            explored, current = exploring.pop()
+            if current in memo:
+                continue
+            children = topology[current].children
+            if explored:
+                memo[current] = any(child in active or memo.get(child) for child in children)
+                continue
+            exploring.append((True, current))
+            exploring.extend((False, child) for child in children if child not in memo)
+        return memo[alias]
 
     def __extract_topology(self, snapshot):
         result = Graph()
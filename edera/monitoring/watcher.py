@@ -83,9 +83,17 @@ class MonitorWatcher(object):
             return
         core = self.__load_snapshot_core(version=checkpoint.core_version)
         payloads = {}
+        try:
+            records = self.monitor.scan("payload/")
+        except NotImplementedError:
+            records = {}
         for alias, payload_version in six.iteritems(checkpoint.payload_versions):
-            yield
-            payloads[alias] = self.__load_task_payload(alias, version=payload_version)
+            latest = records.get("payload/" + alias)
+            if latest and latest[0][0] == payload_version:
+                payloads[alias] = TaskPayload.deserialize(latest[0][1])
+            else:  # updated since the checkpoint (or not scanned at all)
+                yield
+                payloads[alias] = self.__load_task_payload(alias, version=payload_version)
         yield (checkpoint, MonitoringSnapshot(core, payloads))
 
     @routine
@@ -147,19 +155,19 @@ class MonitorWatcher(object):
             augment(snapshot)
             yield
             next_checkpoint.core_version = self.monitor.put("core", snapshot.core.serialize())
-            for alias in set(affected):
-                yield
-                payload = snapshot.payloads[alias]
-                new_payload_version = self.monitor.put("payload/" + alias, payload.serialize())
-                next_checkpoint.payload_versions[alias] = new_payload_version
+            affected = sorted(affected)
+            new_payload_versions = self.monitor.put_many(
+                ("payload/" + alias, snapshot.payloads[alias].serialize()) for alias in affected)
+            next_checkpoint.payload_versions.update(zip(affected, new_payload_versions))
+            yield
             next_checkpoint.version = self.monitor.put("checkpoint", next_checkpoint.serialize())
             self.monitor.delete("checkpoint", till=next_checkpoint.version)
-            self.monitor.delete("core", till=checkpoint.core_version)
-            for alias in set(affected):
-                yield
-                if alias not in checkpoint.payload_versions:
-                    continue
-                self.monitor.delete("payload/" + alias, till=checkpoint.payload_versions[alias])
+            self.monitor.delete_many(
+                [("core", checkpoint.core_version)] + [
+                    ("payload/" + alias, checkpoint.payload_versions[alias])
+                    for alias in affected
+                    if alias in checkpoint.payload_versions
+                ])
             for agent in agents:
                 if agent.name not in checkpoint.cursors:
                     continue
@@ -17,12 +17,13 @@ class Nameable(object):
         name (String) - the unique name
 
     See also:
+        $ImmutablyNameable
         $Parameterizable
     """
 
     def __eq__(self, other):
         assert other is None or isinstance(other, Nameable)
-        return other is not None and other.name == self.name
+        return other is self or other is not None and other.name == self.name
 
     def __gt__(self, other):
         return other is None or self.name > other.name
@@ -39,3 +40,43 @@ class Nameable(object):
     @abc.abstractproperty
     def name(self):
         pass
+
+
+class ImmutablyNameable(Nameable):
+    """
+    A nameable object whose name never changes.
+
+    Evaluates its name only once (when it gets hashed or compared for the first time), interns it
+    and remembers its hash.
+    This makes hashing and comparison cheap for objects with expensive names, like wrappers that
+    delegate to a chain of base objects or combinators that join the names of their parts.
+
+    See also:
+        $Nameable
+    """
+
+    def __eq__(self, other):
+        assert other is None or isinstance(other, Nameable)
+        if other is self:
+            return True
+        if other is None:
+            return False
+        if isinstance(other, ImmutablyNameable):
+            return other.__recall()[0] == self.__recall()[0]
+        return other.name == self.__recall()[0]
+
+    def __gt__(self, other):
+        return other is None or self.__recall()[0] > other.name
+
+    def __hash__(self):
+        return self.__recall()[1]
+
+    def __recall(self):
+        try:
+            return self.__identity
+        except AttributeError:
+            name = self.name
+            if isinstance(name, str):
+                name = six.moves.intern(name)
+            self.__identity = (name, hash(name))
+            return self.__identity
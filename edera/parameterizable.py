@@ -69,6 +69,8 @@ class Parameterizable(Nameable):
             for name, instance in sorted(self.parameters.items())
         ]
         self.__name = "%s(%s)" % (self.__class__.__name__, ", ".join(arguments))
+        if isinstance(self.__name, str):
+            self.__name = six.moves.intern(self.__name)
         self.__hash = hash(self.__name)
 
     @classmethod
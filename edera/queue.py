@@ -42,7 +42,7 @@ class Queue(object):
     def __init__(self, graph):
         """
         Args:
-            graph (Graph) - a graph to iterate over
+            graph (Union[Graph, FrozenGraph]) - a graph to iterate over
                 All items must be annotated with `rank`.
 
         Raises:
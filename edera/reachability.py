@@ -0,0 +1,198 @@
+from edera.graph import FrozenGraph
+from edera.linearizers import DFSLinearizer
+
+
+class ReachabilityIndex(object):
+    """
+    An index that answers ancestor/descendant queries on an acyclic graph in constant time.
+
+    Keeps the ancestors and the descendants of each item as bitmasks (plain integers), computed
+    once in topological order.
+    Bit `i` of a mask stands for the `i`-th item of the topological order the index was built
+    with, so sets of items can be combined with bitwise operations.
+    Removed items are just masked out, unless they have been connecting the remaining items,
+    in which case the masks of the affected items get re-computed.
+
+    The index takes up to n^2/8 bytes of memory for a graph of n items, so mind the size.
+
+    Examples:
+        >>> index = ReachabilityIndex(graph)  # graph: A -> B -> C
+        >>> index.trace("A", "D")
+        {'B', 'C'}
+        >>> index.decode(index.reach("C", "A") & ~index.encode(["B"]))
+        ['A']
+        >>> index.remove("B")
+        >>> index.trace("A", "D")
+        set()
+
+    See also:
+        $Graph.trace
+    """
+
+    def __contains__(self, item):
+        """
+        Check whether the item is in the index.
+
+        Args:
+            item (Any) - an item
+
+        Returns:
+            Boolean - True iff the item is in the index (and not removed)
+        """
+        return item in self.__ids and not self.__removed[self.__ids[item]]
+
+    def __init__(self, graph, order=None):
+        """
+        Args:
+            graph (Union[Graph, FrozenGraph]) - an acyclic graph to index
+            order (Optional[Iterable[Any]]) - all graph items in topological order
+                Default is $None - linearize the graph with $DFSLinearizer.
+
+        Raises:
+            CircularDependencyError if the graph is cyclic and $order is not given
+        """
+        if order is None:
+            order = DFSLinearizer().linearize(graph)
+        self.__graph = FrozenGraph(graph, order)
+        self.__ids = {item: index for index, item in enumerate(self.__graph.items)}
+        self.__alive = (1 << len(self.__graph)) - 1
+        self.__removed = bytearray(len(self.__graph))
+        self.__count = len(self.__graph)
+        self.__ancestors = [0] * len(self.__graph)
+        self.__descendants = [0] * len(self.__graph)
+        self.__update_ancestors(range(len(self.__graph)))
+        self.__update_descendants(reversed(range(len(self.__graph))))
+
+    def __len__(self):
+        """
+        Get the number of items in the index.
+
+        Returns:
+            Integer
+        """
+        return self.__count
+
+    def decode(self, mask):
+        """
+        Convert the bitmask into the list of items.
+
+        Args:
+            mask (Integer) - a bitmask
+
+        Returns:
+            List[Any] - the items in topological order
+        """
+        return [self.__graph.items[index] for index in _get_bit_indices(mask & self.__alive)]
+
+    def encode(self, items):
+        """
+        Convert the items into a bitmask.
+
+        Args:
+            items (Iterable[Any]) - indexed items
+
+        Returns:
+            Integer - the bitmask
+
+        Raises:
+            AssertionError if some of the items are not in the index
+        """
+        result = 0
+        for item in items:
+            assert item in self
+            result |= 1 << self.__ids[item]
+        return result
+
+    def reach(self, item, direction):
+        """
+        Find all ancestors/descendants of the item.
+
+        Args:
+            item (Any) - a source item
+            direction (String) - either "A" (for ancestors) or "D" (for descendants)
+                Determines the tracing direction.
+
+        Returns:
+            Integer - the bitmask of the ancestor/descendant items
+                The source item itself is not included.
+
+        Raises:
+            AssertionError if the item is not in the index
+        """
+        assert direction in ("A", "D")
+        assert item in self
+        masks = self.__ancestors if direction == "A" else self.__descendants
+        return masks[self.__ids[item]] & self.__alive
+
+    def remove(self, *items):
+        """
+        Remove the items from the index.
+
+        Paths that go through the removed items break, just like in $Graph.
+
+        Args:
+            items (Tuple[Any...]) - indexed items
+
+        Raises:
+            AssertionError if some of the items are not in the index
+        """
+        indices = set()
+        for item in items:
+            assert item in self
+            indices.add(self.__ids[item])
+        above, below = 0, 0
+        for index in indices:
+            self.__removed[index] = 1
+            self.__alive &= ~(1 << index)
+            above |= self.__ancestors[index]
+            below |= self.__descendants[index]
+        self.__count -= len(indices)
+        above &= self.__alive
+        below &= self.__alive
+        if not above or not below:
+            return  # no remaining items were connected through the removed ones
+        self.__update_descendants(reversed(_get_bit_indices(above)))
+        self.__update_ancestors(_get_bit_indices(below))
+
+    def trace(self, item, direction):
+        """
+        Find all ancestors/descendants of the item.
+
+        Args:
+            item (Any) - a source item
+            direction (String) - either "A" (for ancestors) or "D" (for descendants)
+                Determines the tracing direction.
+
+        Returns:
+            Set[Any] - the set of ancestor/descendant items
+                The source item itself is not included.
+
+        Raises:
+            AssertionError if the item is not in the index
+        """
+        return set(self.decode(self.reach(item, direction)))
+
+    def __update_ancestors(self, indices):
+        for index in indices:
+            mask = 0
+            for parent in self.__graph.get_parents(index):
+                if not self.__removed[parent]:
+                    mask |= self.__ancestors[parent] | 1 << parent
+            self.__ancestors[index] = mask
+
+    def __update_descendants(self, indices):
+        for index in indices:
+            mask = 0
+            for child in self.__graph.get_children(index):
+                if not self.__removed[child]:
+                    mask |= self.__descendants[child] | 1 << child
+            self.__descendants[index] = mask
+
+
+def _get_bit_indices(mask):
+    result = []
+    while mask:
+        lowest = mask & -mask
+        result.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return result
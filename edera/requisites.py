@@ -118,15 +118,24 @@ class Include(Requisite):
         """
         self.task = task
 
+    def expand(self):
+        """
+        Evaluate the requisites of the task along the MRO.
+
+        Returns:
+            Requisite - the combined requisite of the task
+        """
+        requisites = [
+            base.requisite.fget(self.task)
+            for base in inspect.getmro(self.task.__class__)
+            if issubclass(base, Task) and "requisite" in base.__dict__
+        ]
+        return SatisfyAll(requisites)
+
     def satisfy(self, requisitor, workflow):
         if self.task not in workflow:
             workflow.add(self.task)
-            requisites = [
-                base.requisite.fget(self.task)
-                for base in inspect.getmro(self.task.__class__)
-                if issubclass(base, Task) and "requisite" in base.__dict__
-            ]
-            yield (self.task, SatisfyAll(requisites))
+            yield (self.task, self.expand())
 
 
 class SatisfyAll(Requisite):
@@ -1,4 +1,5 @@
 import functools
+import inspect
 import sys
 
 import edera.helpers
@@ -50,72 +51,77 @@ class Routine(object):
         Args:
             *args, **kwargs - arguments to pass to the core
         """
+        if self.__plain:
+            feed = self.__core(*args, **kwargs)
+            for auditor in self.__auditors:
+                auditor()
+            if isinstance(feed, DeferredRoutineCall):
+                feed.carry(*self.__auditors)
+                return None
+            return feed
         generator = self.__core(*args, **kwargs)
         result = None
         seed, exception = None, None
         while True:
             try:
                 feed = generator.send(seed) if exception is None else generator.throw(*exception)
+            except RoutineAuditionError as error:
+                raise error.cause
             except StopIteration:
                 return result
+            exception = None
+            try:
+                for auditor in self.__auditors:
+                    auditor()
+            except BaseException as error:
+                exception = (RoutineAuditionError, RoutineAuditionError(error), sys.exc_info()[2])
+                continue
             if isinstance(feed, DeferredRoutineCall):
                 try:
-                    seed = feed.carry()
+                    seed = feed.carry(*self.__auditors)
                 except BaseException:
                     exception = sys.exc_info()
-                    continue
             else:
                 result = feed
-            exception = None
 
     def __get__(self, owner, owner_type=None):
         if owner is None:
             return self
-        return self.__class__(functools.partial(self.__core, owner))
+        return self.__class__(functools.partial(self.__core, owner), self.__auditors, self.__plain)
 
-    def __getitem__(self, auditor):
+    def __getitem__(self, auditors):
         """
         Attach the auditor to the routine.
 
+        Auditors are kept in a flat list and called one after another (in the order of attachment)
+        on each yield, and they get passed down to nested routine calls.
+
         Args:
-            auditor (Callable[[], Any]) - an auditor function
+            auditors (Union[Callable[[], Any], Tuple[Callable[[], Any]...]]) - an auditor function
+                or a tuple of them
 
         Returns:
             Routine
         """
+        if not isinstance(auditors, tuple):
+            auditors = (auditors,)
+        return self.__class__(self.__core, self.__auditors + auditors, self.__plain)
 
-        def core(*args, **kwargs):
-            generator = self.__core(*args, **kwargs)
-            seed, exception = None, None
-            while True:
-                try:
-                    feed = generator.send(seed) if exception is None else generator.throw(*exception)
-                except RoutineAuditionError as error:
-                    raise error.cause
-                except StopIteration:
-                    return
-                if isinstance(feed, DeferredRoutineCall):
-                    feed.instance = feed.instance[auditor]
-                try:
-                    try:
-                        auditor()
-                    except BaseException as error:
-                        raise RoutineAuditionError(error)
-                    seed = yield feed
-                except BaseException:
-                    exception = sys.exc_info()
-                else:
-                    exception = None
-
-        return self.__class__(core)
-
-    def __init__(self, core):
+    def __init__(self, core, auditors=(), plain=False):
         """
         Args:
             core (GeneratorFunction[Any...]) - a core generator function
                 Methods are also supported.
+            auditors (Tuple[Callable[[], Any]...]) - auditors to attach to the routine
+                Default is none.
+            plain (Boolean) - whether the core is an ordinary function
+                Such routines call the core directly instead of iterating over a generator, and
+                treat its result as the only yielded value.
+                Default is $False.
         """
         self.__core = core
+        self.__auditors = auditors
+        self.__plain = plain
 
     def defer(self, *args, **kwargs):
         """
@@ -139,7 +145,8 @@ class Routine(object):
         Returns:
             Routine
         """
-        return self.__class__(functools.partial(self.__core, *args, **kwargs))
+        return self.__class__(
+            functools.partial(self.__core, *args, **kwargs), self.__auditors, self.__plain)
 
 
 class DeferredRoutineCall(object):
@@ -147,6 +154,7 @@ class DeferredRoutineCall(object):
     A deferred routine call.
 
     Contains all necessary information to call the routine.
+    The call itself is never altered, so it can be carried multiple times.
 
     Attributes:
         instance (Routine) - a routine to call
@@ -156,6 +164,8 @@ class DeferredRoutineCall(object):
         $Routine.defer
     """
 
+    __slots__ = ("instance", "args", "kwargs")
+
     def __init__(self, instance, *args, **kwargs):
         """
         Args:
@@ -166,14 +176,19 @@ class DeferredRoutineCall(object):
         self.args = args
         self.kwargs = kwargs
 
-    def carry(self):
+    def carry(self, *auditors):
         """
         Call the routine.
 
+        Args:
+            *auditors (Callable[[], Any]) - additional auditors to attach to the routine
+                They are used by audited routines that carry the call.
+
         Returns:
             Any - the result of the call
         """
-        return self.instance(*self.args, **self.kwargs)
+        instance = self.instance[auditors] if auditors else self.instance
+        return instance(*self.args, **self.kwargs)
 
 
 class RoutineAuditionError(BaseException):
@@ -214,6 +229,7 @@ def deferrable(function):
     Transforms other callable objects into fake non-interruptible routines.
 
     Can be used to blur the line between ordinary functions and routines.
+    Coroutine functions (`async def`) are run to completion on a private event loop.
 
     Args:
         function (Callable[Any...]) - a function to make deferrable
@@ -222,10 +238,35 @@ def deferrable(function):
         Routine
     """
 
-    def pseudocore(*args, **kwargs):
-        yield function(*args, **kwargs)
+    def coroutine_pseudocore(*args, **kwargs):
+        import asyncio  # not available in Python 2, but neither are coroutine functions
+        loop = asyncio.new_event_loop()
+        try:
+            yield loop.run_until_complete(function(*args, **kwargs))
+        finally:
+            loop.close()
+
+    if isinstance(function, Routine):
+        return function
+    if iscoroutinefunction(function):
+        return routine(coroutine_pseudocore)
+    return Routine(function, plain=True)
+
+
+def iscoroutinefunction(function):
+    """
+    Check whether the function is a coroutine function (defined with `async def`).
 
-    return function if isinstance(function, Routine) else routine(pseudocore)
+    Always returns $False in Python versions that do not support coroutine functions.
+
+    Args:
+        function (Callable[Any...]) - a function to examine
+
+    Returns:
+        Boolean
+    """
+    checker = getattr(inspect, "iscoroutinefunction", None)
+    return checker is not None and checker(function)
 
 
 def routine(core):
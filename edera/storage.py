@@ -29,6 +29,23 @@ class Storage(object):
             StorageOperationError if something went wrong
         """
 
+    def delete_many(self, requests):
+        """
+        Delete data for several keys at once.
+
+        The default implementation just calls $delete for each request.
+        Override it if your storage can do better.
+
+        Args:
+            requests (Iterable[Tuple[String, Optional[Integer]]]) - (key, till) pairs
+                See $delete for details.
+
+        Raises:
+            StorageOperationError if something went wrong
+        """
+        for key, till in requests:
+            self.delete(key, till=till)
+
     @abc.abstractmethod
     def get(self, key, since=None, limit=None):
         """
@@ -49,6 +66,30 @@ class Storage(object):
             StorageOperationError if something went wrong
         """
 
+    def get_many(self, keys, since=None, limit=None):
+        """
+        Select several latest records for each of the given keys since the specified version.
+
+        The default implementation just calls $get for each key.
+        Override it if your storage can do better.
+
+        Args:
+            keys (Iterable[String]) - keys to select records for
+            since (Optional[Integer]) - a version to start with (including)
+                Default is $None - get all versions.
+            limit (Optional[Integer]) - a maximum number of records to select per key
+                Default is $None - as many as possible.
+
+        Returns:
+            Mapping[String, List[Tuple[Integer, String]]] - records by key
+                See $get for details.
+                Each of the given keys is present in the mapping.
+
+        Raises:
+            StorageOperationError if something went wrong
+        """
+        return {key: self.get(key, since=since, limit=limit) for key in keys}
+
     @abc.abstractmethod
     def put(self, key, value):
         """
@@ -64,3 +105,44 @@ class Storage(object):
         Raises:
             StorageOperationError if something went wrong
         """
+
+    def put_many(self, pairs):
+        """
+        Store several key-value pairs in the storage.
+
+        The default implementation just calls $put for each pair.
+        Override it if your storage can do better.
+
+        Args:
+            pairs (Iterable[Tuple[String, String]]) - key-value pairs
+
+        Returns:
+            List[Integer] - the generated versions (in the order of pairs)
+
+        Raises:
+            StorageOperationError if something went wrong
+        """
+        return [self.put(key, value) for key, value in pairs]
+
+    def scan(self, prefix, latest_only=True):
+        """
+        Select records for all keys that start with the given prefix.
+
+        Keys with no records are omitted.
+
+        Not all storages support this operation.
+
+        Args:
+            prefix (String) - a key prefix
+            latest_only (Boolean) - whether to select only the latest record for each key
+                Default is $True.
+
+        Returns:
+            Mapping[String, List[Tuple[Integer, String]]] - records by key
+                Latest records go first.
+
+        Raises:
+            NotImplementedError if the storage does not support scanning
+            StorageOperationError if something went wrong
+        """
+        raise NotImplementedError
@@ -1,4 +1,7 @@
+from .caching import CachingStorage
 from .embedded import EmbeddedStorage
 from .inmemory import InMemoryStorage
+from .log import LogStorage
 from .mongo import MongoStorage
+from .sharded import ShardedStorage
 from .sqlite import SQLiteStorage
@@ -0,0 +1,140 @@
+import collections
+import threading
+import time
+
+import six
+
+from edera.storage import Storage
+
+
+class CachingStorage(Storage):
+    """
+    A storage that keeps latest records of another storage in memory.
+
+    It remembers the results of $get calls with `limit=1` (including empty ones) along with
+    the records you put, evicting least recently used keys once the capacity is exceeded.
+    Remembered records expire after the specified period of time.
+    Other calls are just forwarded to the base storage.
+
+    Deletions invalidate remembered records, so you can safely operate the storage as long as
+    no one else modifies the base storage at the same time.
+    Otherwise, you may observe stale latest records until they expire.
+
+    This implementation is both thread-safe and fork-safe as long as the base storage is.
+
+    Attributes:
+        base (Storage) - the base storage
+        capacity (Integer) - the maximum number of keys to remember
+        ttl (Optional[TimeDelta]) - the lifetime of remembered records
+        hits (Integer) - the number of look-ups served from memory
+        misses (Integer) - the number of look-ups forwarded to the base storage
+
+    Example:
+        >>> local = CachingStorage(remote, 10000, datetime.timedelta(minutes=5))
+        >>> TargetCacher(local).process(workflow)
+    """
+
+    def __init__(self, base, capacity, ttl=None):
+        """
+        Args:
+            base (Storage) - a base storage
+            capacity (Integer) - a maximum number of keys to remember
+            ttl (Optional[TimeDelta]) - a lifetime of remembered records
+                Default is $None - never expire.
+        """
+        self.base = base
+        self.capacity = capacity
+        self.ttl = ttl
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def delete(self, key, till=None):
+        try:
+            self.base.delete(key, till=till)
+        finally:
+            self.__forget([key])
+
+    def delete_many(self, requests):
+        requests = list(requests)
+        try:
+            self.base.delete_many(requests)
+        finally:
+            self.__forget([key for key, _ in requests])
+
+    def get(self, key, since=None, limit=None):
+        return self.get_many([key], since=since, limit=limit)[key]
+
+    def get_many(self, keys, since=None, limit=None):
+        if limit != 1:
+            return self.base.get_many(keys, since=since, limit=limit)
+        keys = list(keys)
+        result = {}
+        with self.__lock:
+            for key in keys:
+                found, record = self.__recall(key)
+                if found:
+                    result[key] = [] if record is None else [record]
+            self.__hits += len(result)
+            self.__misses += len(keys) - len(result)
+        missing = [key for key in keys if key not in result]
+        if missing:
+            records = self.base.get_many(missing, limit=1)
+            with self.__lock:
+                for key in missing:
+                    result[key] = records[key]
+                    self.__remember(key, records[key][0] if records[key] else None)
+        if since is not None:
+            result = {
+                key: [record for record in records if record[0] >= since]
+                for key, records in six.iteritems(result)
+            }
+        return result
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    def put(self, key, value):
+        return self.put_many([(key, value)])[0]
+
+    def put_many(self, pairs):
+        pairs = list(pairs)
+        versions = self.base.put_many(pairs)
+        with self.__lock:
+            for (key, value), version in zip(pairs, versions):
+                self.__remember(key, (version, value))
+        return versions
+
+    def scan(self, prefix, latest_only=True):
+        return self.base.scan(prefix, latest_only=latest_only)
+
+    def __forget(self, keys):
+        with self.__lock:
+            for key in keys:
+                self.__entries.pop(key, None)
+
+    def __recall(self, key):
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return (False, None)
+        expiration_time, record = entry
+        if expiration_time is not None and time.time() >= expiration_time:
+            return (False, None)
+        self.__entries[key] = entry
+        return (True, record)
+
+    def __remember(self, key, record):
+        found, known_record = self.__recall(key)
+        if found and known_record is not None and (record is None or known_record[0] > record[0]):
+            return
+        self.__entries.pop(key, None)
+        expiration_time = None if self.ttl is None else time.time() + self.ttl.total_seconds()
+        self.__entries[key] = (expiration_time, record)
+        while len(self.__entries) > self.capacity:
+            self.__entries.popitem(last=False)
@@ -32,8 +32,24 @@ class EmbeddedStorage(Storage):
     def delete(self, key, till=None):
         self.__base.delete(self.__prefix + key, till=till)
 
+    def delete_many(self, requests):
+        self.__base.delete_many((self.__prefix + key, till) for key, till in requests)
+
     def get(self, key, since=None, limit=None):
         return self.__base.get(self.__prefix + key, since=since, limit=limit)
 
+    def get_many(self, keys, since=None, limit=None):
+        keys = list(keys)
+        records = self.__base.get_many(
+            [self.__prefix + key for key in keys], since=since, limit=limit)
+        return {key: records[self.__prefix + key] for key in keys}
+
     def put(self, key, value):
         return self.__base.put(self.__prefix + key, value)
+
+    def put_many(self, pairs):
+        return self.__base.put_many((self.__prefix + key, value) for key, value in pairs)
+
+    def scan(self, prefix, latest_only=True):
+        records = self.__base.scan(self.__prefix + prefix, latest_only=latest_only)
+        return {key[len(self.__prefix):]: records[key] for key in records}
@@ -1,5 +1,8 @@
+import bisect
 import collections
+import datetime
 import threading
+import time
 
 from edera.storage import Storage
 
@@ -9,32 +12,114 @@ class InMemoryStorage(Storage):
     A simple in-memory storage.
 
     This implementation is both thread-safe and fork-safe.
+    Batch operations are performed atomically.
+
+    You can limit the amount of data kept by the storage:
+      - $max_versions - only this many latest records are kept for each key
+      - $max_age - records older than that get discarded
+    Old records are discarded during $put calls, expired ones are swept at most once per
+    $PRUNING_INTERVAL.
+
+    Attributes:
+        max_versions (Optional[Integer]) - the maximum number of records to keep per key
+        max_age (Optional[TimeDelta]) - the maximum age of records to keep
+        PRUNING_INTERVAL (TimeDelta) - the minimum interval between sweeps of expired records
     """
 
-    def __init__(self):
+    PRUNING_INTERVAL = datetime.timedelta(seconds=10)
+
+    def __init__(self, max_versions=None, max_age=None):
+        """
+        Args:
+            max_versions (Optional[Integer]) - a maximum number of records to keep per key
+                Default is $None - keep all records.
+            max_age (Optional[TimeDelta]) - a maximum age of records to keep
+                Default is $None - never expire.
+        """
+        assert max_versions is None or max_versions > 0
+        self.max_versions = max_versions
+        self.max_age = max_age
         self.__records = collections.defaultdict(list)
         self.__offsets = collections.defaultdict(int)
+        self.__timestamps = collections.defaultdict(list)
+        self.__pruning_time = time.time()
         self.__lock = threading.Lock()
 
     def delete(self, key, till=None):
         with self.__lock:
-            values = self.__records[key]
-            count = len(values) if till is None else max(till - self.__offsets[key], 0)
-            del values[:count]
-            self.__offsets[key] += count
+            self.__delete(key, till)
+
+    def delete_many(self, requests):
+        with self.__lock:
+            for key, till in requests:
+                self.__delete(key, till)
 
     def get(self, key, since=None, limit=None):
         with self.__lock:
-            since = 0 if since is None else since - self.__offsets[key]
-            values = self.__records[key]
-            count = len(values)
-            limit = count if limit is None else max(limit, 0)
-            return [
-                (index + self.__offsets[key], values[index])
-                for index in range(count - 1, max(since, count - limit) - 1, -1)
-            ]
+            return self.__get(key, since, limit)
+
+    def get_many(self, keys, since=None, limit=None):
+        with self.__lock:
+            return {key: self.__get(key, since, limit) for key in keys}
 
     def put(self, key, value):
         with self.__lock:
-            self.__records[key].append(value)
-            return self.__offsets[key] + len(self.__records[key]) - 1
+            result = self.__put(key, value)
+            self.__prune()
+            return result
+
+    def put_many(self, pairs):
+        with self.__lock:
+            result = [self.__put(key, value) for key, value in pairs]
+            self.__prune()
+            return result
+
+    def scan(self, prefix, latest_only=True):
+        limit = 1 if latest_only else None
+        with self.__lock:
+            return {
+                key: self.__get(key, None, limit)
+                for key in self.__records
+                if key.startswith(prefix) and self.__records[key]
+            }
+
+    def __delete(self, key, till):
+        values = self.__records[key]
+        count = len(values) if till is None else max(till - self.__offsets[key], 0)
+        del values[:count]
+        del self.__timestamps[key][:count]
+        self.__offsets[key] += count
+
+    def __get(self, key, since, limit):
+        since = 0 if since is None else since - self.__offsets[key]
+        values = self.__records[key]
+        count = len(values)
+        limit = count if limit is None else max(limit, 0)
+        return [
+            (index + self.__offsets[key], values[index])
+            for index in range(count - 1, max(since, count - limit) - 1, -1)
+        ]
+
+    def __prune(self):
+        if self.max_age is None:
+            return
+        now = time.time()
+        if now < self.__pruning_time + self.PRUNING_INTERVAL.total_seconds():
+            return
+        self.__pruning_time = now
+        expiration_time = now - self.max_age.total_seconds()
+        for key in list(self.__records):
+            timestamps = self.__timestamps[key]
+            count = bisect.bisect_left(timestamps, expiration_time)
+            self.__delete(key, self.__offsets[key] + count)
+            if not timestamps:
+                del self.__records[key]
+                del self.__timestamps[key]
+
+    def __put(self, key, value):
+        self.__records[key].append(value)
+        self.__timestamps[key].append(time.time())
+        result = self.__offsets[key] + len(self.__records[key]) - 1
+        if self.max_versions is not None:
+            self.__delete(key, result + 1 - self.max_versions)
+        return result
@@ -0,0 +1,397 @@
+import contextlib
+import fcntl
+import json
+import logging
+import mmap
+import os
+import os.path
+import re
+import struct
+import threading
+
+import six
+
+from edera.exceptions import StorageOperationError
+from edera.storage import Storage
+
+
+class LogStorage(Storage):
+    """
+    A log-structured file storage.
+
+    It appends versioned key-value records (and deletion marks) to segment files within a
+    directory and keeps an in-memory index of record offsets.
+    Values are read through memory maps.
+    Versions are global and increase monotonically (even across compactions).
+
+    Compaction rewrites all live records into a fresh segment, drops the old ones, and saves
+    a compact index file that allows to restore the in-memory index quickly.
+    It starts in a background thread once deleted records take up a considerable share of
+    the log.
+    You can also call $compact explicitly.
+
+    Processes coordinate via file locks, so this implementation is both fork- and thread-safe.
+    Appending is cheap, and readers never block each other within different processes.
+
+    Attributes:
+        root (String) - the path to the directory that contains the log
+        segment_size (Integer) - the size of a segment (in bytes) that triggers a rollover
+        compaction_threshold (Real) - the share of garbage in the log that triggers compaction
+        fsync (Boolean) - whether to flush appended records to the disk immediately
+
+    WARNING!
+        Avoid forking while a background compaction is running.
+        See $ProcessWorker's documentation for details.
+    """
+
+    HEADER = struct.Struct(">cqII")  # kind, version, key length, value length
+
+    def __init__(self, root, segment_size=2**26, compaction_threshold=0.5, fsync=False):
+        """
+        Args:
+            root (String) - a path to a directory to keep the log in
+                Gets created if does not exist.
+            segment_size (Integer) - a size of a segment (in bytes) that triggers a rollover
+                Default is 64 MiB.
+                Compaction never starts automatically until the log reaches this size.
+            compaction_threshold (Real) - a share of garbage in the log that triggers compaction
+                Default is 0.5.
+            fsync (Boolean) - whether to flush appended records to the disk immediately
+                Default is $False - leave it to the OS.
+        """
+        self.root = root
+        self.segment_size = segment_size
+        self.compaction_threshold = compaction_threshold
+        self.fsync = fsync
+        self.__states = {}
+        self.__lock = threading.Lock()
+
+    def compact(self):
+        """
+        Rewrite all live records into a fresh segment and drop the old segments.
+
+        Raises:
+            StorageOperationError if something went wrong
+        """
+        with self.__operate(exclusive=True) as state:
+            self.__compact(state)
+
+    def delete(self, key, till=None):
+        self.delete_many([(key, till)])
+
+    def delete_many(self, requests):
+        records = [(b"D", -1 if till is None else till, key, "") for key, till in requests]
+        if not records:
+            return
+        with self.__operate(exclusive=True) as state:
+            self.__append(state, records)
+            if state.size < self.segment_size:
+                return
+            if state.size - state.live >= self.compaction_threshold * state.size:
+                self.__start_compaction(state)
+
+    def get(self, key, since=None, limit=None):
+        return self.get_many([key], since=since, limit=limit)[key]
+
+    def get_many(self, keys, since=None, limit=None):
+        with self.__operate(exclusive=False) as state:
+            return {key: self.__select(state, key, since, limit) for key in keys}
+
+    def put(self, key, value):
+        return self.put_many([(key, value)])[0]
+
+    def put_many(self, pairs):
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        with self.__operate(exclusive=True) as state:
+            versions = [state.counter + 1 + index for index in range(len(pairs))]
+            self.__append(state, [
+                (b"P", version, key, value)
+                for (key, value), version in zip(pairs, versions)
+            ])
+            return versions
+
+    def scan(self, prefix, latest_only=True):
+        limit = 1 if latest_only else None
+        with self.__operate(exclusive=False) as state:
+            return {
+                key: self.__select(state, key, None, limit)
+                for key in state.index
+                if key.startswith(prefix)
+            }
+
+    def __append(self, state, records):
+        if state.offset >= self.segment_size:
+            self.__create_segment(state, state.segment + 1, b"V")
+        data = b"".join(self.__encode(*record) for record in records)
+        descriptor = os.open(self.__get_segment_path(state.segment), os.O_WRONLY | os.O_APPEND)
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(descriptor, data[written:])
+            if self.fsync:
+                os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+        self.__advance(state, state.segment, data)
+
+    def __advance(self, state, segment, data):
+        position = 0
+        while len(data) - position >= self.HEADER.size:
+            kind, version, key_length, value_length = self.HEADER.unpack_from(data, position)
+            key_offset = position + self.HEADER.size
+            value_offset = key_offset + key_length
+            end = value_offset + value_length
+            if end > len(data):
+                break
+            key = data[key_offset:value_offset].decode("UTF-8")
+            if kind != b"D":
+                state.counter = max(state.counter, version)
+            if kind == b"P":
+                entry = (version, segment, state.offset + value_offset, value_length)
+                state.index.setdefault(key, []).append(entry)
+                state.live += end - position
+            elif kind == b"D":
+                entries = state.index.get(key, [])
+                count = 0
+                while count < len(entries) and (version < 0 or entries[count][0] < version):
+                    state.live -= self.HEADER.size + key_length + entries[count][3]
+                    count += 1
+                del entries[:count]
+                if not entries:
+                    state.index.pop(key, None)
+            position = end
+        state.offset += position
+        state.size += position
+        return position
+
+    def __catch_up(self, state, exclusive):
+        segments = self.__list_segments()
+        if state.segment is not None and state.segment not in segments:
+            logging.getLogger(__name__).debug("Log at %r got compacted, reloading", self.root)
+            state.reset()
+        if state.segment is None:
+            if not segments:
+                if exclusive:
+                    self.__create_segment(state, 1, b"C")
+                return
+            if not self.__load_index(state, segments):
+                state.segment, state.offset = self.__find_first_segment(segments), 0
+        for segment in segments:
+            if segment < state.segment:
+                continue
+            if segment > state.segment:
+                state.segment, state.offset = segment, 0
+            path = self.__get_segment_path(segment)
+            with open(path, "rb") as stream:
+                stream.seek(state.offset)
+                data = stream.read()
+            if self.__advance(state, segment, data) < len(data):  # torn by a crash
+                if exclusive and segment == segments[-1]:
+                    with open(path, "r+b") as stream:
+                        stream.truncate(state.offset)
+                break
+
+    def __compact(self, state):
+        segment = state.segment + 1
+        path = self.__get_segment_path(segment)
+        index = {}
+        with open(path + ".tmp", "wb") as stream:
+            header = self.__encode(b"C", state.counter, "", "")
+            stream.write(header)
+            offset = len(header)
+            for key in sorted(state.index):
+                key_length = len(key.encode("UTF-8"))
+                for version, old_segment, old_offset, length in state.index[key]:
+                    value = self.__read(state, old_segment, old_offset, length)
+                    record = self.__encode(b"P", version, key, value)
+                    stream.write(record)
+                    value_offset = offset + self.HEADER.size + key_length
+                    index.setdefault(key, []).append([version, value_offset, length])
+                    offset += len(record)
+            stream.flush()
+            os.fsync(stream.fileno())
+        self.__save_index(segment, offset, state.counter, index)
+        os.rename(path + ".tmp", path)
+        for old_segment in self.__list_segments():
+            if old_segment < segment:
+                os.remove(self.__get_segment_path(old_segment))
+        logging.getLogger(__name__).debug("Compacted log at %r: %d bytes", self.root, offset)
+        state.reset()
+        self.__catch_up(state, True)
+
+    def __create_segment(self, state, segment, kind):
+        path = self.__get_segment_path(segment)
+        data = self.__encode(kind, state.counter, "", "")
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+        try:
+            os.write(descriptor, data)
+        finally:
+            os.close(descriptor)
+        state.segment, state.offset = segment, 0
+        self.__advance(state, segment, data)
+
+    def __encode(self, kind, version, key, value):
+        key = key.encode("UTF-8")
+        value = value.encode("UTF-8")
+        return self.HEADER.pack(kind, version, len(key), len(value)) + key + value
+
+    def __find_first_segment(self, segments):
+        for segment in reversed(segments):
+            with open(self.__get_segment_path(segment), "rb") as stream:
+                header = stream.read(self.HEADER.size)
+            if len(header) == self.HEADER.size and self.HEADER.unpack(header)[0] == b"C":
+                return segment
+        return segments[0]
+
+    def __get_segment_path(self, segment):
+        return os.path.join(self.root, "%016d.log" % segment)
+
+    def __get_state(self):
+        pid = os.getpid()
+        result = self.__states.get(pid)
+        if result is None:
+            with self.__lock:
+                result = self.__states.get(pid)
+                if result is None:
+                    try:
+                        if not os.path.isdir(self.root):
+                            os.makedirs(self.root)
+                        lock_file = open(os.path.join(self.root, "lock"), "a")
+                    except (IOError, OSError) as error:
+                        raise StorageOperationError("failed to open %r: %s" % (self.root, error))
+                    result = self.__states[pid] = LogStorageProcessState(lock_file)
+        return result
+
+    def __list_segments(self):
+        return sorted(
+            int(name[:-4])
+            for name in os.listdir(self.root)
+            if re.match(r"^\d{16}\.log$", name))
+
+    def __load_index(self, state, segments):
+        try:
+            with open(os.path.join(self.root, "index"), "r") as stream:
+                document = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return False
+        segment = document["segment"]
+        if segment not in segments:
+            return False
+        state.counter = document["counter"]
+        state.segment = segment
+        state.offset = state.size = document["offset"]
+        for key, entries in six.iteritems(document["index"]):
+            state.index[key] = [
+                (version, segment, offset, length)
+                for version, offset, length in entries
+            ]
+            state.live += sum(
+                self.HEADER.size + len(key.encode("UTF-8")) + length
+                for _, _, length in entries)
+        return True
+
+    @contextlib.contextmanager
+    def __operate(self, exclusive):
+        state = self.__get_state()
+        with state.lock:
+            try:
+                fcntl.flock(state.lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    self.__catch_up(state, exclusive)
+                    yield state
+                finally:
+                    fcntl.flock(state.lock_file, fcntl.LOCK_UN)
+            except (IOError, OSError, ValueError, struct.error) as error:
+                raise StorageOperationError(
+                    "failed to operate the log at %r: %s" % (self.root, error))
+
+    def __read(self, state, segment, offset, length):
+        mapping = state.mappings.get(segment)
+        if mapping is None or offset + length > len(mapping):
+            if mapping is not None:
+                mapping.close()
+            with open(self.__get_segment_path(segment), "rb") as stream:
+                mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            state.mappings[segment] = mapping
+        return mapping[offset:(offset + length)].decode("UTF-8")
+
+    def __save_index(self, segment, offset, counter, index):
+        path = os.path.join(self.root, "index")
+        with open(path + ".tmp", "w") as stream:
+            document = {"segment": segment, "offset": offset, "counter": counter, "index": index}
+            json.dump(document, stream)
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.rename(path + ".tmp", path)
+
+    def __select(self, state, key, since, limit):
+        result = []
+        for version, segment, offset, length in reversed(state.index.get(key, ())):
+            if limit is not None and len(result) >= limit:
+                break
+            if since is not None and version < since:
+                break
+            result.append((version, self.__read(state, segment, offset, length)))
+        return result
+
+    def __start_compaction(self, state):
+
+        def compact():
+            try:
+                self.compact()
+            except StorageOperationError as error:
+                logging.getLogger(__name__).warning("Failed to compact %r: %s", self.root, error)
+            finally:
+                state.compacting = False
+
+        if state.compacting:
+            return
+        state.compacting = True
+        thread = threading.Thread(target=compact, name="compactor")
+        thread.daemon = True
+        thread.start()
+
+
+class LogStorageProcessState(object):
+    """
+    A per-process state of a $LogStorage.
+
+    Attributes:
+        lock_file (File) - the file used for inter-process locking
+        lock (RLock) - the lock that guards the state within the process
+        compacting (Boolean) - whether a background compaction is running
+        index (Mapping[String, List[Tuple[Integer, Integer, Integer, Integer]]]) - the index
+                of (version, segment, offset, length) tuples by key ordered by version
+        counter (Integer) - the last known version
+        segment (Optional[Integer]) - the last segment read
+        offset (Integer) - the position within the last segment read
+        size (Integer) - the total size of segments read
+        live (Integer) - the total size of live records
+        mappings (Mapping[Integer, mmap.mmap]) - the memory maps by segment
+    """
+
+    def __init__(self, lock_file):
+        """
+        Args:
+            lock_file (File) - a file to use for inter-process locking
+        """
+        self.lock_file = lock_file
+        self.lock = threading.RLock()
+        self.compacting = False
+        self.reset()
+
+    def reset(self):
+        """
+        Forget everything known about the log.
+        """
+        for mapping in six.itervalues(getattr(self, "mappings", {})):
+            mapping.close()
+        self.index = {}
+        self.counter = 0
+        self.segment = None
+        self.offset = 0
+        self.size = 0
+        self.live = 0
+        self.mappings = {}
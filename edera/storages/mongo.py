@@ -1,5 +1,11 @@
+import datetime
+import logging
+import os
+import re
+import threading
 import time
 
+import bson.son
 import pymongo
 import pymongo.errors
 
@@ -17,26 +23,53 @@ class MongoStorage(Storage):
     client correctly.
     Please, consider using $MongoManager to start/stop client connections.
 
+    Versions are generated by a per-process $MongoVersionClock and protected by a unique index.
+    Whenever another client takes a version first, the conflicting records get re-inserted with
+    fresh versions.
+    Duplicate records left in the collection by older setups get discarded (all but one) when the
+    index is created.
+
+    You can limit the amount of data kept by the storage:
+      - $max_versions - only this many latest records are kept for each key
+      - $max_age - records older than that get discarded
+    Old records are discarded after each $put call, expired ones are removed by MongoDB itself
+    (using a TTL index).
+    Latest records are picked on the server, so $get_many limits and $max_versions above 1 require
+    MongoDB 5.2 or newer (for "$firstN").
+
     Attributes:
         mongo (Lazy[pymongo.MongoClient]) - the lazy MongoDB client
         database (pymongo.database.Database) - the MongoDB database used
         collection (pymongo.collection.Collection) - the MongoDB collection used
+        max_versions (Optional[Integer]) - the maximum number of records to keep per key
+        max_age (Optional[TimeDelta]) - the maximum age of records to keep
 
     See also:
         $MongoManager
     """
 
-    def __init__(self, mongo, database, collection):
+    MAX_INSERT_ATTEMPTS = 10
+
+    def __init__(self, mongo, database, collection, max_versions=None, max_age=None):
         """
         Args:
             mongo (Lazy[pymongo.MongoClient]) - a lazy MongoDB client
             database (String) - the name of a MongoDB database to use
             collection (String) - the name of a MongoDB collection to use
+            max_versions (Optional[Integer]) - a maximum number of records to keep per key
+                Default is $None - keep all records.
+            max_age (Optional[TimeDelta]) - a maximum age of records to keep
+                Default is $None - never expire.
         """
+        assert max_versions is None or max_versions > 0
         self.mongo = mongo
+        self.max_versions = max_versions
+        self.max_age = max_age
         self.__database = database
         self.__collection = collection
         self.__indexed = False
+        self.__clocks = {}
+        self.__lock = threading.Lock()
 
     @property
     def collection(self):
@@ -44,7 +77,12 @@ class MongoStorage(Storage):
             read_concern=pymongo.read_concern.ReadConcern("majority"),
             write_concern=pymongo.write_concern.WriteConcern("majority"))
         if not self.__indexed:
-            result.create_index([("key", pymongo.ASCENDING), ("version", pymongo.ASCENDING)])
+            self.__create_index(
+                result, [("key", pymongo.ASCENDING), ("version", pymongo.ASCENDING)], unique=True)
+            if self.max_age is not None:
+                self.__create_index(
+                    result, [("created", pymongo.ASCENDING)],
+                    expireAfterSeconds=int(self.max_age.total_seconds()))
             self.__indexed = True
         return result
 
@@ -53,11 +91,20 @@ class MongoStorage(Storage):
         return self.mongo.instance[self.__database]
 
     def delete(self, key, till=None):
-        selector = {"key": key}
-        if till is not None:
-            selector.update({"version": {"$lt": till}})
         try:
-            self.collection.delete_many(selector)
+            self.collection.delete_many(self.__select(key, till=till))
+        except pymongo.errors.PyMongoError as error:
+            raise StorageOperationError("failed to write to the MongoDB collection: %s" % error)
+
+    def delete_many(self, requests):
+        operations = [
+            pymongo.DeleteMany(self.__select(key, till=till))
+            for key, till in requests
+        ]
+        if not operations:
+            return
+        try:
+            self.collection.bulk_write(operations, ordered=False)
         except pymongo.errors.PyMongoError as error:
             raise StorageOperationError("failed to write to the MongoDB collection: %s" % error)
 
@@ -74,15 +121,216 @@ class MongoStorage(Storage):
             documents = list(documents)
         except pymongo.errors.PyMongoError as error:
             raise StorageOperationError("failed to read from the MongoDB collection: %s" % error)
+        if documents:
+            self.__get_clock().observe(documents[0]["version"])
         return [(version, value) for _, version, value in map(self.__decode_document, documents)]
 
+    def get_many(self, keys, since=None, limit=None):
+        result = {key: [] for key in keys}
+        if not result or limit == 0:
+            return result
+        selector = {"key": {"$in": list(result)}}
+        if since is not None:
+            selector.update({"version": {"$gte": since}})
+        try:
+            if limit is None:
+                documents = self.collection.find(selector).sort(
+                    [("key", pymongo.ASCENDING), ("version", pymongo.DESCENDING)])
+                for key, version, value in map(self.__decode_document, documents):
+                    result[key].append((version, value))
+            else:
+                for key, records in self.__find_latest(selector, ["version", "value"], limit):
+                    result[key] = [(record["version"], record["value"]) for record in records]
+        except pymongo.errors.PyMongoError as error:
+            raise StorageOperationError("failed to read from the MongoDB collection: %s" % error)
+        self.__observe(result)
+        return result
+
     def put(self, key, value):
+        return self.put_many([(key, value)])[0]
+
+    def put_many(self, pairs):
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        clock = self.__get_clock()
+        result = clock.tick(len(pairs))
+        start = 0
+        for _ in range(self.MAX_INSERT_ATTEMPTS):
+            try:
+                created = datetime.datetime.utcnow()
+                self.collection.insert_many([
+                    {"key": key, "version": version, "value": value, "created": created}
+                    for (key, value), version in zip(pairs[start:], result[start:])
+                ])
+                break
+            except pymongo.errors.BulkWriteError as error:
+                if not error.details.get("writeErrors"):
+                    raise StorageOperationError(
+                        "failed to write to the MongoDB collection: %s"
+                        % error.details.get("writeConcernErrors"))
+                failure = error.details["writeErrors"][0]
+                if failure["code"] != 11000:  # not a duplicate key error
+                    raise StorageOperationError(
+                        "failed to write to the MongoDB collection: %s" % failure["errmsg"])
+                clock.observe(failure["op"]["version"])  # taken by a client that is ahead of us
+                start += failure["index"]
+                result[start:] = clock.tick(len(pairs) - start)
+            except pymongo.errors.PyMongoError as error:
+                raise StorageOperationError(
+                    "failed to write to the MongoDB collection: %s" % error)
+        else:
+            raise StorageOperationError("failed to allocate unique versions for the records")
+        if self.max_versions is not None:
+            try:
+                self.__trim({key for key, _ in pairs})
+            except pymongo.errors.PyMongoError as error:  # the records are stored anyway
+                logging.getLogger(__name__).warning(
+                    "Failed to discard old records in %r: %s", self.__collection, error)
+        return result
+
+    def scan(self, prefix, latest_only=True):
+        selector = {"key": {"$regex": "^" + re.escape(prefix)}}
         try:
-            version = int(time.time() * 10**9)
-            self.collection.insert_one({"key": key, "version": version, "value": value})
-            return version
+            if latest_only:
+                documents = self.collection.aggregate([
+                    {"$match": selector},
+                    {"$sort": {"key": pymongo.ASCENDING, "version": pymongo.DESCENDING}},
+                    {
+                        "$group": {
+                            "_id": "$key",
+                            "key": {"$first": "$key"},
+                            "version": {"$first": "$version"},
+                            "value": {"$first": "$value"},
+                        },
+                    },
+                ])
+            else:
+                documents = self.collection.find(selector).sort(
+                    [("key", pymongo.ASCENDING), ("version", pymongo.DESCENDING)])
+            result = {}
+            for key, version, value in map(self.__decode_document, documents):
+                result.setdefault(key, []).append((version, value))
         except pymongo.errors.PyMongoError as error:
-            raise StorageOperationError("failed to write to the MongoDB collection: %s" % error)
+            raise StorageOperationError("failed to read from the MongoDB collection: %s" % error)
+        self.__observe(result)
+        return result
+
+    def __create_index(self, collection, keys, **options):
+        try:
+            collection.create_index(keys, **options)
+        except pymongo.errors.OperationFailure as error:
+            if error.code == 11000 and options.get("unique"):  # duplicates left by older setups
+                self.__deduplicate(collection, [field for field, _ in keys])
+            elif error.code in (85, 86):  # IndexOptionsConflict, IndexKeySpecsConflict
+                collection.drop_index(keys)  # an index with other options left by older setups
+            else:
+                raise
+            collection.create_index(keys, **options)
+
+    def __deduplicate(self, collection, fields):
+        groups = collection.aggregate([
+            {
+                "$group": {
+                    "_id": {field: "$" + field for field in fields},
+                    "ids": {"$push": "$_id"},
+                },
+            },
+            {"$match": {"ids.1": {"$exists": True}}},
+        ], allowDiskUse=True)
+        operations = [pymongo.DeleteMany({"_id": {"$in": group["ids"][1:]}}) for group in groups]
+        if operations:
+            logging.getLogger(__name__).warning(
+                "Discarding duplicate records of %d (%s) pairs in %s",
+                len(operations), ", ".join(fields), collection.full_name)
+            collection.bulk_write(operations, ordered=False)
 
     def __decode_document(self, document):
         return (document["key"], document["version"], document["value"])
+
+    def __find_latest(self, selector, fields, count):
+        record = {field: "$" + field for field in fields}
+        if count == 1:
+            accumulator = {"$first": record}
+        else:
+            accumulator = {"$firstN": {"input": record, "n": count}}
+        groups = self.collection.aggregate([
+            {"$match": selector},
+            {"$sort": bson.son.SON([("key", pymongo.ASCENDING), ("version", pymongo.DESCENDING)])},
+            {"$group": {"_id": "$key", "latest": accumulator}},
+        ], allowDiskUse=True)
+        for group in groups:
+            yield group["_id"], ([group["latest"]] if count == 1 else group["latest"])
+
+    def __get_clock(self):
+        pid = os.getpid()
+        result = self.__clocks.get(pid)
+        if result is None:
+            with self.__lock:
+                result = self.__clocks.get(pid)
+                if result is None:
+                    result = self.__clocks[pid] = MongoVersionClock()
+        return result
+
+    def __observe(self, records):
+        versions = [records[key][0][0] for key in records if records[key]]
+        if versions:
+            self.__get_clock().observe(max(versions))
+
+    def __trim(self, keys):
+        selector = {"key": {"$in": list(keys)}}
+        operations = [
+            pymongo.DeleteMany(self.__select(key, records[-1]["version"]))
+            for key, records in self.__find_latest(selector, ["version"], self.max_versions)
+            if len(records) == self.max_versions  # otherwise, nothing to discard
+        ]
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    def __select(self, key, till=None):
+        result = {"key": key}
+        if till is not None:
+            result.update({"version": {"$lt": till}})
+        return result
+
+
+class MongoVersionClock(object):
+    """
+    A hybrid logical clock that generates versions for a $MongoStorage.
+
+    Versions are based on the current time (in nanoseconds), but never go below the versions
+    generated or observed before.
+    This keeps them strictly increasing within a process even if the system clock steps back, and
+    puts a version written after reading another one (possibly from a host with a skewed clock)
+    after it.
+    """
+
+    def __init__(self):
+        self.__latest = 0
+        self.__lock = threading.Lock()
+
+    def observe(self, version):
+        """
+        Advance the clock past the version.
+
+        Args:
+            version (Integer) - a version generated elsewhere
+        """
+        with self.__lock:
+            self.__latest = max(self.__latest, version)
+
+    def tick(self, count=1):
+        """
+        Generate consecutive fresh versions.
+
+        Args:
+            count (Integer) - a number of versions to generate
+                Default is 1.
+
+        Returns:
+            List[Integer] - the versions in ascending order
+        """
+        with self.__lock:
+            start = max(int(time.time() * 10**9), self.__latest + 1)
+            self.__latest = start + count - 1
+        return list(range(start, start + count))
@@ -0,0 +1,114 @@
+import binascii
+import threading
+
+import six
+
+from edera.helpers import CurrentException
+from edera.storage import Storage
+
+
+class ShardedStorage(Storage):
+    """
+    A storage that distributes keys among several other storages (shards).
+
+    Each key is assigned to a shard by a stable hash function, so all records of a key live
+    within the same shard.
+    Batch operations are split by shard and performed in parallel (one thread per shard).
+
+    This way you can spread the write load among several databases/files.
+
+    The shard list must stay the same for the whole lifetime of the data.
+
+    This implementation is both thread-safe and fork-safe as long as all shards are.
+
+    Attributes:
+        shards (List[Storage]) - the shards
+
+    Example:
+        >>> shards = [SQLiteStorage("monitor-%d.db" % index) for index in range(4)]
+        >>> monitor = ShardedStorage(shards)
+    """
+
+    def __init__(self, shards):
+        """
+        Args:
+            shards (Iterable[Storage]) - shards to distribute keys among
+        """
+        self.shards = list(shards)
+        assert self.shards
+
+    def delete(self, key, till=None):
+        self.__locate(key).delete(key, till=till)
+
+    def delete_many(self, requests):
+        groups = self.__group(requests, key=(lambda request: request[0]))
+        self.__fan_out(lambda shard, group: shard.delete_many(group), groups)
+
+    def get(self, key, since=None, limit=None):
+        return self.__locate(key).get(key, since=since, limit=limit)
+
+    def get_many(self, keys, since=None, limit=None):
+        groups = self.__group(keys)
+        result = {}
+        for records in six.itervalues(self.__fan_out(
+                lambda shard, group: shard.get_many(group, since=since, limit=limit), groups)):
+            result.update(records)
+        return result
+
+    def put(self, key, value):
+        return self.__locate(key).put(key, value)
+
+    def put_many(self, pairs):
+        pairs = list(pairs)
+        indices = self.__group(range(len(pairs)), key=(lambda index: pairs[index][0]))
+        groups = {
+            shard: [pairs[index] for index in indices[shard]]
+            for shard in indices
+        }
+        versions = self.__fan_out(lambda shard, group: shard.put_many(group), groups)
+        result = [None] * len(pairs)
+        for shard in indices:
+            for index, version in zip(indices[shard], versions[shard]):
+                result[index] = version
+        return result
+
+    def scan(self, prefix, latest_only=True):
+        groups = {shard: None for shard in range(len(self.shards))}
+        result = {}
+        for records in six.itervalues(self.__fan_out(
+                lambda shard, _: shard.scan(prefix, latest_only=latest_only), groups)):
+            result.update(records)
+        return result
+
+    def __fan_out(self, function, groups):
+
+        def run(shard):
+            try:
+                results[shard] = function(self.shards[shard], groups[shard])
+            except Exception:
+                errors.append(CurrentException())
+
+        results = {}
+        errors = []
+        threads = [threading.Thread(target=run, args=(shard,)) for shard in list(groups)[1:]]
+        for thread in threads:
+            thread.start()
+        for shard in list(groups)[:1]:
+            run(shard)
+        for thread in threads:
+            thread.join()
+        if errors:
+            errors[0].reraise()
+        return results
+
+    def __group(self, elements, key=(lambda element: element)):
+        result = {}
+        for element in elements:
+            result.setdefault(self.__hash(key(element)), []).append(element)
+        return result
+
+    def __hash(self, key):
+        return (binascii.crc32(key.encode("UTF-8")) & 0xffffffff) % len(self.shards)
+
+    def __locate(self, key):
+        return self.shards[self.__hash(key)]
@@ -1,8 +1,10 @@
 import collections
 import contextlib
+import datetime
 import os
 import sqlite3
 import threading
+import time
 
 from edera.exceptions import StorageOperationError
 from edera.storage import Storage
@@ -17,87 +19,308 @@ class SQLiteStorage(Storage):
 
     This implementation is fork- and thread-safe.
     However, not very efficient if you have too many operating clients (due to DB locking).
+    Batch operations are performed within a single transaction.
+
+    Each process keeps a bounded pool of connections shared by its threads.
+
+    In the group commit mode concurrent $put calls are collected for a short period of time and
+    then get committed within a single transaction.
+    This trades a bit of latency for much higher write throughput.
+
+    Space freed by deletions gets reclaimed according to the vacuuming policy:
+      - "full" - rebuild the whole database after each deletion (slow on large databases)
+      - "incremental" - release up to $vacuum_budget free pages after each deletion
+      - $None - never release free pages (SQLite will reuse them anyway)
+    Switching an existing database to the incremental mode rebuilds it once.
+
+    You can limit the amount of data kept by the storage:
+      - $max_versions - only this many latest records are kept for each key
+      - $max_age - records older than that get discarded
+    Old records are discarded within $put transactions, expired ones are swept by each process at
+    most once per $PRUNING_INTERVAL.
+    Space freed by discarded records gets released only by the "incremental" vacuuming policy,
+    since rebuilding the whole database on each $put would be way too slow.
 
     Attributes:
         database (String) - the path to the database
         table (String) - the name of the table within the database
+        pool_size (Integer) - the maximum number of connections per process
+        commit_delay (Optional[TimeDelta]) - the period of time to collect $put calls for
+            $None means that the group commit mode is disabled.
+        vacuum (Optional[String]) - the vacuuming policy
+        vacuum_budget (Integer) - the maximum number of pages to release after each deletion
+            Used only by the "incremental" vacuuming policy.
+        max_versions (Optional[Integer]) - the maximum number of records to keep per key
+        max_age (Optional[TimeDelta]) - the maximum age of records to keep
+        PRUNING_INTERVAL (TimeDelta) - the minimum interval between sweeps of expired records
     """
 
-    def __init__(self, database, table="master"):
+    PRUNING_INTERVAL = datetime.timedelta(minutes=1)
+
+    def __init__(self, database, table="master", pool_size=8, commit_delay=None,
+                 synchronous=None, mmap_size=None, cache_size=None,
+                 vacuum="incremental", vacuum_budget=1000, max_versions=None, max_age=None):
         """
         Args:
             database (String) - a path to an SQLite database
             table (Optional[String]) - a table name
                 Default is "master".
+            pool_size (Integer) - a maximum number of connections per process
+                Default is 8.
+            commit_delay (Optional[TimeDelta]) - a period of time to collect $put calls for
+                Default is $None - commit each call separately.
+            synchronous (Optional[String]) - a value for the "synchronous" pragma
+                Default is $None - use the SQLite default.
+                Consider "NORMAL" if you can afford losing latest records on power failures.
+            mmap_size (Optional[Integer]) - a value for the "mmap_size" pragma (in bytes)
+                Default is $None - use the SQLite default.
+            cache_size (Optional[Integer]) - a value for the "cache_size" pragma
+                Default is $None - use the SQLite default.
+            vacuum (Optional[String]) - a vacuuming policy
+                Either "full", "incremental", or $None.
+                Default is "incremental".
+            vacuum_budget (Integer) - a maximum number of pages to release after each deletion
+                Default is 1000.
+            max_versions (Optional[Integer]) - a maximum number of records to keep per key
+                Default is $None - keep all records.
+            max_age (Optional[TimeDelta]) - a maximum age of records to keep
+                Default is $None - never expire.
         """
+        assert pool_size > 0
+        assert vacuum in ("full", "incremental", None)
+        assert max_versions is None or max_versions > 0
         self.database = database
         self.table = table
-        self.__local = collections.defaultdict(threading.local)
+        self.pool_size = pool_size
+        self.commit_delay = commit_delay
+        self.vacuum = vacuum
+        self.vacuum_budget = vacuum_budget
+        self.max_versions = max_versions
+        self.max_age = max_age
+        self.__pragmas = [
+            ("synchronous", synchronous),
+            ("mmap_size", mmap_size),
+            ("cache_size", cache_size),
+        ]
+        self.__queries = {
+            "delete": "DELETE FROM %s WHERE key = ?" % table,
+            "delete till": "DELETE FROM %s WHERE key = ? AND version < ?" % table,
+            "expire": "DELETE FROM %s WHERE created < ?" % table,
+            "insert": "INSERT INTO %s (key, value, created) VALUES (?, ?, ?)" % table,
+            "select": (
+                "SELECT version, value FROM %s WHERE key = ? "
+                "ORDER BY version DESC LIMIT ?" % table),
+            "select since": (
+                "SELECT version, value FROM %s WHERE key = ? AND version >= ? "
+                "ORDER BY version DESC LIMIT ?" % table),
+            # SQLite takes bare columns from the row that holds the maximum
+            "scan latest": (
+                "SELECT key, MAX(version), value FROM %s WHERE key >= ? AND key < ? "
+                "GROUP BY key" % table),
+            "scan latest unbounded": (
+                "SELECT key, MAX(version), value FROM %s WHERE key >= ? GROUP BY key" % table),
+            "scan": (
+                "SELECT key, version, value FROM %s WHERE key >= ? AND key < ? "
+                "ORDER BY key, version DESC" % table),
+            "scan unbounded": (
+                "SELECT key, version, value FROM %s WHERE key >= ? "
+                "ORDER BY key, version DESC" % table),
+            "trim": (
+                "DELETE FROM %s WHERE key = ? AND version < ("
+                "SELECT version FROM %s WHERE key = ? ORDER BY version DESC LIMIT 1 OFFSET ?)"
+                % (table, table)),
+        }
+        self.__states = {}
         self.__lock = threading.Lock()
 
     def delete(self, key, till=None):
-        query = "DELETE FROM %s WHERE key = ?" % self.table
-        arguments = (key,)
-        if till is not None:
-            query += " AND version < ?"
-            arguments += (till,)
+        self.delete_many([(key, till)])
+
+    def delete_many(self, requests):
+        requests = list(requests)
+        if not requests:
+            return
+        arguments = [(key,) for key, till in requests if till is None]
+        bounded_arguments = [(key, till) for key, till in requests if till is not None]
         with self.__connect() as cursor:
-            cursor.execute(query, arguments)
-            cursor.connection.isolation_level = None  # prevent auto-commit
-            cursor.execute("VACUUM")
-            cursor.connection.isolation_level = ""
+            if arguments:
+                cursor.executemany(self.__queries["delete"], arguments)
+            if bounded_arguments:
+                cursor.executemany(self.__queries["delete till"], bounded_arguments)
+            self.__reclaim_space(cursor)
 
     def get(self, key, since=None, limit=None):
-        query = "SELECT version, value FROM %s WHERE key = ?" % self.table
-        arguments = (key,)
-        if since is not None:
-            query += " AND version >= ?"
-            arguments += (since,)
-        query += " ORDER BY version DESC"
-        if limit is not None:
-            query += " LIMIT %d" % limit
         with self.__connect() as cursor:
-            return cursor.execute(query, arguments).fetchall()
+            return self.__select(cursor, key, since, limit)
+
+    def get_many(self, keys, since=None, limit=None):
+        with self.__connect() as cursor:
+            return {key: self.__select(cursor, key, since, limit) for key in keys}
 
     def put(self, key, value):
-        query = "INSERT INTO %s (key, value) VALUES (?, ?)" % self.table
-        arguments = (key, value)
+        if self.commit_delay is None:
+            return self.put_many([(key, value)])[0]
+        state = self.__get_state()
+        with state.lock:
+            batch = state.batch
+            leading = batch is None
+            if leading:
+                batch = state.batch = SQLiteBatch()
+            index = len(batch.pairs)
+            batch.pairs.append((key, value))
+        if leading:
+            time.sleep(self.commit_delay.total_seconds())
+            with state.lock:
+                state.batch = None
+            try:
+                batch.versions = self.put_many(batch.pairs)
+            except StorageOperationError as error:
+                batch.error = error
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.versions[index]
+
+    def put_many(self, pairs):
+        result = []
+        with self.__connect() as cursor:
+            now = time.time()
+            keys = set()
+            for key, value in pairs:
+                cursor.execute(self.__queries["insert"], (key, value, now))
+                result.append(cursor.lastrowid)
+                keys.add(key)
+            if self.__prune(cursor, keys, now) and self.vacuum == "incremental":
+                self.__reclaim_space(cursor)
+        return result
+
+    def scan(self, prefix, latest_only=True):
+        query = "scan latest" if latest_only else "scan"
+        arguments = (prefix,)
+        if prefix:
+            arguments += (prefix[:-1] + chr(ord(prefix[-1]) + 1),)
+        else:
+            query += " unbounded"
+        result = {}
         with self.__connect() as cursor:
-            cursor.execute(query, arguments)
-            return cursor.lastrowid
+            for key, version, value in cursor.execute(self.__queries[query], arguments):
+                result.setdefault(key, []).append((version, value))
+        return result
 
     @contextlib.contextmanager
     def __connect(self):
-        pid = os.getpid()
-        with self.__lock:
-            if not hasattr(self.__local[pid], "connection"):
+        state = self.__get_state()
+        state.semaphore.acquire()
+        try:
+            try:
+                connection = state.connections.pop()
+            except IndexError:
                 try:
                     connection = self.__create_connection()
                 except sqlite3.Error as error:
                     raise StorageOperationError(
                         "failed to connect to %r: %s" % (self.database, error))
-                self.__local[pid].connection = connection
-        connection = self.__local[pid].connection
-        try:
-            with self.__use(connection) as cursor:
-                yield cursor
-        except sqlite3.Error as error:
-            raise StorageOperationError("failed to execute a query: %s" % error)
+            try:
+                with self.__use(connection) as cursor:
+                    yield cursor
+            except sqlite3.Error as error:
+                raise StorageOperationError("failed to execute a query: %s" % error)
+            finally:
+                state.connections.append(connection)
+        finally:
+            state.semaphore.release()
 
     def __create_connection(self):
-        result = sqlite3.connect(self.database, timeout=30, detect_types=True)
+        result = sqlite3.connect(
+            self.database, timeout=30, detect_types=True, check_same_thread=False)
+        if self.vacuum == "incremental":
+            with self.__use(result) as cursor:
+                if cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:  # not INCREMENTAL
+                    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                    self.__run_outside_transaction(cursor, "VACUUM")
         with self.__use(result) as cursor:
             cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma, value in self.__pragmas:
+                if value is not None:
+                    cursor.execute("PRAGMA %s=%s" % (pragma, value))
         with self.__use(result) as cursor:
             cursor.execute(
-                "CREATE TABLE IF NOT EXISTS %s (key TEXT, version INTEGER PRIMARY KEY, value TEXT)"
+                "CREATE TABLE IF NOT EXISTS %s "
+                "(key TEXT, version INTEGER PRIMARY KEY, value TEXT, created REAL)"
                 % self.table)
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS %s ON %s (key, version)"
                 % (self.table + "__index", self.table))
+        if "created" not in self.__get_columns(result):  # the table was created by older versions
+            with self.__use(result) as cursor:
+                try:
+                    cursor.execute("ALTER TABLE %s ADD COLUMN created REAL" % self.table)
+                    cursor.execute("UPDATE %s SET created = ?" % self.table, (time.time(),))
+                except sqlite3.OperationalError:
+                    if "created" not in self.__get_columns(result):  # not a concurrent migration
+                        raise
+        if self.max_age is not None:
+            with self.__use(result) as cursor:
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS %s ON %s (created)"
+                    % (self.table + "__created_index", self.table))
         result.text_factory = lambda data: data.decode("ASCII")
         return result
 
+    def __get_columns(self, connection):
+        with self.__use(connection) as cursor:
+            return [row[1] for row in cursor.execute("PRAGMA table_info(%s)" % self.table)]
+
+    def __get_state(self):
+        pid = os.getpid()
+        result = self.__states.get(pid)
+        if result is None:
+            with self.__lock:
+                result = self.__states.get(pid)
+                if result is None:
+                    result = self.__states[pid] = SQLiteProcessState(self.pool_size)
+        return result
+
+    def __prune(self, cursor, keys, now):
+        result = False
+        if self.max_versions is not None:
+            for key in keys:
+                cursor.execute(self.__queries["trim"], (key, key, self.max_versions - 1))
+                result = result or cursor.rowcount > 0
+        if self.max_age is not None:
+            state = self.__get_state()
+            with state.lock:
+                due = now >= state.pruning_time + self.PRUNING_INTERVAL.total_seconds()
+                if due:
+                    state.pruning_time = now
+            if due:
+                cursor.execute(self.__queries["expire"], (now - self.max_age.total_seconds(),))
+                result = result or cursor.rowcount > 0
+        return result
+
+    def __reclaim_space(self, cursor):
+        if self.vacuum == "full":
+            self.__run_outside_transaction(cursor, "VACUUM")
+        elif self.vacuum == "incremental":
+            self.__run_outside_transaction(
+                cursor, "PRAGMA incremental_vacuum(%d)" % self.vacuum_budget)
+
+    def __run_outside_transaction(self, cursor, query):
+        cursor.connection.isolation_level = None  # prevent auto-commit
+        try:
+            cursor.executescript(query)  # steps through to the end, unlike "execute"
+        finally:
+            cursor.connection.isolation_level = ""
+
+    def __select(self, cursor, key, since, limit):
+        limit = -1 if limit is None else limit  # negative values mean "no limit"
+        if since is None:
+            return cursor.execute(self.__queries["select"], (key, limit)).fetchall()
+        return cursor.execute(self.__queries["select since"], (key, since, limit)).fetchall()
+
     @contextlib.contextmanager
     def __use(self, connection):
         with connection:
@@ -106,3 +329,45 @@ class SQLiteStorage(Storage):
                 yield cursor
             finally:
                 cursor.close()
+
+
+class SQLiteProcessState(object):
+    """
+    A per-process state of an $SQLiteStorage.
+
+    Attributes:
+        connections (Deque[sqlite3.Connection]) - idle connections
+        semaphore (Semaphore) - the semaphore that limits the number of active connections
+        lock (Lock) - the lock that guards the current batch and the pruning time
+        batch (Optional[SQLiteBatch]) - the batch being collected at the moment
+        pruning_time (Float) - the time of the latest sweep of expired records
+    """
+
+    def __init__(self, pool_size):
+        """
+        Args:
+            pool_size (Integer) - a maximum number of active connections
+        """
+        self.connections = collections.deque()
+        self.semaphore = threading.BoundedSemaphore(pool_size)
+        self.lock = threading.Lock()
+        self.batch = None
+        self.pruning_time = time.time()
+
+
+class SQLiteBatch(object):
+    """
+    A batch of $put calls to commit in the group commit mode.
+
+    Attributes:
+        pairs (List[Tuple[String, String]]) - the key-value pairs to store
+        versions (Optional[List[Integer]]) - the generated versions
+        error (Optional[StorageOperationError]) - the error that occurred during the commit
+        done (Event) - the event that gets set once the batch is committed
+    """
+
+    def __init__(self):
+        self.pairs = []
+        self.versions = None
+        self.error = None
+        self.done = threading.Event()
@@ -1,5 +1,6 @@
 from edera.helpers import phony
 from edera.helpers import Phony
+from edera.nameable import ImmutablyNameable
 from edera.nameable import Nameable
 
 
@@ -58,12 +59,14 @@ class Task(Nameable):
         return self
 
 
-class TaskWrapper(Task):
+class TaskWrapper(Task, ImmutablyNameable):
     """
     A task wrapper.
 
     Delegates all its method calls to the base task object.
     Allows you to override (wrap) any subset of task methods/properties.
+
+    The name of the wrapper must never change, since it gets remembered (see $ImmutablyNameable).
     """
 
     def __init__(self, base):
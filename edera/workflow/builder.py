@@ -1,3 +1,6 @@
+import collections
+import threading
+
 from edera.graph import Graph
 from edera.heap import Heap
 from edera.requisites import Include
@@ -9,12 +12,45 @@ class WorkflowBuilder(object):
 
     Transforms a task into a workflow by satisfying its requisite.
 
+    The builder can remember the requisites it evaluates for each task (by name) and replay them
+    in subsequent builds instead of evaluating task requisites once again.
+    This saves a lot of time when the same workflow gets re-built over and over again (e.g. by
+    a daemon), but requires requisites of equally named tasks to stay the same.
+    Least recently used tasks get forgotten once the $cache_capacity is exceeded.
+
+    This implementation is thread-safe.
+
+    Attributes:
+        cache_capacity (Optional[Integer]) - the maximum number of tasks to remember
+                requisites for
+        hits (Integer) - the number of requisites replayed from memory
+        misses (Integer) - the number of requisites evaluated
+
+    Example:
+        >>> builder = WorkflowBuilder(cache_capacity=100000)
+        >>> workflow = builder.build(root)
+        >>> workflow = builder.build(root)  # no requisite gets evaluated this time
+
     See also:
         $Requisite
         $Task
         $WorkflowProcessor
     """
 
+    def __init__(self, cache_capacity=None):
+        """
+        Args:
+            cache_capacity (Optional[Integer]) - a maximum number of tasks to remember
+                    requisites for
+                Default is $None - don't remember anything.
+        """
+        assert cache_capacity is None or cache_capacity > 0
+        self.cache_capacity = cache_capacity
+        self.__expansions = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
     def build(self, task):
         """
         Transform the task into a workflow.
@@ -33,6 +69,8 @@ class WorkflowBuilder(object):
         while heap or stack:
             if not stack or heap and heap.top[1].priority > stack[-1][1]:
                 requisitor, requisite = heap.pop()
+                if self.cache_capacity is not None and type(requisite) is Include:
+                    requisite = MemoizedInclude(requisite.task, self.__expand)
                 subrequests = requisite.satisfy(requisitor, result)
                 if subrequests is not None:
                     stack.append((iter(subrequests), requisite.priority))
@@ -48,3 +86,47 @@ class WorkflowBuilder(object):
             request = (requisitor, requisite)
             heap.push(request, request[1].priority)
         return result
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    def __expand(self, include):
+        name = include.task.name
+        with self.__lock:
+            expansion = self.__expansions.pop(name, None)
+            if expansion is not None:
+                self.__expansions[name] = expansion
+                self.__hits += 1
+                return expansion
+            self.__misses += 1
+        expansion = Include.expand(include)
+        with self.__lock:
+            self.__expansions.pop(name, None)
+            self.__expansions[name] = expansion
+            while len(self.__expansions) > self.cache_capacity:
+                self.__expansions.popitem(last=False)
+        return expansion
+
+
+class MemoizedInclude(Include):
+    """
+    An $Include that obtains the requisite of the task from the builder's memory.
+    """
+
+    def __init__(self, task, expander):
+        """
+        Args:
+            task (Task)
+            expander (Callable[[Include], Requisite]) - a function that recalls or evaluates
+                the requisite of the task
+        """
+        super(MemoizedInclude, self).__init__(task)
+        self.expander = expander
+
+    def expand(self):
+        return self.expander(self)
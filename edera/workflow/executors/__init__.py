@@ -1,3 +1,9 @@
+import six
+
 from .basic import BasicWorkflowExecutor
 from .managed import ManagedWorkflowExecutor
 from .monitoring import MonitoringWorkflowExecutor
+from .parallel import ParallelWorkflowExecutor
+
+if six.PY3:
+    from .asynchronous import AsyncWorkflowExecutor
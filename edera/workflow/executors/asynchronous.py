@@ -0,0 +1,245 @@
+import asyncio
+import concurrent.futures
+import datetime
+import logging
+import sys
+
+from edera.exceptions import ExcusableError
+from edera.exceptions import ExcusableWorkflowExecutionError
+from edera.exceptions import WorkflowExecutionError
+from edera.flags import InterThreadFlag
+from edera.helpers import CurrentException
+from edera.routine import deferrable
+from edera.routine import iscoroutinefunction
+from edera.routine import routine
+from edera.workflow.executor import WorkflowExecutor
+from edera.workflow.executors.parallel import WorkflowFrontier
+
+
+class AsyncWorkflowExecutor(WorkflowExecutor):
+    """
+    A workflow executor that runs tasks on an asyncio event loop.
+
+    Expects tasks to be ranked in advance.
+    Starts tasks as soon as all their parents finish (lowest ranks first), keeping up to
+    $concurrency of them in flight.
+    Coroutine functions (`async def check` and `async def execute`) are awaited on the loop,
+    so thousands of I/O-bound target checks can wait simultaneously without occupying threads.
+    Other functions and routines are run in a pool of $thread_count threads.
+    Handles exceptions and performs logging just like $BasicWorkflowExecutor does.
+    When a task fails or stops, all its descendants get discarded.
+
+    Available in Python 3 only.
+
+    This executor is interruptible.
+    Routines running in the thread pool get interrupted as well.
+
+    Attributes:
+        concurrency (Integer) - the maximum number of tasks in flight
+        thread_count (Integer) - the number of threads to run blocking functions in
+        interruption_timeout (TimeDelta) - time to wait for the tasks to finish
+                after being interrupted
+        POLLING_INTERVAL (TimeDelta) - the maximum time to run the event loop for
+                before yielding control
+
+    See also:
+        $TaskRanker
+    """
+
+    POLLING_INTERVAL = datetime.timedelta(milliseconds=100)
+
+    def __init__(
+            self, concurrency=1000, thread_count=16,
+            interruption_timeout=datetime.timedelta(minutes=1)):
+        """
+        Args:
+            concurrency (Integer) - a maximum number of tasks in flight
+                Default is 1000.
+            thread_count (Integer) - a number of threads to run blocking functions in
+                Default is 16.
+            interruption_timeout (TimeDelta) - time to wait for the tasks to finish
+                    after being interrupted
+                Default is 1 minute.
+        """
+        assert concurrency > 0
+        assert thread_count > 0
+        self.concurrency = concurrency
+        self.thread_count = thread_count
+        self.interruption_timeout = interruption_timeout
+
+    @routine
+    def execute(self, workflow):
+        run = AsyncWorkflowRun(workflow, self.thread_count)
+        try:
+            while True:
+                run.start(self.concurrency)
+                if not run.active:
+                    break
+                try:
+                    yield
+                except BaseException:
+                    logging.getLogger(__name__).debug("Interrupted")
+                    interrupting_exception = CurrentException()
+                    run.interrupt(self.interruption_timeout)
+                    interrupting_exception.reraise()
+                run.proceed(self.POLLING_INTERVAL)
+        finally:
+            run.close()
+        if run.failed_tasks:
+            raise WorkflowExecutionError(run.failed_tasks)
+        if run.stopped_tasks:
+            raise ExcusableWorkflowExecutionError(run.stopped_tasks)
+
+
+class AsyncWorkflowRun(object):
+    """
+    A single run of an $AsyncWorkflowExecutor.
+
+    Handles each task with a generator that yields the functions to call (checks and executions)
+    and receives their results, much like routines do.
+
+    Attributes:
+        active (Boolean) - whether some tasks are being handled at the moment
+        failed_tasks (List[Task]) - the tasks that failed so far
+        stopped_tasks (List[Task]) - the tasks that stopped so far
+    """
+
+    def __init__(self, workflow, thread_count):
+        """
+        Args:
+            workflow (Graph) - a graph of tasks to execute
+                All tasks must be annotated with `rank`.
+            thread_count (Integer) - a number of threads to run blocking functions in
+        """
+        self.failed_tasks = []
+        self.stopped_tasks = []
+        self.__frontier = WorkflowFrontier(workflow)
+        self.__loop = asyncio.new_event_loop()
+        self.__pool = concurrent.futures.ThreadPoolExecutor(thread_count)
+        self.__interruption_flag = InterThreadFlag()
+        self.__handlings = set()
+        self.__coroutines = set()
+        self.__jobs = set()
+
+    @property
+    def active(self):
+        return bool(self.__handlings)
+
+    def close(self):
+        """
+        Release the event loop and the thread pool.
+        """
+        self.__pool.shutdown(wait=False)
+        self.__loop.close()
+
+    def interrupt(self, timeout):
+        """
+        Cancel all pending coroutines and make all routines in the thread pool stop.
+
+        Args:
+            timeout (TimeDelta) - time to wait for them to finish
+        """
+        self.__interruption_flag.up()
+        coroutines = list(self.__coroutines)
+        for coroutine in coroutines:
+            coroutine.cancel()
+        if coroutines:
+            self.__loop.run_until_complete(
+                asyncio.wait(coroutines, timeout=timeout.total_seconds()))
+        concurrent.futures.wait(list(self.__jobs), timeout=timeout.total_seconds())
+
+    def proceed(self, timeout):
+        """
+        Run the event loop until some of the tasks get handled.
+
+        Args:
+            timeout (TimeDelta) - a maximum time to run the loop for
+
+        Raises:
+            Exception if something went surprisingly wrong
+        """
+        done, _ = self.__loop.run_until_complete(
+            asyncio.wait(
+                self.__handlings,
+                timeout=timeout.total_seconds(),
+                return_when=asyncio.FIRST_COMPLETED))
+        self.__handlings.difference_update(done)
+        for handling in done:
+            handling.result()
+
+    def start(self, limit):
+        """
+        Start handling ready tasks.
+
+        Args:
+            limit (Integer) - a maximum number of tasks to handle simultaneously
+        """
+        while len(self.__handlings) < limit:
+            task = self.__frontier.take(datetime.timedelta(0))
+            if task is None:
+                break
+            handling = asyncio.Future(loop=self.__loop)
+            self.__handlings.add(handling)
+            self.__step(self.__handle(task), handling)
+
+    def __call(self, function):
+
+        def check_interruption_flag():
+            if self.__interruption_flag.raised:
+                raise SystemExit("interrupted by the executor")
+
+        if iscoroutinefunction(function):
+            result = self.__loop.create_task(function())
+            self.__coroutines.add(result)
+            result.add_done_callback(self.__coroutines.discard)
+            return result
+        job = self.__pool.submit(deferrable(function)[check_interruption_flag])
+        self.__jobs.add(job)
+        result = asyncio.wrap_future(job, loop=self.__loop)
+        result.add_done_callback(lambda _: self.__jobs.discard(job))
+        return result
+
+    def __handle(self, task):
+        if task.phony:
+            self.__frontier.accept(task)
+            return
+        try:
+            logging.getLogger(__name__).debug("Picked task %r", task)
+            if task.target is not None:
+                completed = yield task.target.check
+                if completed:
+                    self.__frontier.accept(task)
+                    return
+            logging.getLogger(__name__).info("Running task %r", task)
+            yield task.execute
+        except ExcusableError as error:
+            logging.getLogger(__name__).info("Task %r stopped: %s", task, error)
+            self.stopped_tasks.append(task)
+            self.__frontier.discard(task)
+        except Exception:
+            logging.getLogger(__name__).exception("Task %r failed:", task)
+            self.failed_tasks.append(task)
+            self.__frontier.discard(task)
+        else:
+            logging.getLogger(__name__).info("Task %r completed", task)
+            self.__frontier.accept(task)
+
+    def __resume(self, generator, handling, call):
+        try:
+            seed = call.result()
+        except BaseException:
+            self.__step(generator, handling, exception=sys.exc_info())
+        else:
+            self.__step(generator, handling, seed=seed)
+
+    def __step(self, generator, handling, seed=None, exception=None):
+        try:
+            function = generator.send(seed) if exception is None else generator.throw(*exception)
+        except StopIteration:
+            handling.set_result(None)
+            return
+        except BaseException as error:
+            handling.set_exception(error)
+            return
+        call = self.__call(function)
+        call.add_done_callback(lambda call: self.__resume(generator, handling, call))
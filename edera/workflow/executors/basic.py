@@ -1,5 +1,6 @@
 import logging
 
+from edera.condition import check_in_bulk
 from edera.exceptions import ExcusableError
 from edera.exceptions import ExcusableWorkflowExecutionError
 from edera.exceptions import WorkflowExecutionError
@@ -16,6 +17,9 @@ class BasicWorkflowExecutor(WorkflowExecutor):
     Expects tasks to be ranked in advance.
     Runs tasks in the current thread one by one, handles exceptions, and performs logging.
 
+    Targets that support bulk checks (see $Condition.check_many) get checked in batches before
+    running any tasks, and those found $True don't get checked again.
+
     This executor is interruptible.
 
     See also:
@@ -27,6 +31,9 @@ class BasicWorkflowExecutor(WorkflowExecutor):
         queue = Queue(workflow)
         stopped_tasks = []
         failed_tasks = []
+        tasks = [task for task in workflow if not task.phony and task.target is not None]
+        values = yield check_in_bulk.defer([task.target for task in tasks])
+        completed_tasks = {tasks[index] for index in values if values[index]}
         while queue:
             task = queue.pick()
             if task.phony:
@@ -34,6 +41,10 @@ class BasicWorkflowExecutor(WorkflowExecutor):
                 continue
             try:
                 logging.getLogger(__name__).debug("Picked task %r", task)
+                if task in completed_tasks:
+                    logging.getLogger(__name__).debug("Task %r is known to be complete", task)
+                    queue.accept()
+                    continue
                 if task.target is not None:
                     completed = yield deferrable(task.target.check).defer()
                     if completed:
@@ -1,14 +1,18 @@
 from edera.routine import deferrable
 from edera.routine import routine
 from edera.workflow.executor import WorkflowExecutor
+from edera.workflow.processors import TaskCompiler
 
 
 class MonitoringWorkflowExecutor(WorkflowExecutor):
     """
     A workflow executor that monitors the state of the workflow via an agent.
 
+    Collapses the chains of task wrappers once the agent embraces the workflow.
+
     See also:
         $MonitoringAgent
+        $TaskCompiler
     """
 
     def __init__(self, base, agent):
@@ -22,4 +26,6 @@ class MonitoringWorkflowExecutor(WorkflowExecutor):
 
     @routine
     def execute(self, workflow):
-        yield deferrable(self.__base.execute).defer(self.__agent.embrace(workflow))
+        workflow = self.__agent.embrace(workflow)
+        TaskCompiler().process(workflow)
+        yield deferrable(self.__base.execute).defer(workflow)
@@ -0,0 +1,181 @@
+import datetime
+import logging
+import threading
+
+from edera.exceptions import ExcusableError
+from edera.exceptions import ExcusableWorkflowExecutionError
+from edera.exceptions import WorkflowExecutionError
+from edera.heap import Heap
+from edera.invokers import MultiThreadedInvoker
+from edera.routine import deferrable
+from edera.routine import routine
+from edera.workflow.executor import WorkflowExecutor
+
+
+class ParallelWorkflowExecutor(WorkflowExecutor):
+    """
+    A workflow executor that runs independent tasks in parallel.
+
+    Expects tasks to be ranked in advance.
+    Keeps a single frontier of tasks whose parents have all finished and lets several threads
+    take tasks from it (lowest ranks first) as soon as they become ready.
+    Handles exceptions and performs logging just like $BasicWorkflowExecutor does.
+    When a task fails or stops, all its descendants get discarded.
+
+    Prefer a single instance of this executor to multiple replicas of $BasicWorkflowExecutor:
+    the latter check the same targets over and over and collide on locks.
+
+    This executor is interruptible.
+
+    Attributes:
+        worker_count (Integer) - the number of threads to run tasks in
+        interruption_timeout (TimeDelta) - time to wait for the threads to finish
+                after being interrupted
+        POLLING_INTERVAL (TimeDelta) - the maximum time to wait for a task to become ready
+                before yielding control
+
+    See also:
+        $TaskRanker
+    """
+
+    POLLING_INTERVAL = datetime.timedelta(milliseconds=100)
+
+    def __init__(self, worker_count, interruption_timeout=datetime.timedelta(minutes=1)):
+        """
+        Args:
+            worker_count (Integer) - a number of threads to run tasks in
+            interruption_timeout (TimeDelta) - time to wait for the threads to finish
+                    after being interrupted
+                Default is 1 minute.
+        """
+        assert worker_count > 0
+        self.worker_count = worker_count
+        self.interruption_timeout = interruption_timeout
+
+    @routine
+    def execute(self, workflow):
+        frontier = WorkflowFrontier(workflow)
+        stopped_tasks = []
+        failed_tasks = []
+        yield MultiThreadedInvoker.replicate(
+            self.__work.fix(frontier, stopped_tasks, failed_tasks),
+            self.worker_count,
+            prefix="task-runner-",
+            interruption_timeout=self.interruption_timeout).invoke.defer()
+        if failed_tasks:
+            raise WorkflowExecutionError(failed_tasks)
+        if stopped_tasks:
+            raise ExcusableWorkflowExecutionError(stopped_tasks)
+
+    @routine
+    def __work(self, frontier, stopped_tasks, failed_tasks):
+        while True:
+            task = frontier.take(self.POLLING_INTERVAL)
+            if task is None:
+                if frontier.exhausted:
+                    return
+                yield
+                continue
+            if task.phony:
+                frontier.accept(task)
+                continue
+            try:
+                logging.getLogger(__name__).debug("Picked task %r", task)
+                if task.target is not None:
+                    completed = yield deferrable(task.target.check).defer()
+                    if completed:
+                        frontier.accept(task)
+                        continue
+                logging.getLogger(__name__).info("Running task %r", task)
+                yield deferrable(task.execute).defer()
+            except ExcusableError as error:
+                logging.getLogger(__name__).info("Task %r stopped: %s", task, error)
+                stopped_tasks.append(task)
+                frontier.discard(task)
+            except Exception:
+                logging.getLogger(__name__).exception("Task %r failed:", task)
+                failed_tasks.append(task)
+                frontier.discard(task)
+            else:
+                logging.getLogger(__name__).info("Task %r completed", task)
+                frontier.accept(task)
+
+
+class WorkflowFrontier(object):
+    """
+    A thread-safe set of tasks ready to run, shared by the workers of $ParallelWorkflowExecutor.
+
+    A task becomes ready once all its parents get accepted.
+    When a task gets discarded, all its descendants get discarded as well.
+
+    Attributes:
+        exhausted (Boolean) - whether all tasks are either accepted or discarded
+    """
+
+    def __init__(self, workflow):
+        """
+        Args:
+            workflow (Graph) - a graph of tasks to traverse
+                All tasks must be annotated with `rank`.
+
+        Raises:
+            AssertionError if some of the tasks aren't ranked
+        """
+        assert all("rank" in workflow[task].annotation for task in workflow)
+        self.__workflow = workflow
+        self.__blockers = {task: len(workflow[task].parents) for task in workflow}
+        self.__remaining = len(workflow)
+        self.__discarded = set()
+        self.__ready = Heap()
+        self.__condition = threading.Condition()
+        for task in workflow:
+            if not self.__blockers[task]:
+                self.__ready.push(task, -workflow[task]["rank"])
+
+    def accept(self, task):
+        """
+        Accept the task and release its children that have no more unfinished parents.
+
+        Args:
+            task (Task) - a task taken from the frontier
+        """
+        with self.__condition:
+            self.__remaining -= 1
+            for child in self.__workflow[task].children:
+                self.__blockers[child] -= 1
+                if not self.__blockers[child]:
+                    self.__ready.push(self.__workflow[child].item, -self.__workflow[child]["rank"])
+            self.__condition.notify_all()
+
+    def discard(self, task):
+        """
+        Discard the task along with all its descendants.
+
+        Args:
+            task (Task) - a task taken from the frontier
+        """
+        with self.__condition:
+            descendants = self.__workflow.trace(task, "D") - self.__discarded
+            self.__discarded.update(descendants)
+            self.__remaining -= 1 + len(descendants)
+            self.__condition.notify_all()
+
+    @property
+    def exhausted(self):
+        with self.__condition:
+            return not self.__remaining
+
+    def take(self, timeout):
+        """
+        Take the lowest-ranked ready task from the frontier.
+
+        Args:
+            timeout (TimeDelta) - a maximum time to wait for a task to become ready
+
+        Returns:
+            Optional[Task] - the task or $None if no task became ready in time
+        """
+        with self.__condition:
+            if not self.__ready and self.__remaining:
+                self.__condition.wait(timeout.total_seconds())
+            return self.__ready.pop() if self.__ready else None
@@ -1,9 +1,11 @@
+from .critical_path_ranker import CriticalPathRanker
 from .tag_filter import TagFilter
 from .target_cacher import TargetCacher
 from .target_checker import TargetChecker
 from .target_locker import TargetLocker
 from .target_postchecker import TargetPostChecker
 from .target_prechecker import TargetPreChecker
+from .task_compiler import TaskCompiler
 from .task_freezer import TaskFreezer
 from .task_ranker import TaskRanker
 from .task_segregator import TaskSegregator
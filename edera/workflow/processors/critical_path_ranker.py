@@ -0,0 +1,80 @@
+import datetime
+
+from edera.heap import Heap
+from edera.linearizers import DFSLinearizer
+from edera.workflow.processor import WorkflowProcessor
+
+
+ZERO = datetime.timedelta(0)
+
+
+class CriticalPathRanker(WorkflowProcessor):
+    """
+    A workflow processor that annotates each task with "rank" so that tasks heading longer chains
+    go first.
+
+    Each task gets annotated with "critical_path" - the expected duration of the longest chain of
+    tasks that starts with it (the task itself included).
+    The expected duration of a task is taken from the $durations (e.g. observed by the monitoring
+    system), then from the "duration" annotation of the task, and defaults to $default_duration.
+    Phony tasks take no time.
+
+    Ranks still form a topological order, so any executor that accepts ranked workflows can
+    use them.
+    Among the tasks that are ready to run, the one with the longest critical path gets the lowest
+    rank.
+
+    Attributes:
+        durations (Mapping[String, TimeDelta]) - the known durations by task name
+        default_duration (TimeDelta) - the duration of tasks with unknown duration
+
+    Examples:
+        >>> durations = {
+        >>>     state.name: state.span[1] - state.span[0]
+        >>>     for state in snapshot.core.states.values()
+        >>>     if state.span is not None
+        >>> }
+        >>> CriticalPathRanker(durations).process(workflow)
+
+    See also:
+        $TaskRanker
+    """
+
+    def __init__(self, durations=None, default_duration=datetime.timedelta(seconds=1)):
+        """
+        Args:
+            durations (Optional[Mapping[String, TimeDelta]]) - known durations by task name
+                Default is $None - rely on annotations only.
+            default_duration (TimeDelta) - a duration of tasks with unknown duration
+                Default is 1 second.
+        """
+        self.durations = durations or {}
+        self.default_duration = default_duration
+
+    def process(self, workflow):
+        order = DFSLinearizer().linearize(workflow)
+        for task in reversed(order):
+            node = workflow[task]
+            tails = [workflow[child]["critical_path"] for child in node.children]
+            node["critical_path"] = self.__estimate(task, node) + max(tails or [ZERO])
+        blockers = {task: len(workflow[task].parents) for task in order}
+        ready = Heap()
+        for task in order:
+            if not blockers[task]:
+                ready.push(task, workflow[task]["critical_path"])
+        rank = 0
+        while ready:
+            task = ready.pop()
+            workflow[task]["rank"] = rank
+            rank += 1
+            for child in workflow[task].children:
+                blockers[child] -= 1
+                if not blockers[child]:
+                    ready.push(workflow[child].item, workflow[child]["critical_path"])
+
+    def __estimate(self, task, node):
+        if task.phony:
+            return ZERO
+        if task.name in self.durations:
+            return self.durations[task.name]
+        return node.annotation.get("duration", self.default_duration)
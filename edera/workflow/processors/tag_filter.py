@@ -1,3 +1,4 @@
+from edera.graph import FrozenGraph
 from edera.linearizers import DFSLinearizer
 from edera.workflow.processor import WorkflowProcessor
 
@@ -10,6 +11,8 @@ class TagFilter(WorkflowProcessor):
     no followers with the given tag.
     By default every task has a $None tag.
 
+    Walks a $FrozenGraph of the workflow by ids, so that tasks barely get hashed.
+
     Attributes:
         tag (Optional[String]) - the tag value to filter by
     """
@@ -22,9 +25,10 @@ class TagFilter(WorkflowProcessor):
         self.tag = tag
 
     def process(self, workflow):
-        foreigners = set()
-        for task in reversed(DFSLinearizer().linearize(workflow)):
-            tag = workflow[task].annotation.get("tag")
-            if self.tag != tag and workflow[task].children <= foreigners:
-                foreigners.add(task)
-        workflow.remove(*foreigners)
+        graph = FrozenGraph(workflow)
+        foreign = bytearray(len(graph))
+        for index in reversed(DFSLinearizer().linearize_ids(graph)):
+            tag = graph.annotations[index].get("tag")
+            if self.tag != tag and all(foreign[child] for child in graph.get_children(index)):
+                foreign[index] = 1
+        workflow.remove(*(task for task, flag in zip(graph.items, foreign) if flag))
@@ -23,10 +23,17 @@ class TargetCacher(WorkflowProcessor):
         >>> TargetCacher(remote_storage).process(workflow)
         >>> TargetCacher(local_storage).process(workflow)
 
+    Alternatively, you can put an in-memory $CachingStorage in front of the remote storage.
+
+    Cached targets are never checked again, so consider limiting the retention of the cache
+    (e.g. with `max_versions=1` and `max_age`) to let stale entries go away.
+
     Attributes:
         cache (Storage) - the cache used
+        prefetch (Boolean) - whether to look up all targets in the cache at once during processing
 
     See also:
+        $CachingStorage
         $WorkflowNormalizer
 
     WARNING!
@@ -34,20 +41,34 @@ class TargetCacher(WorkflowProcessor):
         Consider applying $WorkflowNormalizer first.
     """
 
-    def __init__(self, cache):
+    def __init__(self, cache, prefetch=False):
         """
         Args:
             cache (Storage) - a cache to use
+            prefetch (Boolean) - whether to look up all targets in the cache at once
+                Turns multiple cache look-ups into a single batch query.
+                Default is $False - look up for each target lazily, right before the check.
         """
         self.cache = cache
+        self.prefetch = prefetch
 
     def process(self, workflow):
-        for task in workflow:
-            if task.target is None:
-                continue
-            target = CachingConditionWrapper(task.target, self.cache)
+        tasks = [task for task in workflow if task.target is not None]
+        hits = self.__prefetch(tasks) if self.prefetch else None
+        for task in tasks:
+            target = CachingConditionWrapper(task.target, self.cache, hits=hits)
             workflow.replace(TargetOverridingTaskWrapper(task, target))
 
+    def __prefetch(self, tasks):
+        keys = {edera.helpers.sha1(task.target.name) for task in tasks}
+        try:
+            logging.getLogger(__name__).debug("Looking up for %d targets in cache", len(keys))
+            records = self.cache.get_many(keys, limit=1)
+        except StorageOperationError as error:
+            logging.getLogger(__name__).debug("Failed to read from cache: %s", error)
+            return None
+        return {key: bool(records[key]) for key in keys}
+
 
 class CachingConditionWrapper(ConditionWrapper):
     """
@@ -57,35 +78,68 @@ class CachingConditionWrapper(ConditionWrapper):
         cache (Storage) - the cache used
     """
 
-    def __init__(self, base, cache):
+    def __init__(self, base, cache, hits=None):
         """
         Args:
             base (Condition) - a base condition
             cache (Storage) - a cache to use
+            hits (Optional[Mapping[String, Boolean]]) - a table of prefetched cache look-up results
+                    by cache key
+                Consulted before the cache itself and updated once the condition gets cached.
+                Default is $None - always look up in the cache.
         """
         ConditionWrapper.__init__(self, base)
         self.cache = cache
+        self.__hits = hits
 
     @routine
     def check(self):
-        cached = True
+        key = edera.helpers.sha1(self.name)
+        cached = self.__look_up(key)
+        if cached:
+            yield True
+            return
+        result = yield deferrable(super(CachingConditionWrapper, self).check).defer()
+        if result and cached is not None:
+            self.__remember(key)
+        yield result
+
+    @classmethod
+    def check_many(cls, conditions):
+        keys = [edera.helpers.sha1(condition.name) for condition in conditions]
+        results = [condition.__look_up(key) for condition, key in zip(conditions, keys)]
+        pending = [index for index, cached in enumerate(results) if not cached]
+        if pending:
+            bases = [conditions[index].base for index in pending]
+            for index, result in zip(pending, type(bases[0]).check_many(bases)):
+                if result and results[index] is not None:
+                    conditions[index].__remember(keys[index])
+                results[index] = result
+        return results
+
+    def __look_up(self, key):
+        if self.__hits is not None and key in self.__hits:
+            logging.getLogger(__name__).debug("Looking up for %r in prefetched cache", self)
+            return self.__hits[key]
         try:
             logging.getLogger(__name__).debug("Looking up for %r in cache", self)
-            if self.cache.get(edera.helpers.sha1(self.name), limit=1):
+            if self.cache.get(key, limit=1):
                 logging.getLogger(__name__).debug("Found in cache")
-                yield True
-                return
-            cached = False
+                return True
+            return False
         except StorageOperationError as error:
             # not sure if really not cached
             logging.getLogger(__name__).debug("Failed to read from cache: %s", error)
-        result = yield deferrable(super(CachingConditionWrapper, self).check).defer()
-        if result and not cached:
-            try:
-                logging.getLogger(__name__).debug("Caching %r", self)
-                self.cache.put(edera.helpers.sha1(self.name), "!")
-                logging.getLogger(__name__).debug("Stored in cache")
-            except StorageOperationError as error:
-                # whatever
-                logging.getLogger(__name__).debug("Failed to write to cache: %s", error)
-        yield result
+            return None
+
+    def __remember(self, key):
+        try:
+            logging.getLogger(__name__).debug("Caching %r", self)
+            self.cache.put(key, "!")
+            logging.getLogger(__name__).debug("Stored in cache")
+        except StorageOperationError as error:
+            # whatever
+            logging.getLogger(__name__).debug("Failed to write to cache: %s", error)
+        else:
+            if self.__hits is not None:
+                self.__hits[key] = True
@@ -1,5 +1,6 @@
 import logging
 
+from edera.condition import check_in_bulk
 from edera.routine import deferrable
 from edera.routine import routine
 from edera.task import TaskWrapper
@@ -13,25 +14,48 @@ class TargetPreChecker(WorkflowProcessor):
     Patches each task to pre-check its target before actual execution.
     These pre-checks prevent running already completed tasks.
 
+    Targets that support bulk checks (see $Condition.check_many) get checked in batches during
+    processing, and tasks found complete don't check them again.
+
     See also:
         $TargetChecker
         $TargetPostChecker
     """
 
+    @routine
     def process(self, workflow):
-        for task in workflow:
-            if task.phony:
-                continue
-            workflow.replace(TargetPreCheckingTaskWrapper(task))
+        tasks = [task for task in workflow if not task.phony]
+        targets = [task.target for task in tasks if task.target is not None]
+        values = yield check_in_bulk.defer(targets)
+        completed_targets = {targets[index] for index in values if values[index]}
+        for task in tasks:
+            completed = task.target is not None and task.target in completed_targets
+            workflow.replace(TargetPreCheckingTaskWrapper(task, completed=completed))
 
 
 class TargetPreCheckingTaskWrapper(TaskWrapper):
     """
     A task wrapper that pre-checks the target.
+
+    Attributes:
+        completed (Boolean) - whether the target is already known to be $True
     """
 
+    def __init__(self, base, completed=False):
+        """
+        Args:
+            base (Task) - a base task
+            completed (Boolean) - whether the target is already known to be $True
+                Default is $False - check the target before each execution.
+        """
+        TaskWrapper.__init__(self, base)
+        self.completed = completed
+
     @routine
     def execute(self):
+        if self.completed:
+            logging.getLogger(__name__).debug("Task %r already completed (skipping)", self)
+            return
         if self.target is not None:
             logging.getLogger(__name__).debug("Pre-checking %r", self.target)
             completed = yield deferrable(self.target.check).defer()
@@ -0,0 +1,53 @@
+from edera.task import TaskWrapper
+from edera.workflow.processor import WorkflowProcessor
+
+
+class TaskCompiler(WorkflowProcessor):
+    """
+    A workflow processor that collapses chains of task wrappers.
+
+    Processors wrap tasks over and over again, so accessing a property of a task takes a walk
+    along the whole chain of wrappers (and some wrappers even build a new target each time).
+    This processor replaces each task with a $CompiledTaskWrapper that does it all only once.
+
+    Apply it after all other processors, since the tasks are not supposed to change afterwards.
+
+    See also:
+        $TaskFreezer
+    """
+
+    def process(self, workflow):
+        for task in workflow:
+            workflow.replace(CompiledTaskWrapper(task))
+
+
+class CompiledTaskWrapper(TaskWrapper):
+    """
+    A task wrapper that pre-computes the name, the target, the "phony" flag, and the execution
+    routine of the base task.
+
+    The requisite is still evaluated on demand.
+    """
+
+    def __init__(self, base):
+        TaskWrapper.__init__(self, base)
+        self.__name = base.name
+        self.__target = base.target
+        self.__phony = base.phony
+        self.__execute = base.execute
+
+    @property
+    def execute(self):
+        return self.__execute
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def phony(self):
+        return self.__phony
+
+    @property
+    def target(self):
+        return self.__target
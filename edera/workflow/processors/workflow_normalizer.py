@@ -34,8 +34,23 @@ class WorkflowNormalizer(WorkflowProcessor):
       - you need to provide enough information about targets through condition invariants
       - some workflows can't be normalized (you need better target design in this case)
       - it may take a lot of time, depending on the nature of the constraints
+
+    The normalizer can remember the corrections it made, so that it doesn't need to solve anything
+    when the same graph of targets comes again (e.g. when the daemon re-builds the workflow).
+
+    Attributes:
+        memory (Optional[MutableMapping[String, Any]]) - the memory used
     """
 
+    def __init__(self, memory=None):
+        """
+        Args:
+            memory (Optional[MutableMapping[String, Any]]) - a mapping to remember corrections in
+                Share it between normalizers applied to successive builds of the same workflow.
+                Default is $None - always start from scratch.
+        """
+        self.memory = memory
+
     @classmethod
     def check(cls, workflow):
         """
@@ -62,9 +77,30 @@ class WorkflowNormalizer(WorkflowProcessor):
             targets = _get_graph_of_targets(workflow)
         except CircularDependencyError as error:
             raise WorkflowNormalizationError(error)
+        if self.memory is None:
+            corrections = self.__correct(targets)
+        else:
+            signature = _get_signature(targets)
+            if self.memory.get("signature") != signature:
+                self.memory.clear()
+                self.memory["corrections"] = self.__correct(targets)
+                self.memory["signature"] = signature
+            else:
+                logging.getLogger(__name__).debug("Reusing corrections from the previous run")
+            corrections = self.memory["corrections"]
+        if not corrections:
+            return
+        logging.getLogger(__name__).debug(
+            "Correcting targets: %s" % edera.helpers.render(corrections))
+        for task in workflow:
+            if task.target is None or task.target not in corrections:
+                continue
+            workflow.replace(TargetOverridingTaskWrapper(task, corrections[task.target]))
+
+    def __correct(self, targets):
         constraint, normalized = _check_targets(targets)
         if normalized:
-            return
+            return {}
         logging.getLogger(__name__).debug("Trying to normalize the workflow")
         constraint_atoms = constraint.atoms()
         pivot = {target for target in targets if target.symbol not in constraint_atoms}
@@ -126,12 +162,7 @@ class WorkflowNormalizer(WorkflowProcessor):
         if ccts or dcts:  # pragma: no cover
             raise WorkflowNormalizationError(
                 "some target corrections are not feasible: " + edera.helpers.render(ccts | dcts))
-        logging.getLogger(__name__).debug(
-            "Correcting targets: %s" % edera.helpers.render(corrections))
-        for task in workflow:
-            if task.target is None or task.target not in corrections:
-                continue
-            workflow.replace(TargetOverridingTaskWrapper(task, corrections[task.target]))
+        return corrections
 
 
 class TargetOverridingTaskWrapper(TaskWrapper):
@@ -183,6 +214,17 @@ def _get_graph_of_targets(workflow):
     return result
 
 
+def _get_signature(targets):
+    return (
+        frozenset(target.name for target in targets),
+        frozenset(
+            (parent.name, target.name)
+            for target in targets
+            for parent in targets[target].parents
+        ),
+    )
+
+
 def _get_target_corrections(targets, ccts, dcts):
     pivot = set(targets) - ccts - dcts
     result = {target: target for target in pivot}
@@ -55,7 +55,7 @@ class WorkflowTestifier(WorkflowProcessor):
         partitions = self.__partitioner.partition(substitutions)
         logging.getLogger(__name__).debug("Split tests into %d groups", len(partitions))
         origin = workflow.clone()
-        workflow.remove(*workflow)
+        workflow.retain([])
         for partition in partitions:
             self.__project(origin, partition, workflow)
 
@@ -1,11 +1,16 @@
 import binascii
+import collections
 import logging
 
 import six
 
+from edera.condition import batch_conditions
 from edera.exceptions import ExcusableError
+from edera.graph import FrozenGraph
 from edera.graph import Graph
+from edera.invokers import MultiThreadedInvoker
 from edera.linearizers import DFSLinearizer
+from edera.reachability import ReachabilityIndex
 from edera.routine import deferrable
 from edera.routine import routine
 from edera.workflow.processor import WorkflowProcessor
@@ -19,6 +24,27 @@ class WorkflowTrimmer(WorkflowProcessor):
     It assumes that if a task is complete, then all its ancestors are also complete.
     Vice versa, if a task is incomplete, then all its descendants are also incomplete.
 
+    Targets of the tasks that cut off most of the workflow get checked first.
+    Several targets of mutually independent tasks can be checked simultaneously (in separate
+    threads), which helps a lot when checks are slow.
+    Targets that support bulk checks (see $Condition.check_many) get checked in batches, each
+    batch counting as a single check.
+
+    The trimmer can remember the tasks it has found complete, so that successive builds of the same
+    workflow get rid of them (and their ancestors) right away, without checking.
+    This way only the new and still incomplete tasks get examined each time.
+
+    Tasks get hashed only while making a $FrozenGraph of the workflow, the rest of the analysis
+    works with integer indices.
+    Ancestors and descendants of the tasks come from a $ReachabilityIndex, unless the workflow is
+    too large to index.
+
+    Attributes:
+        concurrency (Integer) - the maximum number of targets to check simultaneously
+        memory (Optional[MutableSet[String]]) - the names of the tasks known to be complete
+        INDEXING_LIMIT (Integer) - the maximum number of tasks to build a $ReachabilityIndex for
+            The index takes up to n^2/8 bytes of memory for n tasks.
+
     See also:
         $WorkflowNormalizer
 
@@ -27,18 +53,63 @@ class WorkflowTrimmer(WorkflowProcessor):
         Consider applying $WorkflowNormalizer first.
     """
 
+    INDEXING_LIMIT = 10000
+
+    def __init__(self, concurrency=1, memory=None):
+        """
+        Args:
+            concurrency (Integer) - a maximum number of targets to check simultaneously
+                Default is 1 - check targets one by one in the current thread.
+            memory (Optional[MutableSet[String]]) - a set to remember complete tasks (by name) in
+                Share it between trimmers applied to successive builds of the same workflow.
+                Names never get forgotten by the trimmer, so drop the names of the tasks that are
+                no longer in the workflow yourself, e.g. via `memory.intersection_update(...)`.
+                Default is $None - always start from scratch.
+        """
+        assert concurrency > 0
+        self.concurrency = concurrency
+        self.memory = memory
+
     @routine
     def process(self, workflow):
         logging.getLogger(__name__).debug("Tasks before trimming: %d", len(workflow))
-        tasks = DFSLinearizer().linearize(workflow)
+        if self.memory is not None:
+            known_tasks = [task for task in workflow if task.name in self.memory]
+            workflow.remove(*set().union(
+                known_tasks, *(workflow.trace(task, "A") for task in known_tasks)))
+            logging.getLogger(__name__).debug("Tasks left after recalling: %d", len(workflow))
+        frozen_workflow = FrozenGraph(workflow)
+        ids = DFSLinearizer().linearize_ids(frozen_workflow)
+        tasks = [frozen_workflow.items[identifier] for identifier in ids]
+        positions = [None] * len(ids)
+        for index, identifier in enumerate(ids):
+            positions[identifier] = index
         hashes = [binascii.crc32(task.name.encode("ASCII")) for task in tasks]
-        indices = {task: index for index, task in enumerate(tasks)}
-        linearization = list(range(len(indices)))
+        linearization = list(range(len(tasks)))
         candidates = Graph()
         for index in linearization:
             candidates.add(index)
-            for parent in workflow[tasks[index]].parents:
-                candidates.link(indices[parent], index)
+            for parent in frozen_workflow.get_parents(ids[index]):
+                candidates.link(positions[parent], index)
+        tracer = candidates
+        if len(linearization) <= self.INDEXING_LIMIT:
+            tracer = ReachabilityIndex(candidates, linearization)
+
+        def cut_off(victim):
+            return (
+                victim in black or victim in white
+                or candidates[victim]["AS"] in black or candidates[victim]["DS"] in white
+            )
+
+        def enlist(victim, batch, related):
+            logging.getLogger(__name__).debug(
+                "Cutting at %r of volume %d", tasks[victim].target, candidates[victim]["V"])
+            batch.append(victim)
+            checked.add(victim)
+            if self.concurrency > 1 or groups[victim] in batchable:
+                related.add(victim)
+                related |= tracer.trace(victim, "A") | tracer.trace(victim, "D")
+
         while True:
             yield
             for index in linearization:
@@ -76,40 +147,99 @@ class WorkflowTrimmer(WorkflowProcessor):
             for index in candidates:
                 ac, dc = candidates[index]["AC"], candidates[index]["DC"]
                 candidates[index]["V"] = ac * dc + max(ac, dc)
-            victims = sorted(candidates, key=(lambda i: -candidates[i]["V"]))
-            black, white = set(), set()
-            for victim in victims:
-                volume = candidates[victim]["V"]
-                if volume < 3:
-                    break
-                target = tasks[victim].target
-                dead = (
-                    target is None
-                    or victim in black or victim in white
-                    or candidates[victim]["AS"] in black or candidates[victim]["DS"] in white
-                )
-                if dead:
-                    continue
-                logging.getLogger(__name__).debug("Cutting at %r of volume %d", target, volume)
-                try:
-                    completed = yield deferrable(target.check).defer()
-                except ExcusableError as error:
-                    logging.getLogger(__name__).info("Stopped checking %r: %s", target, error)
-                except Exception:
-                    logging.getLogger(__name__).exception("Failed to check %r:", target)
-                else:
-                    if completed:
+            victims = [
+                victim
+                for victim in sorted(candidates, key=(lambda i: -candidates[i]["V"]))
+                if candidates[victim]["V"] >= 3 and tasks[victim].target is not None
+            ]
+            groups, batchable, members = {}, set(), {}
+            for indices in batch_conditions([tasks[victim].target for victim in victims]):
+                for index in indices:
+                    groups[victims[index]] = indices[0]
+                if len(indices) > 1:
+                    batchable.add(indices[0])
+                    members[indices[0]] = [victims[index] for index in indices]
+            black, white, checked = set(), set(), set()
+            while victims:
+                batch, jobs, related, postponed = [], [], set(), []
+                for position, victim in enumerate(victims):
+                    if len(jobs) == self.concurrency:
+                        postponed.extend(victims[position:])
+                        break
+                    if victim in checked or cut_off(victim):
+                        continue
+                    if victim in related:
+                        postponed.append(victim)
+                        continue
+                    enlist(victim, batch, related)
+                    if groups[victim] not in jobs:
+                        jobs.append(groups[victim])
+                for group in jobs:
+                    if group not in batchable:
+                        continue
+                    remaining = []
+                    for member in members[group]:
+                        if member in checked or cut_off(member):
+                            continue
+                        remaining.append(member)
+                        if member not in related:
+                            enlist(member, batch, related)
+                    members[group] = remaining
+                victims = postponed
+                outcomes = {}
+                jobs = collections.OrderedDict()
+                for victim in batch:
+                    jobs.setdefault(groups[victim], []).append(victim)
+                if len(jobs) == 1:
+                    job = next(iter(jobs.values()))
+                    targets = [tasks[victim].target for victim in job]
+                    yield self.__inspect.defer(targets, outcomes, job)
+                elif jobs:
+                    yield MultiThreadedInvoker({
+                        str(job[0]): self.__inspect.fix(
+                            [tasks[victim].target for victim in job], outcomes, job)
+                        for job in jobs.values()
+                    }).invoke.defer()
+                for victim in batch:
+                    if victim not in outcomes:
+                        continue
+                    if outcomes[victim]:
                         logging.getLogger(__name__).debug("Blacklisting ancestors")
                         black.add(victim)
-                        black |= candidates.trace(victim, "A")
+                        black |= tracer.trace(victim, "A")
                     else:
                         logging.getLogger(__name__).debug("Whitelisting descendants")
                         white.add(victim)
-                        white |= candidates.trace(victim, "D")
+                        white |= tracer.trace(victim, "D")
             if not black and not white:
                 break
             candidates.remove(*(black | white))
+            if tracer is not candidates:
+                tracer.remove(*(black | white))
             linearization = [index for index in linearization if index in candidates]
             workflow.remove(*(tasks[index] for index in black))
+            if self.memory is not None:
+                self.memory.update(tasks[index].name for index in black)
             logging.getLogger(__name__).debug("Tasks left: %d", len(workflow))
         logging.getLogger(__name__).debug("Tasks after trimming: %d", len(workflow))
+
+    @routine
+    def __inspect(self, targets, outcomes, keys):
+        if len(targets) > 1:
+            try:
+                logging.getLogger(__name__).debug("Checking %d targets at once", len(targets))
+                results = yield deferrable(type(targets[0]).check_many).defer(targets)
+            except Exception as error:
+                logging.getLogger(__name__).info(
+                    "Failed to check %d targets at once (checking one by one): %s",
+                    len(targets), error)
+            else:
+                outcomes.update(zip(keys, results))
+                return
+        for target, key in zip(targets, keys):
+            try:
+                outcomes[key] = yield deferrable(target.check).defer()
+            except ExcusableError as error:
+                logging.getLogger(__name__).info("Stopped checking %r: %s", target, error)
+            except Exception:
+                logging.getLogger(__name__).exception("Failed to check %r:", target)
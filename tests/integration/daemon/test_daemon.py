@@ -20,6 +20,9 @@ from edera.daemon import StaticDaemonModule
 from edera.helpers import SimpleBox
 from edera.lockers import DirectoryLocker
 from edera.monitoring import MonitorWatcher
+from edera.qualifiers import List
+from edera.qualifiers import String
+from edera.requisites import shortcut
 from edera.storages import SQLiteStorage
 from edera.testing import TestableTask
 
@@ -201,3 +204,71 @@ def test_daemon_functions_correctly_in_autotesting_mode(tmpdir):
     assert "TESTED" in files
     watcher = MonitorWatcher(MyDaemon.monitor)
     assert len(watcher.load_snapshot_core().states) == 2
+
+
+def test_daemon_functions_correctly_in_pipelined_mode(tmpdir):
+
+    class FileExists(Parameterizable, Condition):
+
+        path = Parameter()
+
+        def check(self):
+            return fs.check(self.path)
+
+    class CreateFile(Parameterizable, Task):
+
+        path = Parameter()
+
+        def execute(self):
+            fs.create(self.path)
+
+        @property
+        def target(self):
+            return FileExists(path=self.path)
+
+    class CreateFiles(Parameterizable, Task):
+
+        paths = Parameter(List[String])
+
+        @shortcut
+        def requisite(self):
+            return [CreateFile(path=path) for path in self.paths]
+
+    class PreludeModule(StaticDaemonModule):
+
+        root = CreateFiles(paths=["prelude.0", "prelude.1"])
+
+    class MainModule(DaemonModule):
+
+        scheduling = {
+            None: DaemonSchedule(building_delay="PT1S", execution_delay="PT1S", executor_count=2),
+        }
+
+        def seed(self, now):
+            suffix = now.astimezone(iso8601.UTC).strftime("%Y-%m-%dT%H:%M:%S")
+            return CreateFiles(paths=["main.0." + suffix, "main.1." + suffix])
+
+    class MyDaemon(Daemon):
+
+        cache = SQLiteStorage(str(tmpdir.join("cache.db")))
+        monitor = SQLiteStorage(str(tmpdir.join("monitor.db")))
+
+        prelude = PreludeModule()
+        main = MainModule()
+
+        pipelined = True
+
+    fs = FileSystem(str(tmpdir))
+    daemon = MyDaemon()
+    process = multiprocessing.Process(target=daemon.run)
+    process.start()
+    time.sleep(30)
+    process.terminate()
+    process.join(15)
+    files = set(path.basename for path in tmpdir.listdir())
+    assert "prelude.0" in files
+    assert "prelude.1" in files
+    assert len([name for name in files if name.startswith("main.0.")]) >= 3
+    assert len([name for name in files if name.startswith("main.1.")]) >= 3
+    watcher = MonitorWatcher(MyDaemon.monitor)
+    assert len(watcher.load_snapshot_core().states) >= 8
@@ -75,3 +75,20 @@ def test_monitor_watcher_detects_inconsistent_task_payloads(monitor, watcher):
         MultiThreadedInvoker({"w": watch}).invoke[timer]()
     except Timer.Timeout:
         pass
+
+
+def test_monitor_watcher_recovers_even_without_scanning(mocker, monitor, watcher):
+    _, snapshot = watcher.recover()
+    mocker.patch.object(type(monitor), "scan", side_effect=NotImplementedError)
+    _, fallback_snapshot = watcher.recover()
+    assert set(fallback_snapshot.payloads) == set(snapshot.payloads)
+    for alias in snapshot.payloads:
+        assert fallback_snapshot.payloads[alias].serialize() == snapshot.payloads[alias].serialize()
+
+
+def test_monitor_watcher_recovers_payloads_updated_since_checkpoint(monitor, watcher):
+    checkpoint, snapshot = watcher.recover()
+    alias = sorted(checkpoint.payload_versions)[0]
+    monitor.put("payload/" + alias, "not a payload")
+    _, recovered_snapshot = watcher.recover()
+    assert recovered_snapshot.payloads[alias].serialize() == snapshot.payloads[alias].serialize()
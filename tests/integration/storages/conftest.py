@@ -1,10 +1,14 @@
+import datetime
 import uuid
 
 import pytest
 
+from edera.storages import CachingStorage
 from edera.storages import EmbeddedStorage
 from edera.storages import InMemoryStorage
+from edera.storages import LogStorage
 from edera.storages import MongoStorage
+from edera.storages import ShardedStorage
 from edera.storages import SQLiteStorage
 
 
@@ -26,6 +30,19 @@ def sqlite_storage(debugger, sqlite_database):
     return SQLiteStorage(sqlite_database)
 
 
+@pytest.yield_fixture
+def log_directory(tmpdir):
+    try:
+        yield str(tmpdir.join("log"))
+    finally:
+        tmpdir.remove()
+
+
+@pytest.fixture
+def log_storage(debugger, log_directory):
+    return LogStorage(log_directory)
+
+
 @pytest.yield_fixture
 def mongo_database(mongo):
     name = uuid.uuid4().hex
@@ -45,16 +62,42 @@ def embedded_storage(inmemory_storage):
     return EmbeddedStorage(inmemory_storage, "keyspace")
 
 
-@pytest.fixture(params=["inmemory_storage", "sqlite_storage", "mongo_storage", "embedded_storage"])
+@pytest.fixture
+def caching_storage(sqlite_storage):
+    return CachingStorage(sqlite_storage, 2, datetime.timedelta(minutes=1))
+
+
+@pytest.fixture
+def sharded_storage(tmpdir):
+    return ShardedStorage([SQLiteStorage(str(tmpdir.join("shard-%d.db" % i))) for i in range(3)])
+
+
+@pytest.fixture(params=[
+    "inmemory_storage",
+    "sqlite_storage",
+    "mongo_storage",
+    "embedded_storage",
+    "caching_storage",
+    "log_storage",
+    "sharded_storage",
+])
 def storage(request):
     return request.getfixturevalue(request.param)
 
 
-@pytest.fixture(params=["inmemory_storage", "sqlite_storage", "mongo_storage", "embedded_storage"])
+@pytest.fixture(params=[
+    "inmemory_storage",
+    "sqlite_storage",
+    "mongo_storage",
+    "embedded_storage",
+    "caching_storage",
+    "log_storage",
+    "sharded_storage",
+])
 def multithreaded_storage(request):
     return request.getfixturevalue(request.param)
 
 
-@pytest.fixture(params=["sqlite_storage", "mongo_storage"])
+@pytest.fixture(params=["sqlite_storage", "mongo_storage", "log_storage", "sharded_storage"])
 def multiprocess_storage(request):
     return request.getfixturevalue(request.param)
@@ -0,0 +1,42 @@
+import datetime
+import time
+
+from edera.storages import CachingStorage
+
+
+def test_caching_storage_serves_latest_records_from_memory(inmemory_storage):
+    storage = CachingStorage(inmemory_storage, 10)
+    v0 = storage.put("key", "value #0")
+    assert storage.get("key", limit=1) == [(v0, "value #0")]
+    assert storage.get("another key", limit=1) == []
+    assert storage.get("another key", limit=1) == []
+    assert (storage.hits, storage.misses) == (2, 1)
+    v1 = inmemory_storage.put("key", "value #1")
+    assert storage.get("key", limit=1) == [(v0, "value #0")]
+    assert storage.get("key", since=v1, limit=1) == []
+    assert storage.get("key") == [(v1, "value #1"), (v0, "value #0")]
+    storage.delete("key", till=v1)
+    assert storage.get("key", limit=1) == [(v1, "value #1")]
+    assert (storage.hits, storage.misses) == (4, 2)
+
+
+def test_caching_storage_evicts_least_recently_used_keys(inmemory_storage):
+    storage = CachingStorage(inmemory_storage, 2)
+    storage.put_many([("A", "a"), ("B", "b")])
+    storage.get("A", limit=1)
+    storage.put("C", "c")
+    assert storage.get_many(["A", "B", "C"], limit=1) == {
+        "A": [(0, "a")],
+        "B": [(0, "b")],
+        "C": [(0, "c")],
+    }
+    assert (storage.hits, storage.misses) == (3, 1)
+
+
+def test_caching_storage_forgets_expired_records(inmemory_storage):
+    storage = CachingStorage(inmemory_storage, 10, datetime.timedelta(milliseconds=10))
+    storage.put("key", "value #0")
+    v1 = inmemory_storage.put("key", "value #1")
+    time.sleep(0.02)
+    assert storage.get("key", limit=1) == [(v1, "value #1")]
+    assert (storage.hits, storage.misses) == (0, 1)
@@ -0,0 +1,26 @@
+import datetime
+
+from edera.storages import InMemoryStorage
+
+
+def test_storage_keeps_only_latest_versions():
+    storage = InMemoryStorage(max_versions=2)
+    versions = storage.put_many([("key", str(index)) for index in range(5)])
+    storage.put("another key", "value")
+    assert storage.get("key") == [(versions[4], "4"), (versions[3], "3")]
+    assert len(storage.get("another key")) == 1
+
+
+def test_storage_discards_expired_records(mocker):
+    mocker.patch.object(InMemoryStorage, "PRUNING_INTERVAL", datetime.timedelta(0))
+    time = mocker.patch("time.time", return_value=1000.0)
+    storage = InMemoryStorage(max_age=datetime.timedelta(seconds=10))
+    storage.put("key", "old value")
+    storage.put("another key", "value")
+    time.return_value = 1005.0
+    version = storage.put("key", "new value")
+    time.return_value = 1012.0
+    storage.put("third key", "value")
+    assert storage.get("key") == [(version, "new value")]
+    assert storage.get("another key") == []
+    assert storage.put("another key", "value") == 1
@@ -0,0 +1,65 @@
+import os
+import os.path
+import time
+
+import pytest
+
+from edera.exceptions import StorageOperationError
+from edera.storages import LogStorage
+
+
+def test_storage_reports_about_operation_failures(tmpdir):
+    tmpdir.join("log").write("")
+    with pytest.raises(StorageOperationError):
+        LogStorage(str(tmpdir.join("log"))).get("key")
+
+
+def test_storage_survives_compaction(log_storage):
+    v0 = log_storage.put("key", "value #0")
+    v1 = log_storage.put("key", "value #1")
+    v2 = log_storage.put("another key", "another value")
+    log_storage.delete("key", till=v1)
+    other_log_storage = LogStorage(log_storage.root)
+    assert other_log_storage.get("key") == [(v1, "value #1")]
+    log_storage.compact()
+    assert len([name for name in os.listdir(log_storage.root) if name.endswith(".log")]) == 1
+    assert other_log_storage.get("key") == [(v1, "value #1")]
+    assert other_log_storage.get("another key") == [(v2, "another value")]
+    assert log_storage.put("key", "value #2") > v2 > v0
+    other_log_storage.delete("another key")
+    assert log_storage.get("another key") == []
+
+
+def test_storage_restores_index_from_file(log_storage):
+    v0 = log_storage.put("key", "value #0")
+    log_storage.compact()
+    v1 = log_storage.put("key", "value #1")
+    assert os.path.exists(os.path.join(log_storage.root, "index"))
+    assert LogStorage(log_storage.root).get("key") == [(v1, "value #1"), (v0, "value #0")]
+
+
+def test_storage_ignores_torn_records(log_storage):
+    v0 = log_storage.put("key", "value #0")
+    segment = sorted(name for name in os.listdir(log_storage.root) if name.endswith(".log"))[-1]
+    with open(os.path.join(log_storage.root, segment), "ab") as stream:
+        stream.write(b"P\x00\x00")
+    other_log_storage = LogStorage(log_storage.root)
+    assert other_log_storage.get("key") == [(v0, "value #0")]
+    v1 = other_log_storage.put("key", "value #1")
+    assert LogStorage(log_storage.root).get("key") == [(v1, "value #1"), (v0, "value #0")]
+
+
+def test_storage_rolls_segments_over_and_compacts_automatically(log_directory):
+    log_storage = LogStorage(log_directory, segment_size=1000, compaction_threshold=0.5)
+    for index in range(100):
+        log_storage.put("key", "value #%d" % index)
+    assert len([name for name in os.listdir(log_directory) if name.endswith(".log")]) > 1
+    last_version = log_storage.get("key", limit=1)[0][0]
+    log_storage.delete("key", till=last_version)
+    for _ in range(100):
+        if len([name for name in os.listdir(log_directory) if name.endswith(".log")]) == 1:
+            break
+        time.sleep(0.1)
+    else:
+        pytest.fail("log was not compacted")
+    assert LogStorage(log_directory).get("key") == [(last_version, "value #99")]
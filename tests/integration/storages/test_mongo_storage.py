@@ -1,9 +1,14 @@
+import datetime
+import time
+
 import pymongo
 import pytest
 
 from edera.exceptions import StorageOperationError
 from edera.helpers import Lazy
+from edera.invokers import MultiThreadedInvoker
 from edera.storages import MongoStorage
+from edera.storages.mongo import MongoVersionClock
 
 
 def test_storage_reports_about_operation_failures():
@@ -15,3 +20,111 @@ def test_storage_reports_about_operation_failures():
         broken_mongo_storage.get("key")
     with pytest.raises(StorageOperationError):
         broken_mongo_storage.put("key", "value")
+
+
+def test_storage_reports_about_write_concern_failures(mocker):
+    collection = mocker.patch.object(MongoStorage, "collection", new_callable=mocker.PropertyMock)
+    collection.return_value.insert_many.side_effect = pymongo.errors.BulkWriteError({
+        "writeErrors": [],
+        "writeConcernErrors": [{"code": 64, "errmsg": "waiting for replication timed out"}],
+    })
+    storage = MongoStorage(None, "database", "storage")
+    with pytest.raises(StorageOperationError):
+        storage.put("key", "value")
+
+
+def test_storage_keeps_records_if_trimming_fails(mocker):
+    collection = mocker.patch.object(MongoStorage, "collection", new_callable=mocker.PropertyMock)
+    collection.return_value.aggregate.side_effect = pymongo.errors.OperationFailure("failure")
+    storage = MongoStorage(None, "database", "storage", max_versions=1)
+    versions = storage.put_many([("key", "value #0"), ("key", "value #1")])
+    assert len(versions) == 2
+    assert collection.return_value.insert_many.call_count == 1
+
+
+def test_storage_skips_versions_taken_by_clients_ahead(mocker):
+    rival_version = int(time.time() * 10**9) + 10**12
+    collection = mocker.patch.object(MongoStorage, "collection", new_callable=mocker.PropertyMock)
+    collection.return_value.insert_many.side_effect = [
+        pymongo.errors.BulkWriteError({
+            "writeErrors": [{
+                "code": 11000,
+                "errmsg": "duplicate key error",
+                "index": 0,
+                "op": {"key": "key", "version": rival_version},
+            }],
+        }),
+        None,
+    ]
+    storage = MongoStorage(None, "database", "storage")
+    assert storage.put("key", "value") == rival_version + 1
+
+
+def test_version_clock_never_goes_back(mocker):
+    clock = MongoVersionClock()
+    mocker.patch("time.time", return_value=2.0)
+    assert clock.tick(2) == [2 * 10**9, 2 * 10**9 + 1]
+    mocker.patch("time.time", return_value=1.0)
+    assert clock.tick() == [2 * 10**9 + 2]
+    clock.observe(3 * 10**9)
+    assert clock.tick() == [3 * 10**9 + 1]
+
+
+def test_storage_generates_unique_increasing_versions(mongo_storage):
+    versions = {}
+
+    def put(index):
+        versions[index] = mongo_storage.put("key", str(index))
+
+    MultiThreadedInvoker({str(i): lambda i=i: put(i) for i in range(10)}).invoke()
+    assert len(set(versions.values())) == 10
+    assert mongo_storage.get("key") == sorted(
+        ((version, str(index)) for index, version in versions.items()), reverse=True)
+
+
+def test_storage_survives_version_conflicts(mocker, mongo, mongo_database):
+    storage = MongoStorage(mongo, mongo_database, "storage")
+    rival_version = MongoStorage(mongo, mongo_database, "storage").put("key", "rival")
+    mocker.patch.object(MongoVersionClock, "tick", autospec=True, side_effect=[
+        [rival_version, rival_version + 1],
+        [rival_version + 1, rival_version + 2],
+    ])
+    versions = storage.put_many([("key", "value #0"), ("key", "value #1")])
+    assert versions == [rival_version + 1, rival_version + 2]
+    assert storage.get("key") == [
+        (rival_version + 2, "value #1"),
+        (rival_version + 1, "value #0"),
+        (rival_version, "rival"),
+    ]
+
+
+def test_storage_discards_duplicate_records_left_by_older_setups(mongo, mongo_database):
+    created = datetime.datetime.utcnow()
+    mongo.instance[mongo_database]["storage"].insert_many([
+        {"key": "key", "version": 1, "value": "value", "created": created},
+        {"key": "key", "version": 1, "value": "value", "created": created},
+        {"key": "key", "version": 2, "value": "another value", "created": created},
+    ])
+    storage = MongoStorage(mongo, mongo_database, "storage")
+    assert storage.get("key") == [(2, "another value"), (1, "value")]
+    with pytest.raises(pymongo.errors.DuplicateKeyError):
+        storage.collection.insert_one({"key": "key", "version": 2, "value": "duplicate"})
+
+
+def test_storage_keeps_only_latest_versions(mongo, mongo_database):
+    storage = MongoStorage(mongo, mongo_database, "storage", max_versions=2)
+    versions = storage.put_many([("key", str(index)) for index in range(5)])
+    storage.put("another key", "value")
+    assert storage.get("key") == [(versions[4], "4"), (versions[3], "3")]
+    assert len(storage.get("another key")) == 1
+
+
+def test_storage_sets_up_expiration_of_records(mongo, mongo_database):
+    storage = MongoStorage(mongo, mongo_database, "storage", max_age=datetime.timedelta(hours=1))
+    storage.put("key", "value")
+    indexes = storage.collection.index_information()
+    assert any(index.get("expireAfterSeconds") == 3600 for index in indexes.values())
+    storage = MongoStorage(mongo, mongo_database, "storage", max_age=datetime.timedelta(hours=2))
+    storage.put("key", "value")
+    indexes = storage.collection.index_information()
+    assert any(index.get("expireAfterSeconds") == 7200 for index in indexes.values())
@@ -0,0 +1,29 @@
+import pytest
+
+from edera.exceptions import StorageOperationError
+from edera.storages import InMemoryStorage
+from edera.storages import ShardedStorage
+
+
+def test_sharded_storage_distributes_keys_among_shards():
+    shards = [InMemoryStorage() for _ in range(3)]
+    storage = ShardedStorage(shards)
+    storage.put_many([(str(i), str(i)) for i in range(30)])
+    assert all(sum(len(shard.get(str(i))) for shard in shards) == 1 for i in range(30))
+    assert all(any(shard.get(str(i)) for i in range(30)) for shard in shards)
+    assert ShardedStorage(shards).get_many([str(i) for i in range(30)], limit=1) == {
+        str(i): [(0, str(i))]
+        for i in range(30)
+    }
+
+
+def test_sharded_storage_propagates_shard_failures():
+
+    class BrokenStorage(InMemoryStorage):
+
+        def put_many(self, pairs):
+            raise StorageOperationError("no")
+
+    storage = ShardedStorage([InMemoryStorage(), BrokenStorage(), InMemoryStorage()])
+    with pytest.raises(StorageOperationError):
+        storage.put_many([(str(i), str(i)) for i in range(30)])
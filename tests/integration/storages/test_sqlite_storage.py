@@ -1,3 +1,4 @@
+import datetime
 import os
 import os.path
 import sqlite3
@@ -6,6 +7,7 @@ import stat
 import pytest
 
 from edera.exceptions import StorageOperationError
+from edera.invokers import MultiThreadedInvoker
 from edera.storages import SQLiteStorage
 
 
@@ -21,3 +23,91 @@ def test_storage_reports_about_execution_failures(sqlite_storage):
         connection.execute("DROP TABLE %s" % sqlite_storage.table)
     with pytest.raises(StorageOperationError):
         sqlite_storage.put("another key", "another value")
+
+
+def test_storage_can_commit_puts_in_groups(sqlite_database):
+    storage = SQLiteStorage(
+        sqlite_database,
+        pool_size=2,
+        commit_delay=datetime.timedelta(milliseconds=50),
+        synchronous="NORMAL",
+        mmap_size=2**20,
+        cache_size=100)
+    versions = {}
+
+    def put(index):
+        versions[index] = storage.put(str(index % 2), str(index))
+
+    MultiThreadedInvoker({str(i): lambda i=i: put(i) for i in range(10)}).invoke()
+    assert len(set(versions.values())) == 10
+    for key in ["0", "1"]:
+        assert storage.get(key) == sorted(
+            ((versions[i], str(i)) for i in versions if str(i % 2) == key), reverse=True)
+
+
+def test_storage_reports_about_group_commit_failures(sqlite_database):
+    storage = SQLiteStorage(sqlite_database, commit_delay=datetime.timedelta(milliseconds=10))
+    storage.put("key", "value")
+    with sqlite3.connect(storage.database) as connection:
+        connection.execute("DROP TABLE %s" % storage.table)
+    with pytest.raises(StorageOperationError):
+        storage.put("another key", "another value")
+
+
+@pytest.mark.parametrize("vacuum,reclaimed", [("full", True), ("incremental", True), (None, False)])
+def test_storage_reclaims_free_space_according_to_policy(sqlite_database, vacuum, reclaimed):
+    storage = SQLiteStorage(sqlite_database, vacuum=vacuum)
+    storage.put_many([("key", "value" * 1000) for _ in range(100)])
+    storage.delete("key")
+    with sqlite3.connect(storage.database) as connection:
+        free_page_count = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    assert (free_page_count == 0) == reclaimed
+
+
+def test_storage_switches_existing_databases_to_incremental_vacuuming(sqlite_database):
+    SQLiteStorage(sqlite_database, vacuum="full").put("key", "value")
+    storage = SQLiteStorage(sqlite_database, vacuum="incremental")
+    assert storage.get("key")
+    with sqlite3.connect(storage.database) as connection:
+        assert connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_storage_keeps_only_latest_versions(sqlite_database):
+    storage = SQLiteStorage(sqlite_database, max_versions=2)
+    versions = storage.put_many([("key", str(index)) for index in range(5)])
+    storage.put("another key", "value")
+    assert storage.get("key") == [(versions[4], "4"), (versions[3], "3")]
+    assert len(storage.get("another key")) == 1
+
+
+@pytest.mark.parametrize("vacuum,vacuumed", [("full", False), ("incremental", True)])
+def test_storage_releases_space_on_puts_only_incrementally(sqlite_database, vacuum, vacuumed):
+    storage = SQLiteStorage(sqlite_database, vacuum=vacuum, max_versions=1)
+    storage.put_many([("key", "value" * 1000) for _ in range(100)])
+    with sqlite3.connect(storage.database) as connection:
+        free_page_count = connection.execute("PRAGMA freelist_count").fetchone()[0]
+    assert (free_page_count == 0) == vacuumed
+
+
+def test_storage_discards_expired_records(mocker, sqlite_database):
+    mocker.patch.object(SQLiteStorage, "PRUNING_INTERVAL", datetime.timedelta(0))
+    time = mocker.patch("time.time", return_value=1000.0)
+    storage = SQLiteStorage(sqlite_database, max_age=datetime.timedelta(seconds=10))
+    storage.put("key", "old value")
+    storage.put("another key", "value")
+    time.return_value = 1005.0
+    version = storage.put("key", "new value")
+    time.return_value = 1012.0
+    storage.put("third key", "value")
+    assert storage.get("key") == [(version, "new value")]
+    assert storage.get("another key") == []
+
+
+def test_storage_migrates_tables_created_by_older_versions(sqlite_database):
+    with sqlite3.connect(sqlite_database) as connection:
+        connection.execute(
+            "CREATE TABLE master (key TEXT, version INTEGER PRIMARY KEY, value TEXT)")
+        connection.execute("INSERT INTO master (key, value) VALUES ('key', 'value')")
+    storage = SQLiteStorage(sqlite_database, max_age=datetime.timedelta(days=1))
+    assert storage.get("key") == [(1, "value")]
+    assert storage.put("key", "another value") == 2
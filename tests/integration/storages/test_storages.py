@@ -44,3 +44,58 @@ def test_storage_deletes_records_correctly(storage):
     assert not storage.get("my key #0")
     storage.delete("my key #1")
     assert not storage.get("my key #1")
+
+
+def test_storage_puts_and_gets_records_in_batches_correctly(storage):
+    assert storage.put_many([]) == []
+    v0, v1, v2 = storage.put_many([
+        ("my key #0", "my value #0"),
+        ("my key #1", "my value #1"),
+        ("my key #0", "my value #2"),
+    ])
+    assert v2 > v0
+    assert storage.get("my key #0") == [(v2, "my value #2"), (v0, "my value #0")]
+    assert storage.get_many([]) == {}
+    assert storage.get_many(["my key #0", "my key #1", "my key #2"]) == {
+        "my key #0": [(v2, "my value #2"), (v0, "my value #0")],
+        "my key #1": [(v1, "my value #1")],
+        "my key #2": [],
+    }
+    assert storage.get_many(["my key #0", "my key #1"], limit=1) == {
+        "my key #0": [(v2, "my value #2")],
+        "my key #1": [(v1, "my value #1")],
+    }
+    assert storage.get_many(["my key #0"], limit=0) == {"my key #0": []}
+    assert storage.get_many(["my key #0"], since=v2) == {"my key #0": [(v2, "my value #2")]}
+
+
+def test_storage_deletes_records_in_batches_correctly(storage):
+    storage.put("my key #0", "my value #0")
+    storage.put("my key #1", "my value #1")
+    v2 = storage.put("my key #0", "my value #2")
+    storage.put("my key #2", "my value #3")
+    storage.delete_many([])
+    storage.delete_many([("my key #0", v2), ("my key #1", None), ("my key #3", None)])
+    assert storage.get("my key #0") == [(v2, "my value #2")]
+    assert not storage.get("my key #1")
+    assert len(storage.get("my key #2")) == 1
+
+
+def test_storage_scans_records_by_key_prefix_correctly(storage):
+    v0 = storage.put("my key #0", "my value #0")
+    v1 = storage.put("my key #1", "my value #1")
+    v2 = storage.put("my key #0", "my value #2")
+    storage.put("your key", "your value")
+    storage.put("my kez", "my value")
+    storage.put("my key #2", "my value #3")
+    storage.delete("my key #2")
+    assert storage.scan("my key #") == {
+        "my key #0": [(v2, "my value #2")],
+        "my key #1": [(v1, "my value #1")],
+    }
+    assert storage.scan("my key #", latest_only=False) == {
+        "my key #0": [(v2, "my value #2"), (v0, "my value #0")],
+        "my key #1": [(v1, "my value #1")],
+    }
+    assert set(storage.scan("")) == {"my key #0", "my key #1", "your key", "my kez"}
+    assert storage.scan("nothing") == {}
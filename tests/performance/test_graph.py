@@ -0,0 +1,36 @@
+import pytest
+
+from edera import Graph
+from edera import Task
+from edera import TaskWrapper
+from edera.linearizers import DFSLinearizer
+
+
+class T(Task):
+
+    def __init__(self, index):
+        self.index = index
+
+    @property
+    def name(self):
+        return "T%d" % self.index
+
+
+@pytest.mark.parametrize("depth", [0, 1, 5])
+def test_graph_handles_wrapped_tasks_fast_enough(benchmark, depth):
+
+    def process():
+        for task in tasks:
+            graph[task]["key"] = task in graph
+        DFSLinearizer().linearize(graph)
+        graph.subgraph(tasks[::2])
+
+    tasks = [T(index) for index in range(1000)]
+    for _ in range(depth):
+        tasks = [TaskWrapper(task) for task in tasks]
+    graph = Graph()
+    for task in tasks:
+        graph.add(task)
+    for parent, child in zip(tasks, tasks[1:]):
+        graph.link(parent, child)
+    benchmark(process)
@@ -0,0 +1,49 @@
+import pytest
+
+from edera import deferrable
+from edera import routine
+from edera.flags import InterThreadFlag
+
+
+def check():
+    return True
+
+
+@routine
+def wrap(function):
+    result = yield deferrable(function).defer()
+    yield result
+
+
+@pytest.mark.parametrize("depth", [0, 1, 5])
+def test_routine_dispatches_tasks_fast_enough(benchmark, depth):
+
+    def audit():
+        if flag.raised:
+            raise SystemExit
+
+    def dispatch():
+        for _ in range(100):
+            function()
+
+    flag = InterThreadFlag()
+    function = check
+    for _ in range(depth):
+        function = wrap.fix(function)
+    function = deferrable(function)[audit]
+    benchmark(dispatch)
+
+
+@pytest.mark.parametrize("count", [1, 5, 25])
+def test_routine_calls_auditors_fast_enough(benchmark, count):
+
+    @routine
+    def step():
+        for _ in range(100):
+            yield
+
+    auditors = [(lambda: None) for _ in range(count)]
+    audited_step = step
+    for auditor in auditors:
+        audited_step = audited_step[auditor]
+    benchmark(audited_step)
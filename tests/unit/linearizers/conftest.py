@@ -2,6 +2,7 @@ import pytest
 
 from edera import Graph
 from edera.linearizers import DFSLinearizer
+from edera.linearizers import KahnLinearizer
 
 
 @pytest.fixture
@@ -56,6 +57,11 @@ def dfs_linearizer():
     return DFSLinearizer()
 
 
-@pytest.fixture(params=["dfs_linearizer"])
+@pytest.fixture
+def kahn_linearizer():
+    return KahnLinearizer()
+
+
+@pytest.fixture(params=["dfs_linearizer", "kahn_linearizer"])
 def linearizer(request):
     return request.getfixturevalue(request.param)
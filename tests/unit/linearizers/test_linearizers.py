@@ -1,6 +1,10 @@
 import pytest
 
+from edera import FrozenGraph
+from edera import Graph
 from edera.exceptions import CircularDependencyError
+from edera.linearizers import DFSLinearizer
+from edera.linearizers import KahnLinearizer
 
 
 def test_linearizer_performs_topological_ordering(valid_graph, linearizer):
@@ -18,3 +22,43 @@ def test_linearizer_detects_circular_dependencies(invalid_graph, linearizer):
 
 def test_linearizer_can_handle_really_deep_graphs(really_deep_graph, linearizer):
     assert linearizer.linearize(really_deep_graph) == list(range(10000))
+
+
+def test_linearizer_can_handle_frozen_graphs(valid_graph, linearizer):
+    frozen_graph = FrozenGraph(valid_graph)
+    ordering = linearizer.linearize(frozen_graph)
+    assert set(ordering) == set(valid_graph)
+    for index, item in enumerate(ordering):
+        assert frozen_graph[item].parents <= set(ordering[:index])
+
+
+def test_kahn_linearizer_splits_graph_into_levels(valid_graph):
+    assert KahnLinearizer().stratify(valid_graph) == [[1, 3], [2, 4], [5], [6, 7], [8]]
+    assert KahnLinearizer().linearize(valid_graph) == [1, 3, 2, 4, 5, 6, 7, 8]
+
+
+def test_kahn_linearizer_reports_all_cycles():
+    graph = Graph()
+    for item in range(1, 8):
+        graph.add(item)
+    graph.link(1, 2)
+    graph.link(2, 3)
+    graph.link(3, 1)
+    graph.link(3, 4)
+    graph.link(4, 5)
+    graph.link(5, 6)
+    graph.link(6, 5)
+    graph.link(7, 7)
+    graph.link(7, 1)
+    with pytest.raises(CircularDependencyError) as info:
+        KahnLinearizer().linearize(graph)
+    assert info.value.components == [[1, 2, 3], [5, 6], [7]]
+    assert info.value.cycle == [1, 2, 3]
+
+
+def test_dfs_linearizer_linearizes_frozen_graphs_by_ids(valid_graph):
+    frozen_graph = FrozenGraph(valid_graph)
+    ordering = DFSLinearizer().linearize_ids(frozen_graph)
+    assert sorted(ordering) == list(range(len(frozen_graph)))
+    for position, index in enumerate(ordering):
+        assert set(frozen_graph.get_parents(index)) <= set(ordering[:position])
@@ -180,6 +180,18 @@ def test_workflow_update_detects_stale_tasks_correctly():
     assert not snapshot.core.states[snapshot.core.aliases["C1"]].stale
 
 
+def test_workflow_update_detects_stale_tasks_in_diamond_chains_quickly():
+    dependencies = {"J0": set()}
+    for level in range(1, 50):
+        dependencies["L%dA" % level] = {"J%d" % (level - 1)}
+        dependencies["L%dB" % level] = {"J%d" % (level - 1)}
+        dependencies["J%d" % level] = {"L%dA" % level, "L%dB" % level}
+    snapshot = MonitoringSnapshot.void()
+    list(WorkflowUpdate(dependencies, set(), {}).apply(snapshot, "X"))
+    list(WorkflowUpdate({"Z": set()}, set(), {}).apply(snapshot, "X"))
+    assert all(snapshot.core.states[snapshot.core.aliases[task]].stale for task in dependencies)
+
+
 def test_task_status_update_adds_missing_task():
     snapshot = MonitoringSnapshot.void()
     timestamp = edera.helpers.now()
@@ -220,3 +220,39 @@ def test_conditions_constraint_gets_derived_correctly():
     equivalence = sympyboolalg.Equivalent(derived_constraint, expected_constraint)
     assert sympyboolalg.simplify_logic(equivalence) is sympyboolalg.true
 
+
+
+def test_conditions_get_checked_in_bulk_if_possible():
+
+    class Row(Condition):
+
+        def __init__(self, index):
+            self.index = index
+
+        def check(self):
+            assert False
+
+        @classmethod
+        def check_many(cls, conditions):
+            queries.append(len(conditions))
+            return [condition.index % 2 == 0 for condition in conditions]
+
+        @property
+        def name(self):
+            return "Row%d" % self.index
+
+    queries = []
+    conditions = [
+        Row(0),
+        ConditionWrapper(Row(1)),
+        Row(2),
+        Falsifier(Row(3)),
+        AlwaysTrue(),
+        ConditionWrapper(Row(4)),
+        Row(5),
+    ]
+    assert edera.condition.batch_conditions(conditions) == [[0, 2, 6], [1, 5], [3], [4]]
+    values = edera.condition.check_in_bulk(conditions)
+    assert values == {0: True, 1: False, 2: True, 5: True, 6: False}
+    assert sorted(queries) == [2, 3]
+    assert Condition.check_many([AlwaysTrue(), AlwaysFalse()]) == [True, False]
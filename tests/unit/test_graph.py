@@ -1,5 +1,6 @@
 import pytest
 
+from edera import FrozenGraph
 from edera import Graph
 
 
@@ -162,6 +163,46 @@ def test_graph_allows_to_remove_items():
     assert not graph["D"].parents
 
 
+def test_graph_allows_to_retain_items():
+    graph = Graph()
+    graph.add("A")
+    graph.add("B")
+    graph.add("C")
+    graph.add("D")
+    graph.link("A", "B")
+    graph.link("B", "C")
+    graph.link("C", "D")
+    graph.link("A", "D")
+    graph.retain(["A", "D"])
+    assert set(graph) == {"A", "D"}
+    assert graph["A"].children == {"D"}
+    assert graph["D"].parents == {"A"}
+    with pytest.raises(AssertionError):
+        graph.retain(["B"])
+    graph.retain([])
+    assert not graph
+
+
+def test_graph_allows_to_extract_subgraphs():
+    graph = Graph()
+    graph.add("A")
+    graph.add("B")
+    graph.add("C")
+    graph.link("A", "B")
+    graph.link("B", "C")
+    graph["B"]["key"] = "value"
+    subgraph = graph.subgraph(["B", "C"])
+    assert set(subgraph) == {"B", "C"}
+    assert not subgraph["B"].parents
+    assert subgraph["B"].children == {"C"}
+    assert subgraph["B"].annotation == {"key": "value"}
+    subgraph["B"]["key"] = "another value"
+    subgraph.remove("C")
+    assert graph["B"]["key"] == "value"
+    assert graph["B"].children == {"C"}
+    assert set(graph) == {"A", "B", "C"}
+
+
 def test_graph_clusterizes_items_correctly():
     graph = Graph()
     graph.add("A")
@@ -189,3 +230,45 @@ def test_graph_traces_relatives_correctly():
     graph.link("A", "E")
     assert graph.trace("C", "A") == {"A", "D", "E"}
     assert graph.trace("A", "D") == {"B", "C", "E"}
+
+
+def test_frozen_graph_mirrors_original_graph():
+    graph = Graph()
+    graph.add("A")
+    graph.add("B")
+    graph.add("C")
+    graph.link("A", "B")
+    graph.link("A", "C")
+    graph.link("B", "C")
+    frozen_graph = FrozenGraph(graph, ["A", "B", "C"])
+    assert list(frozen_graph) == ["A", "B", "C"]
+    assert len(frozen_graph) == 3
+    assert "B" in frozen_graph
+    assert "D" not in frozen_graph
+    assert frozen_graph["A"].item == "A"
+    assert frozen_graph["A"].children == {"B", "C"}
+    assert frozen_graph["C"].parents == {"A", "B"}
+    assert not frozen_graph["A"].parents
+    assert sorted(frozen_graph.get_children(frozen_graph.index("A"))) == [1, 2]
+    assert list(frozen_graph.get_parents(frozen_graph.index("B"))) == [0]
+    assert list(frozen_graph.parent_offsets) == [0, 0, 1, 3]
+    assert frozen_graph.trace("C", "A") == {"A", "B"}
+    assert frozen_graph.trace("A", "D") == {"B", "C"}
+    frozen_graph["B"]["key"] = "value"
+    assert graph["B"]["key"] == "value"
+
+
+def test_frozen_graph_can_be_thawed():
+    graph = Graph()
+    graph.add("A")
+    graph.add("B")
+    graph.link("A", "B")
+    graph["A"]["key"] = "value"
+    thawed_graph = FrozenGraph(graph).thaw()
+    assert set(thawed_graph) == {"A", "B"}
+    assert thawed_graph["A"].children == {"B"}
+    assert thawed_graph["B"].parents == {"A"}
+    thawed_graph["A"]["key"] = "another value"
+    thawed_graph.remove("B")
+    assert graph["A"]["key"] == "value"
+    assert graph["A"].children == {"B"}
@@ -1,5 +1,6 @@
 import pytest
 
+from edera import ImmutablyNameable
 from edera import Nameable
 
 
@@ -58,3 +59,23 @@ def test_nameable_can_be_used_as_dictionary_key():
 
 def test_nameable_is_represented_by_its_name():
     assert repr(Thing()) == str(Thing()) == "thing"
+
+
+def test_immutably_nameable_evaluates_its_name_only_once():
+
+    class CountingThing(ImmutablyNameable):
+
+        evaluations = 0
+
+        @property
+        def name(self):
+            CountingThing.evaluations += 1
+            return "thing"
+
+    counting_thing = CountingThing()
+    assert counting_thing == Thing()
+    assert hash(counting_thing) == hash(Thing())
+    assert counting_thing != ThisThing()
+    assert counting_thing in {CountingThing()}
+    assert {counting_thing: 1}[counting_thing] == 1
+    assert CountingThing.evaluations == 2
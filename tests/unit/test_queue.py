@@ -1,5 +1,6 @@
 import pytest
 
+from edera import FrozenGraph
 from edera import Graph
 from edera import Queue
 
@@ -85,3 +86,15 @@ def test_empty_queue_can_do_nothing_but_fail():
         queue.accept()
     with pytest.raises(AssertionError):
         queue.discard()
+
+
+def test_queue_can_traverse_frozen_graphs():
+    graph = Graph()
+    for item in range(3):
+        graph.add(item)
+        graph[item]["rank"] = item
+    graph.link(0, 1)
+    queue = Queue(FrozenGraph(graph))
+    assert list(queue) == [0, 1, 2]
+    queue.discard()
+    assert queue.pick() == 2
@@ -0,0 +1,52 @@
+import pytest
+
+from edera import Graph
+from edera import ReachabilityIndex
+from edera.exceptions import CircularDependencyError
+
+
+@pytest.fixture
+def graph():
+    result = Graph()
+    for item in "ABCDEF":
+        result.add(item)
+    result.link("A", "B")
+    result.link("B", "C")
+    result.link("A", "D")
+    result.link("D", "E")
+    result.link("C", "E")
+    result.link("F", "E")
+    return result
+
+
+def test_reachability_index_traces_relatives_like_graph(graph):
+    index = ReachabilityIndex(graph)
+    assert len(index) == 6
+    for item in graph:
+        assert index.trace(item, "A") == graph.trace(item, "A")
+        assert index.trace(item, "D") == graph.trace(item, "D")
+
+
+def test_reachability_index_supports_bitwise_operations(graph):
+    index = ReachabilityIndex(graph)
+    mask = index.reach("E", "A") & ~index.reach("C", "A")
+    assert set(index.decode(mask)) == {"C", "D", "F"}
+    assert index.decode(index.encode(["B", "A"])) == ["A", "B"]
+
+
+@pytest.mark.parametrize("items", [("B",), ("A", "B"), ("E", "F"), ("C", "D")])
+def test_reachability_index_stays_exact_after_removal(graph, items):
+    index = ReachabilityIndex(graph)
+    index.remove(*items)
+    graph.remove(*items)
+    assert len(index) == len(graph)
+    assert all(item not in index for item in items)
+    for item in graph:
+        assert index.trace(item, "A") == graph.trace(item, "A")
+        assert index.trace(item, "D") == graph.trace(item, "D")
+
+
+def test_reachability_index_refuses_cyclic_graphs(graph):
+    graph.link("E", "A")
+    with pytest.raises(CircularDependencyError):
+        ReachabilityIndex(graph)
@@ -145,6 +145,25 @@ def test_routine_auditors_can_raise_exception():
         swallow[audit]()
 
 
+def test_routine_calls_flattened_auditors_in_order():
+
+    @routine
+    def step():
+        yield
+        yield deferred_call
+        yield deferred_call
+
+    @routine
+    def substep():
+        yield
+
+    deferred_call = substep.defer()
+    calls = []
+    step[lambda: calls.append(1)][lambda: calls.append(2), lambda: calls.append(3)]()
+    assert calls == [1, 2, 3] * 5
+    assert deferred_call.instance is substep
+
+
 def test_routine_can_fix_some_arguments():
 
     @routine
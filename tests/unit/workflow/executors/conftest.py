@@ -0,0 +1,4 @@
+import sys
+
+
+collect_ignore = [] if sys.version_info >= (3, 5) else ["test_async_workflow_executor.py"]
@@ -0,0 +1,174 @@
+import asyncio
+import datetime
+
+import pytest
+
+from edera import Condition
+from edera import Task
+from edera import Timer
+from edera.exceptions import ExcusableError
+from edera.exceptions import ExcusableWorkflowExecutionError
+from edera.exceptions import WorkflowExecutionError
+from edera.requisites import shortcut
+from edera.routine import routine
+from edera.storages import InMemoryStorage
+from edera.workflow import WorkflowBuilder
+from edera.workflow.executors import AsyncWorkflowExecutor
+from edera.workflow.executors import BasicWorkflowExecutor
+from edera.workflow.processors import TargetCacher
+from edera.workflow.processors import TaskRanker
+
+
+class Gate(object):
+
+    def __init__(self, size):
+        self.size = size
+        self.arrivals = 0
+        self.event = None
+
+    async def pass_through(self):
+        if self.event is None:
+            self.event = asyncio.Event()
+        self.arrivals += 1
+        if self.arrivals == self.size:
+            self.event.set()
+        await asyncio.wait_for(self.event.wait(), 5)
+
+
+gates = []
+executed_tasks = []
+
+
+class Present(Condition):
+
+    def __init__(self, index):
+        self.index = index
+
+    async def check(self):
+        for gate in gates:
+            await gate.pass_through()
+        return self.index % 2 == 0
+
+    @property
+    def name(self):
+        return "Present(%d)" % self.index
+
+
+class Leaf(Task):
+
+    def __init__(self, index):
+        self.index = index
+
+    async def execute(self):
+        await asyncio.sleep(0)
+        executed_tasks.append(self.name)
+
+    @property
+    def name(self):
+        return "Leaf(%d)" % self.index
+
+    @property
+    def target(self):
+        return Present(self.index)
+
+
+class Root(Task):
+
+    @routine
+    def execute(self):
+        yield
+        executed_tasks.append(self.name)
+
+    @shortcut
+    def requisite(self):
+        return [Leaf(index) for index in range(100)]
+
+
+class Stopping(Task):
+
+    def execute(self):
+        raise ExcusableError("stop")
+
+
+class Failing(Task):
+
+    async def execute(self):
+        raise RuntimeError()
+
+
+class Sleeping(Task):
+
+    async def execute(self):
+        await asyncio.sleep(60)
+
+
+class Looping(Task):
+
+    @routine
+    def execute(self):
+        while True:
+            yield
+
+
+class Descendant(Task):
+
+    def execute(self):
+        executed_tasks.append(self.name)
+
+    @shortcut
+    def requisite(self):
+        return [Stopping(), Failing()]
+
+
+def test_async_workflow_executor_awaits_checks_simultaneously():
+    del executed_tasks[:]
+    workflow = WorkflowBuilder().build(Root())
+    TaskRanker().process(workflow)
+    gates.append(Gate(100))
+    try:
+        AsyncWorkflowExecutor(thread_count=1).execute(workflow)
+    finally:
+        del gates[:]
+    assert len(executed_tasks) == 51
+    assert executed_tasks[-1] == "Root"
+
+
+def test_async_workflow_executor_handles_failed_tasks_correctly():
+    del executed_tasks[:]
+    workflow = WorkflowBuilder().build(Descendant())
+    TaskRanker().process(workflow)
+    with pytest.raises(WorkflowExecutionError) as info:
+        AsyncWorkflowExecutor().execute(workflow)
+    assert [task.name for task in info.value.failed_tasks] == ["Failing"]
+    assert not executed_tasks
+
+
+def test_async_workflow_executor_handles_stopped_tasks_correctly():
+    workflow = WorkflowBuilder().build(Stopping())
+    TaskRanker().process(workflow)
+    with pytest.raises(ExcusableWorkflowExecutionError):
+        AsyncWorkflowExecutor().execute(workflow)
+
+
+def test_basic_workflow_executor_runs_coroutine_functions_as_well():
+    del executed_tasks[:]
+    workflow = WorkflowBuilder().build(Leaf(1))
+    TargetCacher(InMemoryStorage()).process(workflow)
+    TaskRanker().process(workflow)
+    BasicWorkflowExecutor().execute(workflow)
+    assert executed_tasks == ["Leaf(1)"]
+
+
+def test_async_workflow_executor_is_interruptible():
+
+    class Sleepers(Task):
+
+        @shortcut
+        def requisite(self):
+            return [Sleeping(), Looping()]
+
+    workflow = WorkflowBuilder().build(Sleepers())
+    TaskRanker().process(workflow)
+    timer = Timer(datetime.timedelta(milliseconds=200))
+    with pytest.raises(Timer.Timeout):
+        AsyncWorkflowExecutor().execute[timer](workflow)
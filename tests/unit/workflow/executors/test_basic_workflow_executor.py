@@ -84,3 +84,56 @@ def test_basic_workflow_executor_handles_failed_tasks_correctly():
     TaskRanker().process(workflow)
     with pytest.raises(WorkflowExecutionError):
         BasicWorkflowExecutor().execute(workflow)
+
+
+def test_basic_workflow_executor_checks_targets_in_bulk_if_possible():
+
+    class Row(Condition):
+
+        def __init__(self, index):
+            self.index = index
+
+        def check(self):
+            checks.append(self.index)
+            return self.index in rows
+
+        @classmethod
+        def check_many(cls, conditions):
+            queries.append(len(conditions))
+            return [condition.index in rows for condition in conditions]
+
+        @property
+        def name(self):
+            return "Row%d" % self.index
+
+    class Insert(Task):
+
+        def __init__(self, index):
+            self.index = index
+
+        def execute(self):
+            rows.add(self.index)
+
+        @property
+        def name(self):
+            return "Insert%d" % self.index
+
+        @property
+        def target(self):
+            return Row(self.index)
+
+    class InsertAll(Task):
+
+        @shortcut
+        def requisite(self):
+            return [Insert(index) for index in range(5)]
+
+    rows = {0, 2}
+    checks = []
+    queries = []
+    workflow = WorkflowBuilder().build(InsertAll())
+    TaskRanker().process(workflow)
+    BasicWorkflowExecutor().execute(workflow)
+    assert rows == set(range(5))
+    assert queries == [5]
+    assert sorted(checks) == [1, 3, 4]
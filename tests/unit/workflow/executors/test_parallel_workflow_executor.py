@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+
+from edera import Condition
+from edera import Task
+from edera.exceptions import ExcusableError
+from edera.exceptions import ExcusableWorkflowExecutionError
+from edera.exceptions import WorkflowExecutionError
+from edera.requisites import shortcut
+from edera.workflow import WorkflowBuilder
+from edera.workflow.executors import ParallelWorkflowExecutor
+from edera.workflow.processors import TaskRanker
+
+
+class AlreadyComplete(Condition):
+
+    def check(self):
+        return True
+
+
+class A(Task):
+
+    def execute(self):
+        raise RuntimeError()
+
+    @property
+    def target(self):
+        return AlreadyComplete()
+
+
+class B(Task):
+
+    @shortcut
+    def requisite(self):
+        return A()
+
+
+class C(Task):
+
+    def execute(self):
+        raise ExcusableError()
+
+    @shortcut
+    def requisite(self):
+        return {self: B(), D(): self}
+
+
+class D(Task):
+
+    def execute(self):
+        raise RuntimeError()
+
+
+class E(Task):
+
+    def execute(self):
+        pass
+
+    @shortcut
+    def requisite(self):
+        return {self: B(), F(): self}
+
+
+class F(Task):
+
+    def execute(self):
+        raise RuntimeError()
+
+
+arrivals = {"G": threading.Event(), "H": threading.Event()}
+executed_tasks = []
+
+
+class G(Task):
+
+    def execute(self):
+        arrivals["G"].set()
+        assert arrivals["H"].wait(5)
+        executed_tasks.append(self.name)
+
+
+class H(Task):
+
+    def execute(self):
+        arrivals["H"].set()
+        assert arrivals["G"].wait(5)
+        executed_tasks.append(self.name)
+
+
+class I(Task):
+
+    def execute(self):
+        executed_tasks.append(self.name)
+
+    @shortcut
+    def requisite(self):
+        return [G(), H()]
+
+
+def test_parallel_workflow_executor_finishes_if_all_is_ok():
+    workflow = WorkflowBuilder().build(B())
+    TaskRanker().process(workflow)
+    ParallelWorkflowExecutor(2).execute(workflow)
+
+
+def test_parallel_workflow_executor_runs_independent_tasks_simultaneously():
+    del executed_tasks[:]
+    workflow = WorkflowBuilder().build(I())
+    TaskRanker().process(workflow)
+    ParallelWorkflowExecutor(2).execute(workflow)
+    assert sorted(executed_tasks[:2]) == ["G", "H"]
+    assert executed_tasks[2:] == ["I"]
+
+
+def test_parallel_workflow_executor_handles_stopped_tasks_correctly():
+    workflow = WorkflowBuilder().build(C())
+    TaskRanker().process(workflow)
+    with pytest.raises(ExcusableWorkflowExecutionError):
+        ParallelWorkflowExecutor(2).execute(workflow)
+
+
+def test_parallel_workflow_executor_handles_failed_tasks_correctly():
+    workflow = WorkflowBuilder().build(E())
+    TaskRanker().process(workflow)
+    with pytest.raises(WorkflowExecutionError) as info:
+        ParallelWorkflowExecutor(2).execute(workflow)
+    assert [task.name for task in info.value.failed_tasks] == ["F"]
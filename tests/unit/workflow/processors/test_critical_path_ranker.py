@@ -0,0 +1,62 @@
+import datetime
+
+from edera import Task
+from edera.requisites import Annotate
+from edera.requisites import shortcut
+from edera.workflow import WorkflowBuilder
+from edera.workflow.processors import CriticalPathRanker
+
+
+class Link(Task):
+
+    def __init__(self, chain, index):
+        self.chain = chain
+        self.index = index
+
+    def execute(self):
+        pass
+
+    @property
+    def name(self):
+        return "%s%d" % (self.chain, self.index)
+
+    @shortcut
+    def requisite(self):
+        if self.index > 0:
+            return Link(self.chain, self.index - 1)
+
+
+class Slow(Task):
+
+    def execute(self):
+        pass
+
+    @shortcut
+    def requisite(self):
+        return Annotate("duration", datetime.timedelta(minutes=1))
+
+
+class Root(Task):
+
+    @shortcut
+    def requisite(self):
+        return [Link("A", 0), Link("B", 2), Slow()]
+
+
+def test_critical_path_ranker_prefers_longest_chains():
+    workflow = WorkflowBuilder().build(Root())
+    CriticalPathRanker().process(workflow)
+    assert workflow[Link("B", 0)]["critical_path"] == datetime.timedelta(seconds=3)
+    assert workflow[Root()]["critical_path"] == datetime.timedelta(0)
+    ranking = sorted(workflow, key=(lambda task: workflow[task]["rank"]))
+    assert [task.name for task in ranking[:3]] == ["Slow", "B0", "B1"]
+    assert {task.name for task in ranking[3:5]} == {"A0", "B2"}
+    assert ranking[5].name == "Root"
+
+
+def test_critical_path_ranker_relies_on_known_durations():
+    workflow = WorkflowBuilder().build(Root())
+    durations = {"A0": datetime.timedelta(hours=1), "Slow": datetime.timedelta(0)}
+    CriticalPathRanker(durations).process(workflow)
+    ranking = sorted(workflow, key=(lambda task: workflow[task]["rank"]))
+    assert [task.name for task in ranking] == ["A0", "B0", "B1", "B2", "Slow", "Root"]
@@ -110,3 +110,133 @@ def test_target_cacher_ignores_errors():
     assert counter[0] == 1
     assert workflow[T()].item.target.check()
     assert counter[0] == 2
+
+
+def test_target_cacher_can_prefetch_targets():
+
+    class CountingStorage(InMemoryStorage):
+
+        def get(self, key, since=None, limit=None):
+            counter[1] += 1
+            return InMemoryStorage.get(self, key, since=since, limit=limit)
+
+        def get_many(self, keys, since=None, limit=None):
+            counter[2] += 1
+            return InMemoryStorage.get_many(self, keys, since=since, limit=limit)
+
+    class C(Condition):
+
+        def __init__(self, index):
+            self.index = index
+
+        def check(self):
+            counter[0] += 1
+            return self.index % 2 == 0
+
+        @property
+        def name(self):
+            return "C%d" % self.index
+
+    class T(Task):
+
+        def __init__(self, index):
+            self.index = index
+
+        @property
+        def name(self):
+            return "T%d" % self.index
+
+        @property
+        def target(self):
+            return C(self.index)
+
+    class X(Task):
+
+        @shortcut
+        def requisite(self):
+            return [T(i) for i in range(4)]
+
+    counter = [0, 0, 0]
+    cache = CountingStorage()
+    workflow = WorkflowBuilder().build(X())
+    TargetCacher(cache, prefetch=True).process(workflow)
+    assert [workflow[T(i)].item.target.check() for i in range(4)] == [True, False, True, False]
+    assert [workflow[T(i)].item.target.check() for i in range(4)] == [True, False, True, False]
+    assert counter == [6, 0, 1]
+    workflow = WorkflowBuilder().build(X())
+    TargetCacher(cache, prefetch=True).process(workflow)
+    assert [workflow[T(i)].item.target.check() for i in range(4)] == [True, False, True, False]
+    assert counter == [8, 0, 2]
+
+
+def test_target_cacher_falls_back_to_lazy_lookups_if_prefetching_fails():
+
+    class BatchlessStorage(InMemoryStorage):
+
+        def get_many(self, keys, since=None, limit=None):
+            raise StorageOperationError("no")
+
+    class C(Condition):
+
+        def check(self):
+            counter[0] += 1
+            return True
+
+    class T(Task):
+
+        target = C()
+
+    counter = [0]
+    workflow = WorkflowBuilder().build(T())
+    cache = BatchlessStorage()
+    TargetCacher(cache, prefetch=True).process(workflow)
+    assert workflow[T()].item.target.check()
+    assert workflow[T()].item.target.check()
+    assert counter[0] == 1
+
+
+def test_target_cacher_supports_bulk_checks():
+
+    class C(Condition):
+
+        def __init__(self, index):
+            self.index = index
+
+        def check(self):
+            assert False
+
+        @classmethod
+        def check_many(cls, conditions):
+            queries.append(sorted(condition.index for condition in conditions))
+            return [condition.index % 2 == 0 for condition in conditions]
+
+        @property
+        def name(self):
+            return "C%d" % self.index
+
+    class T(Task):
+
+        def __init__(self, index):
+            self.index = index
+
+        @property
+        def name(self):
+            return "T%d" % self.index
+
+        @property
+        def target(self):
+            return C(self.index)
+
+    class X(Task):
+
+        @shortcut
+        def requisite(self):
+            return [T(index) for index in range(4)]
+
+    queries = []
+    workflow = WorkflowBuilder().build(X())
+    TargetCacher(InMemoryStorage()).process(workflow)
+    targets = [workflow[T(index)].item.target for index in range(4)]
+    assert type(targets[0]).check_many(targets) == [True, False, True, False]
+    assert type(targets[0]).check_many(targets) == [True, False, True, False]
+    assert queries == [[0, 1, 2, 3], [1, 3]]
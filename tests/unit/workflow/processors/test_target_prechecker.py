@@ -51,3 +51,53 @@ def test_target_prechecker_skips_task_execution_if_possible():
     workflow = WorkflowBuilder().build(T())
     TargetPreChecker().process(workflow)
     workflow[T()].item.execute()
+
+
+def test_target_prechecker_checks_targets_in_bulk_if_possible():
+
+    class C(Condition):
+
+        def __init__(self, index):
+            self.index = index
+
+        def check(self):
+            assert False
+
+        @classmethod
+        def check_many(cls, conditions):
+            queries.append(len(conditions))
+            return [condition.index == 0 for condition in conditions]
+
+        @property
+        def name(self):
+            return "C%d" % self.index
+
+    class T(Task):
+
+        def __init__(self, index):
+            self.index = index
+
+        def execute(self):
+            raise RuntimeError
+
+        @property
+        def name(self):
+            return "T%d" % self.index
+
+        @property
+        def target(self):
+            return C(self.index)
+
+    class X(Task):
+
+        @shortcut
+        def requisite(self):
+            return [T(0), T(1)]
+
+    queries = []
+    workflow = WorkflowBuilder().build(X())
+    TargetPreChecker().process(workflow)
+    assert queries == [2]
+    workflow[T(0)].item.execute()
+    with pytest.raises(AssertionError):
+        workflow[T(1)].item.execute()
@@ -0,0 +1,76 @@
+from edera import Condition
+from edera import Task
+from edera.condition import ConditionWrapper
+from edera.requisites import shortcut
+from edera.task import TaskWrapper
+from edera.workflow import WorkflowBuilder
+from edera.workflow.processors import TaskCompiler
+
+
+class C(Condition):
+
+    def check(self):
+        return True
+
+
+class T(Task):
+
+    def execute(self):
+        executions.append(self)
+
+    @property
+    def target(self):
+        return C()
+
+
+class P(Task):
+
+    @shortcut
+    def requisite(self):
+        return T()
+
+
+class CountingTaskWrapper(TaskWrapper):
+
+    @property
+    def execute(self):
+        accesses.append("execute")
+        return super(CountingTaskWrapper, self).execute
+
+    @property
+    def name(self):
+        accesses.append("name")
+        return super(CountingTaskWrapper, self).name
+
+    @property
+    def target(self):
+        accesses.append("target")
+        base = super(CountingTaskWrapper, self).target
+        if base is not None:
+            return ConditionWrapper(base)
+
+
+executions = []
+accesses = []
+
+
+def test_task_compiler_collapses_wrapper_chains():
+    workflow = WorkflowBuilder().build(P())
+    for task in workflow:
+        for _ in range(5):
+            task = CountingTaskWrapper(task)
+        workflow.replace(task)
+    TaskCompiler().process(workflow)
+    del accesses[:]
+    for _ in range(10):
+        for task in workflow:
+            assert task.name in ("P", "T")
+            assert task.phony == (task.name == "P")
+            assert (task.target is None) == (task.name == "P")
+    assert not accesses
+    workflow[T()].item.execute()
+    workflow[T()].item.execute()
+    assert executions == [T(), T()]
+    assert not accesses
+    assert workflow[T()].item.target is workflow[T()].item.target
+    assert workflow[T()].item.target == C()
@@ -1,3 +1,4 @@
+from edera import FrozenGraph
 from edera import Task
 from edera.requisites import shortcut
 from edera.workflow import WorkflowBuilder
@@ -22,3 +23,23 @@ def test_task_ranker_assigns_correct_ranks():
     workflow = WorkflowBuilder().build(T(10))
     TaskRanker().process(workflow)
     assert all(workflow[T(i)]["rank"] == 10 - i for i in range(11))
+
+
+def test_task_ranker_annotates_original_workflow_through_frozen_graph():
+
+    class T(Task):
+
+        def __init__(self, index):
+            self.index = index
+
+        @property
+        def name(self):
+            return "T%d" % self.index
+
+        @shortcut
+        def requisite(self):
+            return {T(i): self for i in range(self.index)}
+
+    workflow = WorkflowBuilder().build(T(10))
+    TaskRanker().process(FrozenGraph(workflow))
+    assert all(workflow[T(i)]["rank"] == 10 - i for i in range(11))
@@ -6,6 +6,7 @@ from edera.exceptions import WorkflowNormalizationError
 from edera.requisites import shortcut
 from edera.workflow import WorkflowBuilder
 from edera.workflow.processors import WorkflowNormalizer
+from edera.workflow.processors import workflow_normalizer
 
 
 class T(Task):
@@ -195,3 +196,31 @@ def test_workflow_normalizer_can_handle_circular_dependencies():
     assert not WorkflowNormalizer.check(workflow)
     with pytest.raises(WorkflowNormalizationError):
         WorkflowNormalizer().process(workflow)
+
+
+def test_workflow_normalizer_reuses_corrections_for_same_targets(mocker):
+
+    class A(T):
+        pass
+
+    class B(T):
+
+        @shortcut
+        def requisite(self):
+            yield A()
+            yield {C(): self}
+
+    class C(T):
+
+        target = ~A().target
+
+    memory = {}
+    WorkflowNormalizer(memory=memory).process(WorkflowBuilder().build(B()))
+    solver = mocker.spy(workflow_normalizer, "_check_targets")
+    workflow = WorkflowBuilder().build(B())
+    WorkflowNormalizer(memory=memory).process(workflow)
+    assert not solver.called
+    assert workflow[A()].item.target.expression == A().target.symbol | B().target.symbol
+    assert workflow[C()].item.target.expression == C().target.symbol & B().target.symbol
+    WorkflowNormalizer(memory=memory).process(WorkflowBuilder().build(A()))
+    assert solver.called
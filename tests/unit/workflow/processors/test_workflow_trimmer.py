@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from edera import Condition
@@ -35,8 +37,10 @@ class Broken(Condition):
         raise RuntimeError("oops")
 
 
+@pytest.mark.parametrize("indexing_limit", [0, 10000])
+@pytest.mark.parametrize("concurrency", [1, 4])
 @pytest.mark.parametrize("n", [1, 2, 3, 5, 10, 19])
-def test_workflow_trimmer_trims_linear_workflow_well(n):
+def test_workflow_trimmer_trims_linear_workflow_well(n, concurrency, indexing_limit, monkeypatch):
 
     class T(Parameterizable, Task):
 
@@ -55,15 +59,17 @@ def test_workflow_trimmer_trims_linear_workflow_well(n):
                 return Unknown() if self.i % 2 == 0 else Broken()
             return AlreadyComplete() if self.i < self.s else StillIncomplete()
 
+    monkeypatch.setattr(WorkflowTrimmer, "INDEXING_LIMIT", indexing_limit)
     for s in range(n):
         workflow = WorkflowBuilder().build(T(i=(n - 1), s=s))
-        WorkflowTrimmer().process(workflow)
+        WorkflowTrimmer(concurrency).process(workflow)
         assert all(T(i=i, s=s) in workflow for i in range(s, n))
         assert len(workflow) <= n - s + 3
 
 
+@pytest.mark.parametrize("concurrency", [1, 4])
 @pytest.mark.parametrize("n", [1, 2, 3, 5, 10])
-def test_workflow_trimmer_trims_nn_workflow_well(n):
+def test_workflow_trimmer_trims_nn_workflow_well(n, concurrency):
 
     class T(Parameterizable, Task):
 
@@ -91,6 +97,151 @@ def test_workflow_trimmer_trims_nn_workflow_well(n):
 
     for s in range(n):
         workflow = WorkflowBuilder().build(W(s=s))
-        WorkflowTrimmer().process(workflow)
+        WorkflowTrimmer(concurrency).process(workflow)
         assert all(T(i=i, j=j, s=s) in workflow for i in range(s, n) for j in range(n))
         assert len(workflow) <= (n - s + 1) * n + 1
+
+
+def test_workflow_trimmer_checks_independent_targets_simultaneously():
+    arrivals = [threading.Event() for _ in range(3)]
+
+    class Gate(Condition):
+
+        def __init__(self, j):
+            self.j = j
+
+        def check(self):
+            arrivals[self.j].set()
+            return all(arrival.wait(5) for arrival in arrivals)
+
+        @property
+        def name(self):
+            return "Gate(%d)" % self.j
+
+    class T(Parameterizable, Task):
+
+        i = Parameter(Integer)
+        j = Parameter(Integer)
+
+        @shortcut
+        def requisite(self):
+            if self.i == 0:
+                return
+            return T(i=(self.i - 1), j=self.j)
+
+        @property
+        def target(self):
+            return Gate(self.j) if self.i == 2 else StillIncomplete()
+
+    class W(Task):
+
+        @shortcut
+        def requisite(self):
+            return (T(i=4, j=j) for j in range(3))
+
+    workflow = WorkflowBuilder().build(W())
+    WorkflowTrimmer(3).process(workflow)
+    assert all(T(i=i, j=j) not in workflow for i in range(3) for j in range(3))
+    assert all(T(i=i, j=j) in workflow for i in range(3, 5) for j in range(3))
+
+
+def test_workflow_trimmer_remembers_complete_tasks():
+    checks = []
+
+    class Counted(Condition):
+
+        def __init__(self, i, complete):
+            self.i = i
+            self.complete = complete
+
+        def check(self):
+            checks.append(self.i)
+            return self.complete
+
+        @property
+        def name(self):
+            return "Counted(%d)" % self.i
+
+    class T(Parameterizable, Task):
+
+        i = Parameter(Integer)
+        n = Parameter(Integer)
+
+        @shortcut
+        def requisite(self):
+            if self.i == 0:
+                return
+            return T(i=(self.i - 1), n=self.n)
+
+        @property
+        def target(self):
+            return Counted(self.i, self.i < 8)
+
+    memory = set()
+    workflow = WorkflowBuilder().build(T(i=9, n=10))
+    WorkflowTrimmer(memory=memory).process(workflow)
+    survivors = set(workflow)
+    assert {T(i=8, n=10), T(i=9, n=10)} <= survivors
+    assert memory
+    del checks[:]
+    workflow = WorkflowBuilder().build(T(i=9, n=10))
+    WorkflowTrimmer(memory=memory).process(workflow)
+    assert set(workflow) <= survivors
+    assert all(T(i=i, n=10) in survivors for i in checks)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_workflow_trimmer_checks_targets_in_bulk_if_possible(concurrency):
+
+    class Row(Parameterizable, Condition):
+
+        i = Parameter(Integer)
+
+        def check(self):
+            checks.append(self.i)
+            return self.i < 5
+
+        @classmethod
+        def check_many(cls, conditions):
+            queries.append([condition.i for condition in conditions])
+            return [condition.i < 5 for condition in conditions]
+
+    class S(Parameterizable, Task):
+
+        i = Parameter(Integer)
+
+    class T(Parameterizable, Task):
+
+        i = Parameter(Integer)
+
+        @shortcut
+        def requisite(self):
+            return S(i=self.i)
+
+        @property
+        def target(self):
+            return Row(i=self.i)
+
+    class U(Parameterizable, Task):
+
+        i = Parameter(Integer)
+
+        @shortcut
+        def requisite(self):
+            return T(i=self.i)
+
+    class X(Task):
+
+        @shortcut
+        def requisite(self):
+            return [U(i=i) for i in range(10)]
+
+    checks = []
+    queries = []
+    workflow = WorkflowBuilder().build(X())
+    WorkflowTrimmer(concurrency=concurrency).process(workflow)
+    assert not checks
+    assert len(queries) == 1
+    assert sorted(queries[0]) == list(range(10))
+    survivors = {T(i=i) for i in range(5, 10)} | {S(i=i) for i in range(5, 10)}
+    assert set(workflow) == {X()} | {U(i=i) for i in range(10)} | survivors
@@ -1,6 +1,7 @@
 from edera import Task
 from edera.requisites import Annotate
 from edera.requisites import ExtendAnnotation
+from edera.requisites import Include
 from edera.requisites import shortcut
 from edera.workflow import WorkflowBuilder
 
@@ -67,3 +68,29 @@ def test_builder_builds_workflow_correctly():
     assert workflow[Z()].item == Z()
     assert workflow[Z()].children == {E()}
     assert workflow[Z()].parents == {B(), D()}
+
+
+def test_builder_replays_remembered_requisites(mocker):
+    builder = WorkflowBuilder(cache_capacity=10)
+    expected_workflow = builder.build(A())
+    assert builder.hits == 0
+    assert builder.misses == 6
+    expand = mocker.spy(Include, "expand")
+    for _ in range(3):
+        workflow = builder.build(A())
+        assert set(workflow) == set(expected_workflow)
+        for task in expected_workflow:
+            assert workflow[task].parents == expected_workflow[task].parents
+            assert workflow[task].children == expected_workflow[task].children
+            assert workflow[task].annotation == expected_workflow[task].annotation
+    assert builder.hits == 18
+    assert builder.misses == 6
+    assert expand.call_count == 0
+
+
+def test_builder_forgets_least_recently_used_requisites():
+    builder = WorkflowBuilder(cache_capacity=2)
+    for task in [E(), Z(), E(), D(), Z(), D()]:
+        builder.build(task)
+    assert builder.hits == 2
+    assert builder.misses == 4